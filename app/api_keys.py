@@ -6,12 +6,16 @@ Supports parallel recordings with capacity tracking.
 
 from datetime import datetime, timedelta
 from typing import Optional
+import os
 import logging
+import threading
 
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from google import genai
+from google.genai import errors as genai_errors
+from google.genai import types
 
 from .database import APIKey
 
@@ -25,6 +29,10 @@ class APIKeyManager:
     MAX_REQUESTS_PER_MINUTE = 5
     KEY_LOCK_SECONDS = 15  # Lock duration to prevent race conditions
     
+    # Short transcripts get an equally good breakdown from the cheaper, faster lite model
+    BREAKDOWN_LITE_MODEL = os.environ.get("BREAKDOWN_LITE_MODEL", "gemini-2.0-flash-lite")
+    BREAKDOWN_LITE_MAX_CHARS = int(os.environ.get("BREAKDOWN_LITE_MAX_CHARS", "8000"))
+    
     QUOTA_ERROR_MESSAGES = [
         "quota",
         "rate limit",
@@ -33,6 +41,31 @@ class APIKeyManager:
         "too many requests"
     ]
     
+    # genai.Client per API key string, shared by every manager instance in the
+    # process so recordings reuse warm HTTP connection pools
+    _clients: dict[str, genai.Client] = {}
+    _clients_lock = threading.Lock()
+    
+    # Gemini context cache for static prompt prefixes
+    PROMPT_CACHE_TTL_SECONDS = 3600
+    PROMPT_CACHE_REFRESH_SECONDS = 300  # Extend TTL when less than this remains
+    # Client errors meaning the model/prompt can never be cached (400: e.g. prompt
+    # below the minimum size, 404: model without caching). Anything else - network,
+    # 5xx, quota, a key's auth - is retried on the next call.
+    PROMPT_CACHE_UNCACHEABLE_CODES = (400, 404)
+    
+    # Cached-content names keyed by (key_id, model_name, cache_id) -> (name, expires_at).
+    # Caches live in the key's Google project, so each key needs its own.
+    _prompt_caches: dict[tuple[int, str, str], tuple[str, datetime]] = {}
+    # (model_name, cache_id) pairs the API refused to cache (e.g. prompt below minimum size)
+    _uncacheable_prompts: set[tuple[str, str]] = set()
+    _prompt_caches_lock = threading.Lock()
+    
+    # Per-key conditions shared across manager instances (one per worker thread),
+    # notified on successful use so threads backing off on a key can resume early
+    _success_conditions: dict[int, threading.Condition] = {}
+    _success_conditions_lock = threading.Lock()
+    
     def __init__(self, db: Session):
         self.db = db
         self._current_key: Optional[APIKey] = None
@@ -198,6 +231,82 @@ class APIKeyManager:
         
         self.db.commit()
         logger.debug(f"📊 Key '{api_key.name}' used: {api_key.requests_this_minute}/{self.MAX_REQUESTS_PER_MINUTE} this minute")
+        
+        if success:
+            condition = self._get_success_condition(api_key.id)
+            with condition:
+                condition.notify_all()
+    
+    @classmethod
+    def _get_success_condition(cls, key_id: int) -> threading.Condition:
+        """Get (or create) the condition signalled when a key is used successfully."""
+        with cls._success_conditions_lock:
+            condition = cls._success_conditions.get(key_id)
+            if condition is None:
+                condition = cls._success_conditions[key_id] = threading.Condition()
+            return condition
+    
+    def wait_for_key_success(self, api_key: APIKey, timeout: float) -> bool:
+        """Block up to `timeout` seconds, waking early if another worker succeeds with this key.
+        
+        Returns True if woken by a successful use, False if the timeout elapsed.
+        """
+        condition = self._get_success_condition(api_key.id)
+        with condition:
+            return condition.wait(timeout)
+    
+    def get_prompt_cache(self, client: genai.Client, api_key: APIKey, model_name: str,
+                         cache_id: str, prompt: str) -> Optional[str]:
+        """Get a Gemini cached-content name holding `prompt`, creating it if needed.
+        
+        Cached prefixes are billed at a steep discount and cut time-to-first-token.
+        Returns None when caching isn't available for this model/prompt, in which
+        case the caller should send the prompt inline as before.
+        """
+        if (model_name, cache_id) in self._uncacheable_prompts:
+            return None
+        
+        cache_key = (api_key.id, model_name, cache_id)
+        now = datetime.utcnow()
+        ttl = f"{self.PROMPT_CACHE_TTL_SECONDS}s"
+        
+        with self._prompt_caches_lock:
+            cached = self._prompt_caches.get(cache_key)
+        
+        if cached:
+            name, expires_at = cached
+            if expires_at - now > timedelta(seconds=self.PROMPT_CACHE_REFRESH_SECONDS):
+                return name
+            try:
+                client.caches.update(name=name, config=types.UpdateCachedContentConfig(ttl=ttl))
+                with self._prompt_caches_lock:
+                    self._prompt_caches[cache_key] = (name, now + timedelta(seconds=self.PROMPT_CACHE_TTL_SECONDS))
+                return name
+            except Exception as e:
+                logger.debug(f"Prompt cache '{name}' could not be refreshed, recreating: {e}")
+        
+        try:
+            cache = client.caches.create(
+                model=model_name,
+                config=types.CreateCachedContentConfig(
+                    contents=[prompt],
+                    display_name=f"voice-to-notes-{cache_id}",
+                    ttl=ttl,
+                ),
+            )
+        except Exception as e:
+            if not self.is_uncacheable_error(e):
+                logger.debug(f"Prompt cache for {model_name}/{cache_id} not created, sending inline: {e}")
+                return None  # Transient - try again next call
+            logger.info(f"ℹ️  Prompt caching unavailable for {model_name}/{cache_id}, sending inline: {e}")
+            with self._prompt_caches_lock:
+                self._uncacheable_prompts.add((model_name, cache_id))
+            return None
+        
+        with self._prompt_caches_lock:
+            self._prompt_caches[cache_key] = (cache.name, now + timedelta(seconds=self.PROMPT_CACHE_TTL_SECONDS))
+        logger.info(f"🗄️  Created prompt cache for {cache_id} on key '{api_key.name}' ({model_name})")
+        return cache.name
     
     def reset_key(self, key_id: int) -> bool:
         """Reset an exhausted key (e.g., after quota resets)."""
@@ -237,6 +346,13 @@ class APIKeyManager:
             return True
         return False
     
+    def is_uncacheable_error(self, error: Exception) -> bool:
+        """Check if a caches.create error means the prompt can never be cached."""
+        return (
+            isinstance(error, genai_errors.ClientError)
+            and error.code in self.PROMPT_CACHE_UNCACHEABLE_CODES
+        )
+    
     def is_quota_error(self, error: Exception) -> bool:
         """Check if an error is a quota/rate limit error."""
         error_str = str(error).lower()
@@ -275,14 +391,33 @@ class APIKeyManager:
             if not api_key or not self.acquire_key_lock(api_key):
                 raise Exception("All API keys are busy. Please wait a moment.")
         
-        # Configure Gemini - create a new Client per key
-        self._client = genai.Client(api_key=api_key.key)
+        # Configure Gemini - reuse the process-wide Client for this key
+        self._client = self._get_client(api_key.key)
         self._current_key = api_key
         self._model_name = model_name
         
         logger.info(f"✅ Configured Gemini with key '{api_key.name}' for model {model_name}")
         return self._client, model_name, api_key
     
+    def get_model_for_breakdown(self, transcript_len: int, model_name: str = "gemini-3-flash-preview"):
+        """Get a Gemini model for the breakdown step, sized to the transcript.
+        
+        Transcripts shorter than BREAKDOWN_LITE_MAX_CHARS use BREAKDOWN_LITE_MODEL;
+        longer ones use `model_name`. Set BREAKDOWN_LITE_MAX_CHARS=0 to disable.
+        """
+        if transcript_len < self.BREAKDOWN_LITE_MAX_CHARS:
+            model_name = self.BREAKDOWN_LITE_MODEL
+        return self.get_model(model_name)
+    
+    @classmethod
+    def _get_client(cls, key: str) -> genai.Client:
+        """Get the shared genai.Client for an API key, creating it on first use."""
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = cls._clients[key] = genai.Client(api_key=key)
+            return client
+    
     def handle_error(self, error: Exception, api_key: APIKey) -> bool:
         """
         Handle an API error. Returns True if we should retry with a new key.
@@ -5,7 +5,7 @@ Supports SQLite (default) or PostgreSQL.
 
 import os
 from datetime import datetime
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Float, event
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, Float, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -87,6 +87,48 @@ class Recording(Base):
     notes = Column(Text)
 
 
+class RecordingTag(Base):
+    """Normalized index of Recording.tags (one row per recording/tag) for tag lookups."""
+    __tablename__ = "recording_tags"
+
+    recording_id = Column(Integer, primary_key=True)
+    name = Column(String(500), primary_key=True, index=True)
+
+
+def split_tags(tags: str | None) -> list[str]:
+    """Split a comma-joined tags string into unique, non-empty tag names."""
+    if not tags:
+        return []
+    return list(dict.fromkeys(t.strip() for t in tags.split(",") if t.strip()))
+
+
+def _write_recording_tags(connection, recording_id: int, tags: str | None):
+    """Replace a recording's rows in recording_tags."""
+    table = RecordingTag.__table__
+    connection.execute(table.delete().where(table.c.recording_id == recording_id))
+    names = split_tags(tags)
+    if names:
+        connection.execute(table.insert(), [{"recording_id": recording_id, "name": n} for n in names])
+
+
+# Keep recording_tags in sync with every ORM write to Recording.tags
+@event.listens_for(Recording, "after_insert")
+def _recording_tags_inserted(mapper, connection, target):
+    if target.tags:
+        _write_recording_tags(connection, target.id, target.tags)
+
+
+@event.listens_for(Recording, "after_update")
+def _recording_tags_updated(mapper, connection, target):
+    if inspect(target).attrs.tags.history.has_changes():
+        _write_recording_tags(connection, target.id, target.tags)
+
+
+@event.listens_for(Recording, "after_delete")
+def _recording_tags_deleted(mapper, connection, target):
+    _write_recording_tags(connection, target.id, None)
+
+
 class APIKey(Base):
     """Stores Gemini API keys for rotation."""
     __tablename__ = "api_keys"
@@ -138,6 +180,28 @@ def init_db():
         os.makedirs("data", exist_ok=True)
     
     Base.metadata.create_all(bind=engine)
+    _backfill_recording_tags()
+
+
+def _backfill_recording_tags():
+    """Populate recording_tags from Recording.tags for databases created before it existed."""
+    db = SessionLocal()
+    try:
+        if db.query(RecordingTag).first() is not None:
+            return
+        rows = db.query(Recording.id, Recording.tags).filter(
+            Recording.tags.isnot(None), Recording.tags != ""
+        ).all()
+        entries = [
+            {"recording_id": recording_id, "name": name}
+            for recording_id, tags in rows
+            for name in split_tags(tags)
+        ]
+        if entries:
+            db.execute(RecordingTag.__table__.insert(), entries)
+            db.commit()
+    finally:
+        db.close()
 
 
 def get_db():
@@ -173,6 +237,40 @@ def set_setting(db, key: str, value: str):
     db.commit()
 
 
+def set_settings_many(db, values: dict[str, str]):
+    """Create or update several settings in a single transaction."""
+    if not values:
+        return
+    now = datetime.utcnow()
+    existing = {
+        row.key: row
+        for row in db.query(Settings).filter(Settings.key.in_(list(values))).all()
+    }
+    for key, value in values.items():
+        row = existing.get(key)
+        if row:
+            row.value = value
+            row.updated_at = now
+        else:
+            db.add(Settings(key=key, value=value))
+    db.commit()
+
+
+def get_settings_many(db, keys, defaults: dict | None = None) -> dict[str, str]:
+    """Get several settings in one query.
+    
+    Same semantics as get_setting per key: missing or empty values fall back
+    to defaults[key] (or "" when no default is given).
+    """
+    defaults = defaults or {}
+    out = {key: defaults.get(key, "") for key in keys}
+    rows = db.query(Settings.key, Settings.value).filter(Settings.key.in_(list(keys))).all()
+    for key, value in rows:
+        if value is not None and value != "":
+            out[key] = value
+    return out
+
+
 def get_all_settings(db) -> dict[str, str]:
     """Get all settings as a dict."""
     rows = db.query(Settings).all()
@@ -6,8 +6,9 @@ import os
 import shutil
 import asyncio
 import logging
+import tempfile
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from contextlib import asynccontextmanager
 
@@ -17,10 +18,10 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
-from .database import init_db, get_db, Recording, APIKey, Settings, get_setting, set_setting, get_all_settings
+from .database import init_db, get_db, Recording, APIKey, Settings, get_setting, set_settings_many, get_all_settings
 from .api_keys import APIKeyManager
 from .processor import AudioProcessor, SUPPORTED_FORMATS
-from .v2_routes import router as v2_router
+from .v2_routes import router as v2_router, _get_registry_conn
 
 # Import shared modules for model configs
 try:
@@ -433,7 +434,6 @@ async def download_file(recording_id: int, file_type: str, db: Session = Depends
         raise HTTPException(status_code=404, detail="Content not available")
     
     # Create temp file for download
-    import tempfile
     temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False)
     temp_file.write(content)
     temp_file.close()
@@ -509,8 +509,6 @@ async def reprocess_recording(
 @app.get("/storage", response_class=HTMLResponse)
 async def storage_management(request: Request, db: Session = Depends(get_db)):
     """Storage management page showing all files and disk usage."""
-    from pathlib import Path
-    import os
     
     # Get all recordings
     recordings = db.query(Recording).order_by(Recording.created_at.desc()).all()
@@ -685,8 +683,7 @@ async def settings_page(request: Request, db: Session = Depends(get_db)):
     registry_path = Path(os.environ.get("REGISTRY_DB_PATH", "./data/engine/registry.db"))
     if registry_path.exists():
         try:
-            import sqlite3
-            conn = sqlite3.connect(str(registry_path))
+            conn = _get_registry_conn()
             cursor = conn.execute(
                 "SELECT COUNT(*), "
                 "SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), "
@@ -695,7 +692,6 @@ async def settings_page(request: Request, db: Session = Depends(get_db)):
                 "FROM processed_files"
             )
             row = cursor.fetchone()
-            conn.close()
             watcher_stats = {
                 "total": row[0] or 0,
                 "success": row[1] or 0,
@@ -725,12 +721,13 @@ async def settings_page(request: Request, db: Session = Depends(get_db)):
 async def save_settings(request: Request, db: Session = Depends(get_db)):
     """Save engine settings to the database."""
     form = await request.form()
-    saved = []
+    updates = {}
     for key in SETTINGS_KEYS:
         value = form.get(key, "").strip()
         if value or key in ("LOCAL_SYNC_AUDIO_DIR", "OBSIDIAN_VAULT_DIR"):
-            set_setting(db, key, value)
-            saved.append(key)
+            updates[key] = value
+    set_settings_many(db, updates)
+    saved = list(updates)
 
     return {"success": True, "saved": saved}
 
@@ -782,13 +779,11 @@ def _get_registry_path() -> Path:
 
 def _read_registry(limit: int = 50) -> list[dict]:
     """Read recent entries from the engine registry."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return []
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
+        conn = _get_registry_conn()
         rows = conn.execute(
             """
             SELECT filename, mode, title, note_path, duration_seconds,
@@ -799,7 +794,6 @@ def _read_registry(limit: int = 50) -> list[dict]:
             """,
             (limit,),
         ).fetchall()
-        conn.close()
         return [dict(row) for row in rows]
     except Exception as e:
         logger.error(f"Failed to read registry: {e}")
@@ -808,12 +802,11 @@ def _read_registry(limit: int = 50) -> list[dict]:
 
 def _get_registry_stats() -> dict:
     """Get processing statistics from the registry."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return {"total": 0, "success": 0, "failed": 0, "last_processed": None}
     try:
-        conn = sqlite3.connect(str(registry_path))
+        conn = _get_registry_conn()
         cursor = conn.execute(
             "SELECT COUNT(*), "
             "SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), "
@@ -822,7 +815,6 @@ def _get_registry_stats() -> dict:
             "FROM processed_files"
         )
         row = cursor.fetchone()
-        conn.close()
         return {
             "total": row[0] or 0,
             "success": row[1] or 0,
@@ -889,7 +881,6 @@ async def activity_api(limit: int = 20):
 
 def _get_system_status() -> dict:
     """Get the current watcher system status."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return {
@@ -902,10 +893,8 @@ def _get_system_status() -> dict:
             "updated_at": None,
         }
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
+        conn = _get_registry_conn()
         row = conn.execute("SELECT * FROM watcher_status WHERE id = 1").fetchone()
-        conn.close()
         if row:
             return dict(row)
         return {
@@ -924,8 +913,6 @@ def _get_system_status() -> dict:
 
 def _get_failed_files() -> list[dict]:
     """Get failed files with retry status."""
-    import sqlite3
-    from datetime import datetime, timedelta
     
     MAX_RETRIES = 5
     RETRY_BACKOFF_MINUTES = [1, 5, 15, 60, 240]
@@ -934,8 +921,7 @@ def _get_failed_files() -> list[dict]:
     if not registry_path.exists():
         return []
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
+        conn = _get_registry_conn()
         rows = conn.execute(
             """
             SELECT filename, file_hash, error, retry_count, last_retry_at, skipped
@@ -944,7 +930,6 @@ def _get_failed_files() -> list[dict]:
             ORDER BY last_retry_at DESC
             """
         ).fetchall()
-        conn.close()
         
         result = []
         for row in rows:
@@ -982,8 +967,7 @@ def _get_v2_stats() -> dict:
     if not registry_path.exists():
         return {"total": 0, "success": 0, "failed": 0}
     try:
-        import sqlite3
-        conn = sqlite3.connect(registry_path)
+        conn = _get_registry_conn()
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM processed_files")
         total = cursor.fetchone()[0]
@@ -991,7 +975,6 @@ def _get_v2_stats() -> dict:
         success = cursor.fetchone()[0]
         cursor.execute("SELECT COUNT(*) FROM processed_files WHERE success = 0")
         failed = cursor.fetchone()[0]
-        conn.close()
         return {"total": total, "success": success, "failed": failed}
     except Exception as e:
         logger.error(f"Failed to get V2 stats: {e}")
@@ -1010,15 +993,12 @@ async def get_system_status():
 @app.post("/api/skip-file/{file_hash}")
 async def skip_file(file_hash: str):
     """Skip a failed file (won't be retried)."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
+        conn = _get_registry_conn()
         conn.execute("UPDATE processed_files SET skipped = 1 WHERE file_hash = ?", (file_hash,))
-        conn.commit()
-        conn.close()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1027,18 +1007,15 @@ async def skip_file(file_hash: str):
 @app.post("/api/unskip-file/{file_hash}")
 async def unskip_file(file_hash: str):
     """Unskip a file (will be retried)."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
+        conn = _get_registry_conn()
         conn.execute(
             "UPDATE processed_files SET skipped = 0, retry_count = 0 WHERE file_hash = ?",
             (file_hash,)
         )
-        conn.commit()
-        conn.close()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1047,21 +1024,18 @@ async def unskip_file(file_hash: str):
 @app.post("/api/clear-failed")
 async def clear_failed():
     """Reset all failed files for retry (without deleting their history)."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
-        count = conn.execute("SELECT COUNT(*) FROM processed_files WHERE success = 0").fetchone()[0]
+        conn = _get_registry_conn()
         # Reset retry state instead of deleting — files will be retried on next scan
-        conn.execute("""
+        cursor = conn.execute("""
             UPDATE processed_files 
             SET retry_count = 0, last_retry_at = NULL, skipped = 0, error = NULL
             WHERE success = 0
         """)
-        conn.commit()
-        conn.close()
+        count = cursor.rowcount
         return {"success": True, "reset_count": count}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1070,18 +1044,15 @@ async def clear_failed():
 @app.post("/api/skip-all-failed")
 async def skip_all_failed():
     """Skip all failed files."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
+        conn = _get_registry_conn()
         cursor = conn.execute(
             "UPDATE processed_files SET skipped = 1 WHERE success = 0 AND skipped = 0"
         )
         count = cursor.rowcount
-        conn.commit()
-        conn.close()
         return {"success": True, "skipped_count": count}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -3,15 +3,21 @@ Core transcription and processing logic.
 """
 
 import os
+import json
+import errno
+import random
+import shutil
 import subprocess
 import tempfile
 import time
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
+import httpx
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 from sqlalchemy.orm import Session
 
@@ -259,12 +265,20 @@ Here is the transcript to analyze:
 
 Create the comprehensive breakdown:"""
 
+# Everything before the transcript is static and can live in a Gemini context cache
+BREAKDOWN_PROMPT_PREFIX = BREAKDOWN_PROMPT[:BREAKDOWN_PROMPT.index("{transcript}")]
+BREAKDOWN_PROMPT_SUFFIX = BREAKDOWN_PROMPT[len(BREAKDOWN_PROMPT_PREFIX):]
+
 
 # ============================================================================
 # AUDIO PROCESSING
 # ============================================================================
 
 AUDIO_BITRATE = "48k"
+TARGET_BITRATE_KBPS = 48
+ALREADY_COMPRESSED_CODECS = ('opus', 'aac')
+COMPRESSED_DIR = Path("data/compressed")
+COMPRESSED_DIR.mkdir(parents=True, exist_ok=True)
 SUPPORTED_FORMATS = {'.mp3', '.m4a', '.wav', '.ogg', '.flac', '.webm', '.aac', '.3gp', '.opus'}
 
 
@@ -322,7 +336,6 @@ def get_audio_metadata(file_path: Path) -> dict:
             check=True
         )
         
-        import json
         data = json.loads(result.stdout)
         
         # Extract format info
@@ -360,9 +373,44 @@ def get_audio_metadata(file_path: Path) -> dict:
         return metadata
 
 
-def compress_audio(input_path: Path) -> Tuple[Path, float, float]:
+def is_already_compressed(metadata: dict) -> bool:
+    """Check if audio is already in a compact codec at or below our target bitrate.
+    
+    Re-encoding such files costs a full ffmpeg pass and only loses quality.
+    """
+    return (
+        metadata.get('codec') in ALREADY_COMPRESSED_CODECS
+        and bool(metadata.get('bit_rate'))
+        and metadata['bit_rate'] <= TARGET_BITRATE_KBPS
+    )
+
+
+def _run_ffmpeg_with_progress(cmd: list, duration: float, on_progress: Callable[[float], None]):
+    """Run ffmpeg, reporting completion (0.0-1.0) parsed from its -progress output.
+    
+    Progress is read on the calling thread, so the callback may safely touch
+    the caller's DB session.
+    """
+    cmd = [cmd[0], "-progress", "pipe:1", "-nostats"] + cmd[1:]
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        for line in proc.stdout:
+            key, _, value = line.partition("=")
+            value = value.strip()
+            if key == "out_time_us" and value.isdigit():
+                on_progress(min(int(value) / (duration * 1_000_000), 1.0))
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def compress_audio(
+    input_path: Path,
+    duration: Optional[float] = None,
+    on_progress: Optional[Callable[[float], None]] = None
+) -> Tuple[Path, float, float]:
     """
     Compress audio to opus format for optimal size/quality.
+    If duration and on_progress are given, on_progress is called with the
+    completed fraction as ffmpeg works through the file.
     Returns (output_path, original_size_mb, compressed_size_mb)
     """
     original_size = input_path.stat().st_size / (1024 * 1024)
@@ -372,20 +420,21 @@ def compress_audio(input_path: Path) -> Tuple[Path, float, float]:
     output_path = Path(temp_file.name)
     temp_file.close()
     
+    cmd = [
+        "ffmpeg", "-y", "-i", str(input_path),
+        "-vn",  # No video
+        "-c:a", "libopus",
+        "-b:a", AUDIO_BITRATE,
+        "-ar", "16000",  # 16kHz is enough for speech
+        "-ac", "1",  # Mono
+        str(output_path)
+    ]
+    
     try:
-        subprocess.run(
-            [
-                "ffmpeg", "-y", "-i", str(input_path),
-                "-vn",  # No video
-                "-c:a", "libopus",
-                "-b:a", AUDIO_BITRATE,
-                "-ar", "16000",  # 16kHz is enough for speech
-                "-ac", "1",  # Mono
-                str(output_path)
-            ],
-            capture_output=True,
-            check=True
-        )
+        if duration and on_progress:
+            _run_ffmpeg_with_progress(cmd, duration, on_progress)
+        else:
+            subprocess.run(cmd, capture_output=True, check=True)
         
         compressed_size = output_path.stat().st_size / (1024 * 1024)
         compression_ratio = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
@@ -399,10 +448,103 @@ def compress_audio(input_path: Path) -> Tuple[Path, float, float]:
         return input_path, original_size, original_size
 
 
+def move_file(src: Path, dst: Path):
+    """Move a file, using a metadata-only rename when src and dst share a filesystem."""
+    try:
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def link_or_copy(src: Path, dst: Path):
+    """Hardlink src to dst so the bytes aren't duplicated; copy if linking isn't possible."""
+    try:
+        dst.unlink(missing_ok=True)
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(str(src), str(dst))
+
+
 # ============================================================================
 # TRANSCRIPTION
 # ============================================================================
 
+# Error-message markers (lowercase) for failures that retrying cannot fix.
+# Keep this list explicit: anything not matched here is retried, so adding a
+# marker changes retry policy for every recording.
+#   - "safety filters":           prompt blocked, or finish_reason=SAFETY
+#   - "recitation":               finish_reason=RECITATION
+#   - "invalid response":         malformed response / missing text attribute
+#   - "exceeded maximum length":  MAX_TOKENS with no usable partial output
+NON_RETRYABLE_ERRORS = (
+    "safety filters",
+    "recitation",
+    "invalid response",
+    "exceeded maximum length",
+)
+
+
+# Enum values meaning "nothing went wrong" (None when the SDK omits the field)
+_UNBLOCKED_REASONS = (None, types.BlockedReason.BLOCKED_REASON_UNSPECIFIED)
+_NORMAL_FINISH_REASONS = (None, types.FinishReason.STOP, types.FinishReason.FINISH_REASON_UNSPECIFIED)
+
+
+def is_non_retryable_error(error: Exception) -> bool:
+    """Check if an error is a permanent failure that should not be retried."""
+    error_str = str(error).lower()
+    return any(marker in error_str for marker in NON_RETRYABLE_ERRORS)
+
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Check if an error is a Gemini rate limit / quota error (HTTP 429 RESOURCE_EXHAUSTED)."""
+    return isinstance(error, genai_errors.APIError) and error.code == 429
+
+
+def is_network_error(error: Exception) -> bool:
+    """Check if an error is a transient transport or server-side failure worth backing off on."""
+    # ConnectionError covers BrokenPipeError/ConnectionResetError; httpx.TransportError
+    # covers connect/read timeouts and dropped connections from the SDK's HTTP client
+    return isinstance(error, (genai_errors.ServerError, ConnectionError, TimeoutError, httpx.TransportError))
+
+
+FILE_ACTIVE_POLL_SECONDS = 0.5
+FILE_ACTIVE_TIMEOUT_SECONDS = 300
+
+
+def upload_audio(client: genai.Client, audio_path: Path):
+    """Upload audio to Gemini, returning as soon as the upload finishes.
+    
+    The file is still being processed server-side at this point; call
+    wait_for_file_active() before using it in a generate_content request.
+    """
+    logger.debug(f"📤 Uploading audio to Gemini...")
+    audio_file = client.files.upload(file=str(audio_path))
+    logger.debug(f"✅ Audio uploaded successfully | File ID: {audio_file.name}")
+    return audio_file
+
+
+def wait_for_file_active(client: genai.Client, audio_file):
+    """Poll an uploaded file until Gemini reports it ACTIVE.
+    
+    Waiting here instead of inside generate_content means a file that is still
+    processing doesn't fail the request (and trigger a full re-upload retry),
+    and a file that failed processing is reported immediately.
+    """
+    deadline = time.monotonic() + FILE_ACTIVE_TIMEOUT_SECONDS
+    while audio_file.state == types.FileState.PROCESSING:
+        if time.monotonic() > deadline:
+            raise Exception(f"Timed out waiting for uploaded audio to become active: {audio_file.name}")
+        time.sleep(FILE_ACTIVE_POLL_SECONDS)
+        audio_file = client.files.get(name=audio_file.name)
+    
+    if audio_file.state == types.FileState.FAILED:
+        raise Exception(f"Gemini failed to process uploaded audio: {audio_file.error}")
+    return audio_file
+
+
 def transcribe_audio(
     client: genai.Client,
     model_name: str,
@@ -413,22 +555,29 @@ def transcribe_audio(
     """Transcribe audio using Gemini."""
     logger.info(f"🎙️  Transcribing audio | File: {audio_path.name} | Size: {audio_path.stat().st_size / (1024*1024):.2f} MB")
     
-    # Upload the audio file
-    logger.debug(f"📤 Uploading audio to Gemini...")
-    audio_file = client.files.upload(file=str(audio_path))
-    logger.debug(f"✅ Audio uploaded successfully | File ID: {audio_file.name if hasattr(audio_file, 'name') else 'unknown'}")
+    audio_file = upload_audio(client, audio_path)
     
     try:
+        # Look up the cached prompt prefix while Gemini processes the upload
+        cached_content = None
+        if api_key_manager and current_key:
+            cached_content = api_key_manager.get_prompt_cache(
+                client, current_key, model_name, "transcription", TRANSCRIPTION_PROMPT
+            )
+        audio_file = wait_for_file_active(client, audio_file)
+        contents = [audio_file] if cached_content else [TRANSCRIPTION_PROMPT, audio_file]
+        
         # Generate transcription
         response = client.models.generate_content(
             model=model_name,
-            contents=[TRANSCRIPTION_PROMPT, audio_file],
+            contents=contents,
             config=types.GenerateContentConfig(
                 temperature=1.0,  # Google STRONGLY recommends 1.0 - anything lower causes looping!
                 top_p=0.95,  # Nucleus sampling for diversity
                 top_k=40,  # Top-k sampling for variety
                 max_output_tokens=65536,  # High limit for long recordings
                 candidate_count=1,
+                cached_content=cached_content,
             ),
         )
         
@@ -437,38 +586,39 @@ def transcribe_audio(
             raise Exception("Empty response from Gemini API")
         
         # Check if content was blocked
-        if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
-            block_reason = getattr(response.prompt_feedback, 'block_reason', None)
-            if block_reason and str(block_reason) not in ("BLOCK_REASON_UNSPECIFIED", "0", "None"):
-                raise Exception(f"Content blocked by safety filters: {block_reason}")
+        if response.prompt_feedback and response.prompt_feedback.block_reason not in _UNBLOCKED_REASONS:
+            raise Exception(f"Content blocked by safety filters: {response.prompt_feedback.block_reason}")
         
         # Check if we have candidates
-        if not hasattr(response, 'candidates') or not response.candidates:
+        if not response.candidates:
             raise Exception("No response candidates from Gemini API")
         
         # Check finish reason
-        candidate = response.candidates[0]
-        finish_reason = getattr(candidate, 'finish_reason', None)
-        finish_str = str(finish_reason) if finish_reason else ""
-        if "MAX_TOKENS" in finish_str:
+        finish_reason = response.candidates[0].finish_reason
+        if finish_reason == types.FinishReason.MAX_TOKENS:
             logger.warning("⚠️  Transcription hit max token limit")
-            text = response.text if hasattr(response, 'text') else ""
+            text = response.text
             if text and text.strip():
                 logger.warning(f"⚠️  Warning: Transcription exceeded max tokens")
                 return text + "\n\n---\n\n**[Note: Transcription was cut off due to length limit. For complete transcription of 2+ hour audio, please split into shorter segments or use a paid tier with higher limits.]**"
             raise Exception("Transcription exceeded maximum length. For 2+ hour audio, please split into shorter segments.")
-        elif finish_reason and finish_str not in ("STOP", "FinishReason.STOP", "UNSPECIFIED", "FinishReason.UNSPECIFIED", "0", "1"):
+        elif finish_reason == types.FinishReason.SAFETY:
+            raise Exception(f"Content blocked by safety filters: finish_reason={finish_reason}")
+        elif finish_reason == types.FinishReason.RECITATION:
+            raise Exception(f"Generation blocked for recitation: finish_reason={finish_reason}")
+        elif finish_reason not in _NORMAL_FINISH_REASONS:
             logger.error(f"❌ Generation stopped abnormally: finish_reason={finish_reason}")
             raise Exception(f"Generation stopped abnormally: finish_reason={finish_reason}")
         
-        # Try to get text
-        if not response.text or not response.text.strip():
+        # Read the text once - .text re-joins every part on each access
+        text = response.text or ""
+        if not text.strip():
             raise Exception("Empty transcription received from Gemini")
         
         if api_key_manager and current_key:
             api_key_manager.mark_key_used(current_key, success=True)
         
-        return response.text
+        return text
         
     except AttributeError as e:
         # Handle cases where response.text throws AttributeError
@@ -495,7 +645,16 @@ def generate_breakdown(
 ) -> str:
     """Generate structured breakdown using Gemini."""
     
-    prompt = BREAKDOWN_PROMPT.format(transcript=transcript)
+    # Reuse the cached static prefix when available, otherwise send the full prompt
+    cached_content = None
+    if api_key_manager and current_key:
+        cached_content = api_key_manager.get_prompt_cache(
+            client, current_key, model_name, "breakdown", BREAKDOWN_PROMPT_PREFIX
+        )
+    if cached_content:
+        prompt = BREAKDOWN_PROMPT_SUFFIX.format(transcript=transcript)
+    else:
+        prompt = BREAKDOWN_PROMPT.format(transcript=transcript)
     
     try:
         response = client.models.generate_content(
@@ -507,6 +666,7 @@ def generate_breakdown(
                 top_k=40,  # Top-k sampling
                 max_output_tokens=65536,  # High limit for detailed breakdowns
                 candidate_count=1,
+                cached_content=cached_content,
             ),
         )
         
@@ -515,37 +675,38 @@ def generate_breakdown(
             raise Exception("Empty response from Gemini API")
         
         # Check if content was blocked
-        if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
-            block_reason = getattr(response.prompt_feedback, 'block_reason', None)
-            if block_reason and str(block_reason) not in ("BLOCK_REASON_UNSPECIFIED", "0", "None"):
-                raise Exception(f"Content blocked by safety filters: {block_reason}")
+        if response.prompt_feedback and response.prompt_feedback.block_reason not in _UNBLOCKED_REASONS:
+            raise Exception(f"Content blocked by safety filters: {response.prompt_feedback.block_reason}")
         
         # Check if we have candidates
-        if not hasattr(response, 'candidates') or not response.candidates:
+        if not response.candidates:
             raise Exception("No response candidates from Gemini API")
         
         # Check finish reason
-        candidate = response.candidates[0]
-        finish_reason = getattr(candidate, 'finish_reason', None)
-        finish_str = str(finish_reason) if finish_reason else ""
-        if "MAX_TOKENS" in finish_str:
+        finish_reason = response.candidates[0].finish_reason
+        if finish_reason == types.FinishReason.MAX_TOKENS:
             # Still return partial content with warning
-            text = response.text if hasattr(response, 'text') else ""
+            text = response.text
             if text and text.strip():
                 print(f"⚠️  Warning: Breakdown exceeded max tokens, returning partial content")
                 return text + "\n\n[Note: Breakdown was cut off due to length.]"
             raise Exception("Breakdown exceeded maximum length (MAX_TOKENS) and no partial content available")
-        elif finish_reason and finish_str not in ("STOP", "FinishReason.STOP", "UNSPECIFIED", "FinishReason.UNSPECIFIED", "0", "1"):
+        elif finish_reason == types.FinishReason.SAFETY:
+            raise Exception(f"Content blocked by safety filters: finish_reason={finish_reason}")
+        elif finish_reason == types.FinishReason.RECITATION:
+            raise Exception(f"Generation blocked for recitation: finish_reason={finish_reason}")
+        elif finish_reason not in _NORMAL_FINISH_REASONS:
             raise Exception(f"Generation stopped abnormally: finish_reason={finish_reason}")
         
-        # Try to get text
-        if not response.text or not response.text.strip():
+        # Read the text once - .text re-joins every part on each access
+        text = response.text or ""
+        if not text.strip():
             raise Exception("Empty breakdown received from Gemini")
         
         if api_key_manager and current_key:
             api_key_manager.mark_key_used(current_key, success=True)
         
-        return response.text
+        return text
         
     except AttributeError as e:
         raise Exception(f"Invalid response structure from Gemini: {e}")
@@ -563,10 +724,37 @@ class AudioProcessor:
     """Main processor for audio files."""
     
     MAX_RETRIES = 5  # Increased for rate limit handling
+    STATUS_COMMIT_INTERVAL = 2.0  # Min seconds between commits of message-only updates
     
     def __init__(self, db: Session):
         self.db = db
         self.key_manager = APIKeyManager(db)
+        self._last_commit_ts = 0.0
+    
+    def _flush_status(self, recording, step: str = None, message: str = None, force: bool = False):
+        """Update status columns, committing only when the step changes or on demand.
+        
+        Message-only updates stay pending in the session and are committed at most
+        once per STATUS_COMMIT_INTERVAL, so a recording costs a couple of fsyncs
+        instead of one per status tweak. Pass force=True right before long-running
+        calls so the UI sees the latest state while we wait.
+        """
+        if step is not None and step != recording.processing_step:
+            recording.processing_step = step
+            force = True
+        if message is not None:
+            recording.processing_message = message
+        
+        now = time.monotonic()
+        if force or now - self._last_commit_ts >= self.STATUS_COMMIT_INTERVAL:
+            self.db.commit()
+            self._last_commit_ts = now
+    
+    def _compress_progress(self, recording) -> Callable[[float], None]:
+        """Build a compress_audio progress callback that updates the recording's message."""
+        def on_progress(fraction: float):
+            self._flush_status(recording, message=f"Compressing... {fraction:.0%}")
+        return on_progress
     
     def process(self, file_path: Path, recording_id: int) -> Recording:
         """
@@ -574,24 +762,19 @@ class AudioProcessor:
         Updates the Recording in the database with step-by-step status.
         Always saves compressed file for download even if transcription fails.
         """
-        import shutil
-        
         # Get recording from database
         recording = self.db.query(Recording).filter(Recording.id == recording_id).first()
         if not recording:
             raise Exception(f"Recording {recording_id} not found")
         
         recording.status = "processing"
-        recording.processing_step = "starting"
-        self.db.commit()
         
         compressed_path = None
         saved_compressed_path = None
         
         try:
             # Step 1: Get audio info & compress
-            recording.processing_step = "compressing"
-            self.db.commit()
+            self._flush_status(recording, step="compressing")
             
             # Extract comprehensive audio metadata
             print(f"📊 Extracting audio metadata...")
@@ -612,16 +795,20 @@ class AudioProcessor:
             print(f"   Codec: {metadata['codec']}" if metadata['codec'] else "")
             print(f"   Recorded: {metadata['recorded_at']}" if metadata['recorded_at'] else "")
             
-            # Compress audio with FFmpeg
-            if check_ffmpeg():
-                compressed_path, original_size, compressed_size = compress_audio(file_path)
+            # Compress audio with FFmpeg (unless the source is already compact speech audio)
+            skip_compression = is_already_compressed(metadata)
+            if skip_compression:
+                logger.info(f"⏭️  Skipping compression | Already {metadata['codec']} at {metadata['bit_rate']} kbps")
+            if not skip_compression and check_ffmpeg():
+                compressed_path, original_size, compressed_size = compress_audio(
+                    file_path, metadata['duration'], on_progress=self._compress_progress(recording)
+                )
                 recording.original_size_mb = original_size
                 recording.compressed_size_mb = compressed_size
                 audio_to_use = compressed_path
                 
                 # ALWAYS save compressed file permanently for download
-                output_dir = Path("data/compressed")
-                output_dir.mkdir(parents=True, exist_ok=True)
+                output_dir = COMPRESSED_DIR
                 base_name = Path(recording.original_filename).stem
                 
                 # Add recording timestamp to filename if available
@@ -631,16 +818,15 @@ class AudioProcessor:
                 else:
                     saved_compressed_path = output_dir / f"{recording_id}_{base_name}.opus"
                     
-                shutil.copy2(str(compressed_path), str(saved_compressed_path))
+                link_or_copy(compressed_path, saved_compressed_path)
                 recording.compressed_file_path = str(saved_compressed_path)
             else:
                 recording.original_size_mb = file_path.stat().st_size / (1024 * 1024)
                 recording.compressed_size_mb = recording.original_size_mb
                 audio_to_use = file_path
                 
-                # Save original as "compressed" if no FFmpeg
-                output_dir = Path("data/compressed")
-                output_dir.mkdir(parents=True, exist_ok=True)
+                # Save original as "compressed" if no FFmpeg or already compressed
+                output_dir = COMPRESSED_DIR
                 
                 # Add recording timestamp to filename if available
                 if recording.recorded_at:
@@ -651,25 +837,19 @@ class AudioProcessor:
                 else:
                     saved_compressed_path = output_dir / f"{recording_id}_{file_path.name}"
                     
-                shutil.copy2(str(file_path), str(saved_compressed_path))
+                # Original upload is still needed for transcription - link, don't copy
+                link_or_copy(file_path, saved_compressed_path)
                 recording.compressed_file_path = str(saved_compressed_path)
             
-            self.db.commit()
-            
-            # Step 2: Transcribe with Gemini
-            recording.processing_step = "transcribing"
-            recording.processing_message = "Preparing to transcribe..."
-            self.db.commit()
+            # Step 2: Transcribe with Gemini (step change commits metadata too)
+            self._flush_status(recording, step="transcribing", message="Preparing to transcribe...")
             
             transcript = self._transcribe_with_retry(audio_to_use, recording)
             recording.transcript = transcript
-            recording.processing_message = "Transcription complete!"
-            self.db.commit()
+            self._flush_status(recording, message="Transcription complete!")
             
             # Step 3: Generate breakdown with Gemini
-            recording.processing_step = "analyzing"
-            recording.processing_message = "Preparing breakdown..."
-            self.db.commit()
+            self._flush_status(recording, step="analyzing", message="Preparing breakdown...")
             
             breakdown = self._breakdown_with_retry(transcript, recording)
             recording.breakdown = breakdown
@@ -704,16 +884,18 @@ class AudioProcessor:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                recording.processing_message = "Uploading audio to Gemini..."
-                self.db.commit()
+                self._flush_status(recording, message="Uploading audio to Gemini...")
                 
                 client, model_name, current_key = self.key_manager.get_model()
                 
-                # Track which API key is being used
+                # Track which API key is being used; commit before the long Gemini call
                 recording.api_key_id = current_key.id
                 recording.api_key_name = current_key.name
-                recording.processing_message = f"Transcribing with Gemini AI (using key: {current_key.name})"
-                self.db.commit()
+                self._flush_status(
+                    recording,
+                    message=f"Transcribing with Gemini AI (using key: {current_key.name})",
+                    force=True,
+                )
                 logger.info(f"🔑 Using API key: {current_key.name} | Attempt {attempt + 1}/{self.MAX_RETRIES}")
                 
                 result = transcribe_audio(client, model_name, audio_path, self.key_manager, current_key)
@@ -725,14 +907,17 @@ class AudioProcessor:
                 
             except Exception as e:
                 last_error = e
-                error_str = str(e).lower()
+                
+                # Permanent failures (safety block, malformed response, ...) won't recover
+                if is_non_retryable_error(e):
+                    self.key_manager.mark_key_used(current_key, success=False)
+                    raise Exception(f"Transcription failed: {e}")
                 
                 # Check if it's a rate limit/quota error (429 Too Many Requests)
-                if "429" in error_str or "too many requests" in error_str or "quota" in error_str or "resource exhausted" in error_str:
+                if is_quota_error(e):
                     # Mark this key as exhausted and try next key immediately
                     self.key_manager.mark_key_exhausted(current_key, str(e))
-                    recording.processing_message = f"Rate limit hit on {current_key.name}, switching to next key..."
-                    self.db.commit()
+                    self._flush_status(recording, message=f"Rate limit hit on {current_key.name}, switching to next key...")
                     
                     # Check if we have another key available
                     if not self.key_manager.get_next_available_key():
@@ -741,14 +926,21 @@ class AudioProcessor:
                     # Continue to next attempt with a new key
                     continue
                 
-                # Check if it's a network error (broken pipe, connection reset, timeout)
+                # Check if it's a network error (broken pipe, connection reset, timeout, 5xx)
                 # These happen within seconds, not minutes - retry with increasing delays
-                if any(err in error_str for err in ["broken pipe", "errno 32", "connection", "reset", "timeout"]):
+                if is_network_error(e):
                     wait_time = min(5 * (2 ** attempt), 30)  # 5s, 10s, 20s, 30s max
-                    logger.warning(f"🔌 Network error detected | Retrying in {wait_time}s... | Attempt {attempt + 1}/{self.MAX_RETRIES}")
-                    recording.processing_message = f"Network error (broken pipe), retrying in {wait_time}s... (attempt {attempt + 1}/{self.MAX_RETRIES})"
-                    self.db.commit()
-                    time.sleep(wait_time)
+                    # Jitter de-synchronizes retries from parallel recordings hitting the same outage
+                    wait_time += random.uniform(0, wait_time * 0.25)
+                    logger.warning(f"🔌 Network error detected | Retrying in {wait_time:.0f}s... | Attempt {attempt + 1}/{self.MAX_RETRIES}")
+                    self._flush_status(
+                        recording,
+                        message=f"Network error, retrying in {wait_time:.0f}s... (attempt {attempt + 1}/{self.MAX_RETRIES})",
+                        force=True,
+                    )
+                    # Wake early if another recording gets through on the same key
+                    if self.key_manager.wait_for_key_success(current_key, wait_time):
+                        logger.info(f"📶 Key '{current_key.name}' succeeded elsewhere, retrying early")
                     continue
                 
                 # For other errors, mark as failed use and retry
@@ -765,17 +957,19 @@ class AudioProcessor:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                recording.processing_message = "Analyzing transcript..."
-                self.db.commit()
+                self._flush_status(recording, message="Analyzing transcript...")
                 
-                # Use gemini-3.0-flash for breakdown
-                client, model_name, current_key = self.key_manager.get_model()
+                # Short transcripts use the lite model, long ones the flagship
+                client, model_name, current_key = self.key_manager.get_model_for_breakdown(len(transcript))
                 
-                # Update which key is being used
+                # Update which key is being used; commit before the long Gemini call
                 recording.api_key_id = current_key.id
                 recording.api_key_name = current_key.name
-                recording.processing_message = f"Generating structured breakdown with Gemini (using key: {current_key.name})"
-                self.db.commit()
+                self._flush_status(
+                    recording,
+                    message=f"Generating structured breakdown with Gemini (using key: {current_key.name})",
+                    force=True,
+                )
                 logger.info(f"📣 Using {model_name} for breakdown | Key: {current_key.name}")
                 
                 result = generate_breakdown(client, model_name, transcript, self.key_manager, current_key)
@@ -786,14 +980,17 @@ class AudioProcessor:
                 
             except Exception as e:
                 last_error = e
-                error_str = str(e).lower()
+                
+                # Permanent failures (safety block, malformed response, ...) won't recover
+                if is_non_retryable_error(e):
+                    self.key_manager.mark_key_used(current_key, success=False)
+                    raise Exception(f"Breakdown generation failed: {e}")
                 
                 # Check if it's a rate limit/quota error (429 Too Many Requests)
-                if "429" in error_str or "too many requests" in error_str or "quota" in error_str or "resource exhausted" in error_str:
+                if is_quota_error(e):
                     # Mark this key as exhausted and try next key immediately
                     self.key_manager.mark_key_exhausted(current_key, str(e))
-                    recording.processing_message = f"Rate limit hit on {current_key.name}, switching to next key..."
-                    self.db.commit()
+                    self._flush_status(recording, message=f"Rate limit hit on {current_key.name}, switching to next key...")
                     
                     # Check if we have another key available
                     if not self.key_manager.get_next_available_key():
@@ -815,8 +1012,6 @@ class AudioProcessor:
         Only compress the audio file without transcription.
         Saves compressed file to disk for download.
         """
-        import shutil
-        
         recording = self.db.query(Recording).filter(Recording.id == recording_id).first()
         if not recording:
             raise Exception(f"Recording {recording_id} not found")
@@ -834,13 +1029,14 @@ class AudioProcessor:
             
             # Compress audio
             if check_ffmpeg():
-                compressed_path, original_size, compressed_size = compress_audio(file_path)
+                compressed_path, original_size, compressed_size = compress_audio(
+                    file_path, duration, on_progress=self._compress_progress(recording)
+                )
                 recording.original_size_mb = original_size
                 recording.compressed_size_mb = compressed_size
                 
                 # Save compressed file to permanent location
-                output_dir = Path("data/compressed")
-                output_dir.mkdir(parents=True, exist_ok=True)
+                output_dir = COMPRESSED_DIR
                 
                 # Create output filename with timestamp if available
                 base_name = Path(recording.original_filename).stem
@@ -851,10 +1047,7 @@ class AudioProcessor:
                     output_file = output_dir / f"{recording_id}_{base_name}.opus"
                 
                 # Move compressed file to permanent location
-                if compressed_path != file_path:
-                    shutil.move(str(compressed_path), str(output_file))
-                else:
-                    shutil.copy2(str(file_path), str(output_file))
+                move_file(compressed_path, output_file)
                 
                 recording.compressed_file_path = str(output_file)
             else:
@@ -862,8 +1055,7 @@ class AudioProcessor:
                 recording.original_size_mb = file_path.stat().st_size / (1024 * 1024)
                 recording.compressed_size_mb = recording.original_size_mb
                 
-                output_dir = Path("data/compressed")
-                output_dir.mkdir(parents=True, exist_ok=True)
+                output_dir = COMPRESSED_DIR
                 
                 # Add timestamp to filename if available
                 if recording.recorded_at:
@@ -873,8 +1065,9 @@ class AudioProcessor:
                     output_file = output_dir / f"{recording_id}_{base_name}_{timestamp}{ext}"
                 else:
                     output_file = output_dir / f"{recording_id}_{file_path.name}"
-                    
-                shutil.copy2(str(file_path), str(output_file))
+                
+                # The upload is deleted afterwards anyway, so just move it into place
+                move_file(file_path, output_file)
                 recording.compressed_file_path = str(output_file)
             
             recording.status = "completed"
@@ -212,10 +212,13 @@ document.addEventListener('alpine:init', function() {
             
             select: function(note) {
                 this.selectedId = note.id;
-                // For registry notes, lazy-load content if not already loaded
-                if (note.source === 'registry' && !note._loaded) {
+                // List payloads omit full content - lazy-load it if not already loaded
+                if (!note._loaded) {
                     var self = this;
-                    fetch('/v2/api/registry/' + note.id + '/preview')
+                    var url = note.source === 'registry'
+                        ? '/v2/api/registry/' + note.id + '/preview'
+                        : '/v2/api/notes/' + note.id;
+                    fetch(url)
                         .then(function(res) { return res.json(); })
                         .then(function(data) {
                             note.content = data.content || '';
@@ -3,19 +3,37 @@ V2 Frontend Routes and API endpoints.
 Provides the new dark-mode, information-dense UI.
 """
 
+import os
+import re
 import json
+import time
+import asyncio
+import heapq
+import functools
+import shutil
+import stat
+import tempfile
+import sqlite3
 import logging
+import threading
+import urllib.parse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, date, timedelta
 
 from fastapi import APIRouter, Request, Depends, HTTPException, UploadFile, File
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
-from .database import get_db, Recording
+from .database import (
+    get_db, get_setting, set_settings_many, get_settings_many, get_all_settings,
+    Recording, RecordingTag, APIKey,
+)
 
 # Import shared modules for model configs
 try:
@@ -24,6 +42,17 @@ except ImportError:
     AVAILABLE_MODELS = []
     DEFAULT_MODEL = "gemini-2.0-flash"
 
+# Faster JSON for registry list columns (optional - falls back to stdlib)
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = logging.getLogger(__name__)
 
 # Create router with /v2 prefix
@@ -46,6 +75,19 @@ class TaskUpdate(BaseModel):
     completed: bool
 
 
+class FileHashesRequest(BaseModel):
+    hashes: List[str]
+
+
+class NoteTagsUpdate(BaseModel):
+    id: int
+    tags: List[str]
+
+
+class BulkTagsRequest(BaseModel):
+    updates: List[NoteTagsUpdate]
+
+
 class SettingsUpdate(BaseModel):
     LOCAL_SYNC_AUDIO_DIR: Optional[str] = None
     OBSIDIAN_VAULT_DIR: Optional[str] = None
@@ -63,34 +105,191 @@ class SettingsUpdate(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def _get_registry_path() -> Path:
-    """Get the engine registry database path."""
-    import os
+    """Get the engine registry database path (fixed for the process lifetime)."""
     return Path(os.environ.get("REGISTRY_DB_PATH", "./data/engine/registry.db"))
 
 
-def _read_v2_registry(limit: int = 100):
-    """Read recent processing entries from the engine registry."""
+# Registry paths whose schema has already been ensured in this process
+_registry_ready = set()
+
+# Columns the web UI reads that older engine versions didn't create
+REGISTRY_COLUMNS = [
+    ("tags", "TEXT"),
+    ("projects", "TEXT"),
+    ("audio_path", "TEXT"),
+]
+
+REGISTRY_INDEXES = [
+    # Recency ordering and month range filters (inbox, projects, archive, calendar)
+    "CREATE INDEX IF NOT EXISTS idx_pf_ingested_processed "
+    "ON processed_files(COALESCE(ingested_at, processed_at) DESC)",
+    # success filters + last processed lookups
+    "CREATE INDEX IF NOT EXISTS idx_pf_success_processed "
+    "ON processed_files(success, processed_at)",
+    # "notes today" counts
+    "CREATE INDEX IF NOT EXISTS idx_pf_processed_date "
+    "ON processed_files(DATE(processed_at), success)",
+    # Ingest folder status lookups by filename
+    "CREATE INDEX IF NOT EXISTS idx_pf_filename ON processed_files(filename)",
+    # Failed files list, newest retry first (partial: failures only)
+    "CREATE INDEX IF NOT EXISTS idx_pf_failed "
+    "ON processed_files(last_retry_at DESC) WHERE success = 0",
+]
+
+# Inverted indexes of the JSON list columns: (column, table, value field).
+# Triggers keep them in sync with every writer (web app and watcher). Writers
+# enable recursive_triggers so INSERT OR REPLACE fires the delete trigger.
+REGISTRY_LIST_TABLES = [
+    ("tags", "note_tags", "tag"),
+    ("projects", "note_projects", "project"),
+]
+
+# Text items of a JSON list column (malformed or non-list values yield nothing)
+_JSON_LIST_ITEMS = (
+    "json_each(CASE WHEN json_valid({src}) AND json_type({src}) = 'array' "
+    "THEN {src} ELSE '[]' END) j"
+)
+
+
+def _list_table_ddl(col: str, table: str, field: str) -> list:
+    """CREATE statements for one inverted index table and its sync triggers."""
+    fill_new = (
+        f"INSERT OR IGNORE INTO {table} (note_id, {field}) "
+        f"SELECT NEW.id, j.value FROM {_JSON_LIST_ITEMS.format(src=f'NEW.{col}')} WHERE j.type = 'text';"
+    )
+    clear_old = f"DELETE FROM {table} WHERE note_id = OLD.id;"
+    return [
+        f"CREATE TABLE IF NOT EXISTS {table} ("
+        f"note_id INTEGER NOT NULL, {field} TEXT NOT NULL, "
+        f"PRIMARY KEY (note_id, {field})) WITHOUT ROWID",
+        f"CREATE INDEX IF NOT EXISTS idx_{table}_{field} ON {table}({field})",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_insert AFTER INSERT ON processed_files "
+        f"BEGIN {fill_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_update AFTER UPDATE OF {col} ON processed_files "
+        f"BEGIN {clear_old} {fill_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_delete AFTER DELETE ON processed_files "
+        f"BEGIN {clear_old} END",
+    ]
+
+
+def _sync_list_table(conn, col: str, table: str, field: str):
+    """Create an inverted index table (backfilling it if new) and drop orphaned rows.
+    
+    Orphans come from INSERT OR REPLACE by writers without recursive_triggers
+    (e.g. an older watcher), where the delete trigger doesn't fire.
+    """
+    is_new = _plain_cursor(conn).execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is None
+    for stmt in _list_table_ddl(col, table, field):
+        conn.execute(stmt)
+    if is_new:
+        conn.execute(
+            f"INSERT OR IGNORE INTO {table} (note_id, {field}) "
+            f"SELECT pf.id, j.value FROM processed_files pf, {_JSON_LIST_ITEMS.format(src=f'pf.{col}')} "
+            f"WHERE pf.{col} IS NOT NULL AND j.type = 'text'"
+        )
+    else:
+        conn.execute(f"DELETE FROM {table} WHERE note_id NOT IN (SELECT id FROM processed_files)")
+
+
+def _ensure_registry_schema(conn, registry_path: Path):
+    """Add missing columns and query indexes to the registry, once per process."""
+    key = str(registry_path)
+    if key in _registry_ready or conn.in_transaction:
+        return
+    try:
+        existing_cols = {row[1] for row in _plain_cursor(conn).execute("PRAGMA table_info(processed_files)")}
+        if not existing_cols:
+            # Engine hasn't created the table yet - retry on the next call
+            return
+        # All DDL in one transaction: one commit/fsync instead of one per statement
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for col, col_type in REGISTRY_COLUMNS:
+                if col not in existing_cols:
+                    conn.execute(f"ALTER TABLE processed_files ADD COLUMN {col} {col_type}")
+            for stmt in REGISTRY_INDEXES:
+                conn.execute(stmt)
+            for col, table, field in REGISTRY_LIST_TABLES:
+                _sync_list_table(conn, col, table, field)
+            conn.execute("ANALYZE")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not migrate registry schema: {e}")
+        return
+    _registry_ready.add(key)
+
+
+# processed_files narrowed to the newest row per filename
+_REGISTRY_LATEST_PER_FILENAME = """(
+            SELECT *, ROW_NUMBER() OVER (
+                PARTITION BY filename ORDER BY COALESCE(ingested_at, processed_at) DESC
+            ) AS rn
+            FROM processed_files
+        ) WHERE rn = 1"""
+
+
+# Long-lived registry connections, one per thread
+_registry_local = threading.local()
+_registry_open_lock = threading.Lock()
+
+
+def _get_registry_conn() -> sqlite3.Connection:
+    """Get this thread's registry connection, opening and tuning it on first use.
+    
+    Callers should check that the registry file exists first and must not
+    close the returned connection.
+    """
     registry_path = _get_registry_path()
-    if not registry_path.exists():
-        return []
+    conn = getattr(_registry_local, "conn", None)
+    if conn is not None and _registry_local.path == registry_path:
+        _ensure_registry_schema(conn, registry_path)
+        return conn
+    
+    with _registry_open_lock:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(str(registry_path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA recursive_triggers=ON")  # REPLACE fires delete triggers
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.row_factory = sqlite3.Row
+        _ensure_registry_schema(conn, registry_path)
+        _registry_local.conn = conn
+        _registry_local.path = registry_path
+    return conn
+
+
+def _plain_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor on a pooled connection that yields plain tuples instead of sqlite3.Row.
     
-    import sqlite3, json
-    conn = sqlite3.connect(str(registry_path))
-    conn.row_factory = sqlite3.Row
+    For scalar/positional reads; the override is per cursor, so the shared
+    connection's row_factory is left alone.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
+def _read_v2_registry(limit: int = 100, dedup: bool = False):
+    """Read recent processing entries from the engine registry.
     
-    # Detect available columns to avoid errors on older schemas
-    col_info = conn.execute("PRAGMA table_info(processed_files)").fetchall()
-    existing_cols = {row[1] for row in col_info}
+    With dedup=True only the most recent entry per filename is returned.
+    """
+    registry_path = _get_registry_path()
+    if not registry_path.exists():
+        return []
     
-    # Migrate missing columns on the fly
-    for col, default in [("tags", "TEXT"), ("projects", "TEXT")]:
-        if col not in existing_cols:
-            try:
-                conn.execute(f"ALTER TABLE processed_files ADD COLUMN {col} {default}")
-                existing_cols.add(col)
-            except sqlite3.OperationalError:
-                pass
+    conn = _get_registry_conn()
     
     rows = conn.execute("""
         SELECT 
@@ -111,31 +310,32 @@ def _read_v2_registry(limit: int = 100):
             has_tasks,
             tags,
             projects
-        FROM processed_files
+        FROM {source}
         ORDER BY COALESCE(ingested_at, processed_at) DESC
         LIMIT ?
-    """, (limit,)).fetchall()
-    conn.close()
+    """.format(source=_REGISTRY_LATEST_PER_FILENAME if dedup else "processed_files"), (limit,)).fetchall()
     
-    results = []
-    for row in rows:
-        d = dict(row)
-        # Parse JSON fields
-        try:
-            d["tags"] = json.loads(d.get("tags") or "[]")
-        except (json.JSONDecodeError, TypeError):
-            d["tags"] = []
-        try:
-            d["projects"] = json.loads(d.get("projects") or "[]")
-        except (json.JSONDecodeError, TypeError):
-            d["projects"] = []
-        results.append(d)
-    
-    return results
+    # tags/projects stay as raw JSON text - only callers that render them
+    # pay for decoding (see _parse_json_list)
+    return [dict(row) for row in rows]
+
+
+def _parse_json_list(raw) -> list:
+    """Decode a JSON list column, skipping the decoder for empty values."""
+    if not raw or raw == "[]":
+        return []
+    try:
+        value = _json_loads(raw)
+    except (ValueError, TypeError):
+        return []
+    return value if isinstance(value, list) else []
 
 
-def _get_v2_stats():
-    """Get statistics from the engine registry."""
+def _get_v2_stats(watcher: Optional[dict] = None):
+    """Get statistics from the engine registry.
+    
+    Pass an already-read watcher status row to skip re-reading watcher_status.
+    """
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return {
@@ -148,33 +348,38 @@ def _get_v2_stats():
             "last_processed": None
         }
     
-    import sqlite3
-    conn = sqlite3.connect(str(registry_path))
+    cur = _plain_cursor(_get_registry_conn())
     
-    total = conn.execute("SELECT COUNT(*) FROM processed_files").fetchone()[0]
-    success = conn.execute("SELECT COUNT(*) FROM processed_files WHERE success = 1").fetchone()[0]
-    failed = conn.execute("SELECT COUNT(*) FROM processed_files WHERE success = 0").fetchone()[0]
+    # One pass over processed_files for all counters
     today = datetime.now().strftime("%Y-%m-%d")
-    notes_today = conn.execute(
-        "SELECT COUNT(*) FROM processed_files WHERE DATE(processed_at) = ? AND success = 1",
+    total, success, failed, notes_today = cur.execute(
+        """SELECT COUNT(*),
+                  COALESCE(SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), 0),
+                  COALESCE(SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END), 0),
+                  COALESCE(SUM(CASE WHEN DATE(processed_at) = ? AND success = 1 THEN 1 ELSE 0 END), 0)
+           FROM processed_files""",
         (today,)
-    ).fetchone()[0]
-    last_processed = conn.execute(
-        "SELECT MAX(processed_at) FROM processed_files WHERE success = 1"
-    ).fetchone()[0]
+    ).fetchone()
+    # Walks the end of idx_pf_success_processed
+    row = cur.execute(
+        "SELECT processed_at FROM processed_files WHERE success = 1 ORDER BY processed_at DESC LIMIT 1"
+    ).fetchone()
+    last_processed = row[0] if row else None
     
     # Get watcher status for processing/pending
     watcher_state = "idle"
     files_in_queue = 0
-    try:
-        row = conn.execute("SELECT state, files_in_queue FROM watcher_status WHERE id = 1").fetchone()
-        if row:
-            watcher_state = row[0] or "idle"
-            files_in_queue = row[1] or 0
-    except Exception:
-        pass
-    
-    conn.close()
+    if watcher is not None:
+        watcher_state = watcher.get("state") or "idle"
+        files_in_queue = watcher.get("files_in_queue") or 0
+    else:
+        try:
+            row = cur.execute("SELECT state, files_in_queue FROM watcher_status WHERE id = 1").fetchone()
+            if row:
+                watcher_state = row[0] or "idle"
+                files_in_queue = row[1] or 0
+        except Exception:
+            pass
     
     return {
         "total_notes": total,
@@ -187,6 +392,65 @@ def _get_v2_stats():
     }
 
 
+# Short-lived cache of _get_v2_stats() so bursty dashboard refreshes share one result
+_stats_cache = {"t": 0.0, "v": None}
+
+
+def _cached_stats(ttl: float = 3.0) -> dict:
+    """Get registry stats, recomputing at most once per `ttl` seconds."""
+    now = time.monotonic()
+    if _stats_cache["v"] is None or now - _stats_cache["t"] >= ttl:
+        _stats_cache["v"] = _get_v2_stats()
+        _stats_cache["t"] = now
+    return _stats_cache["v"]
+
+
+# Distinct registry modes for the note detail project picker - changes rarely
+_known_modes_cache = {"t": 0.0, "v": None}
+
+
+def _cached_known_modes(conn, ttl: float = 30.0) -> list:
+    """Get sorted distinct registry modes, re-querying at most once per `ttl` seconds."""
+    now = time.monotonic()
+    if _known_modes_cache["v"] is None or now - _known_modes_cache["t"] >= ttl:
+        rows = conn.execute(
+            "SELECT DISTINCT mode FROM processed_files WHERE mode IS NOT NULL AND mode != '' ORDER BY mode"
+        ).fetchall()
+        _known_modes_cache["v"] = [r["mode"] for r in rows]
+        _known_modes_cache["t"] = now
+    return _known_modes_cache["v"]
+
+
+def _invalidate_stats():
+    """Force the next _cached_stats() and system-status calls to recompute (call after writes)."""
+    _stats_cache["t"] = 0.0
+    _stats_cache["v"] = None
+    _system_status_cache["v"] = None
+
+
+# Dashboard config summary: field -> (setting key, default)
+CONFIG_SUMMARY_SETTINGS = {
+    "audio_input": ("LOCAL_SYNC_AUDIO_DIR", "Not configured"),
+    "obsidian_vault": ("OBSIDIAN_VAULT_DIR", "Not configured"),
+    "model": ("GEMINI_MODEL", "gemini-3-flash-preview"),
+    "mode": ("PROCESSING_MODE", "personal_note"),
+    "scan_interval": ("SCAN_INTERVAL", "5"),
+}
+
+
+def _get_config_summary(db: Session, settings: Optional[dict] = None) -> dict:
+    """Read the dashboard config summary settings in one query.
+    
+    Pass settings (from get_settings_many) to reuse values already loaded.
+    """
+    if settings is None:
+        settings = get_settings_many(db, [key for key, _ in CONFIG_SUMMARY_SETTINGS.values()])
+    return {
+        field: settings.get(key) or default
+        for field, (key, default) in CONFIG_SUMMARY_SETTINGS.items()
+    }
+
+
 def _note_to_dict(recording: Recording) -> dict:
     """Convert a Recording to a note dict for templates."""
     content = recording.notes or recording.breakdown or ""
@@ -208,6 +472,52 @@ def _note_to_dict(recording: Recording) -> dict:
     }
 
 
+def _recording_list_query(db: Session):
+    """Query the Recording columns list views need, with a 200-char preview computed in SQL.
+    
+    Full notes/breakdown/transcript text is left in the database; the inbox
+    lazy-loads it from /api/notes/{id} when a note is selected.
+    """
+    content = func.coalesce(
+        func.nullif(Recording.notes, ""),
+        func.nullif(Recording.breakdown, ""),
+        func.nullif(Recording.transcript, ""),
+        "",
+    )
+    return db.query(
+        Recording.id,
+        Recording.original_filename,
+        Recording.title,
+        Recording.status,
+        Recording.created_at,
+        Recording.processed_at,
+        Recording.duration_seconds,
+        func.substr(content, 1, 200).label("preview"),
+        Recording.tags,
+        Recording.compressed_file_path,
+    )
+
+
+def _row_to_note_dict(row) -> dict:
+    """Convert a _recording_list_query() row to a (content-less) note dict."""
+    return {
+        "id": row.id,
+        "filename": row.original_filename,
+        "title": row.title or row.original_filename,
+        "status": row.status,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "processed_at": row.processed_at.isoformat() if row.processed_at else None,
+        "duration": row.duration_seconds,
+        "content": "",
+        "transcript": "",
+        "tags": row.tags.split(",") if row.tags else [],
+        "tasks": [],
+        "preview": row.preview or "",
+        "audio_url": f"/audio/{row.id}" if row.compressed_file_path else None,
+        "obsidian_path": None
+    }
+
+
 # ============================================================================
 # PAGE ROUTES
 # ============================================================================
@@ -215,34 +525,12 @@ def _note_to_dict(recording: Recording) -> dict:
 @router.get("/", response_class=HTMLResponse)
 async def v2_dashboard(request: Request, db: Session = Depends(get_db)):
     """V2 Dashboard page — live system overview."""
-    from .database import get_setting
-    
-    # Stats from registry
-    stats = _get_v2_stats()
-    
-    # Watcher status
-    watcher = _get_watcher_status()
-    
-    # API key health
-    api_keys = _get_api_key_status(db)
-    
-    # Recent activity from registry  
-    recent_activity = _read_v2_registry(limit=20)
-    
-    # Ingest folder files
-    ingest_files = _get_ingest_files(db)
-    
-    # Failed files
-    failed_files = _get_failed_files()
-    
-    # Config summary
-    config = {
-        "audio_input": get_setting(db, "LOCAL_SYNC_AUDIO_DIR", "Not configured"),
-        "obsidian_vault": get_setting(db, "OBSIDIAN_VAULT_DIR", "Not configured"),
-        "model": get_setting(db, "GEMINI_MODEL", "gemini-3-flash-preview"),
-        "mode": get_setting(db, "PROCESSING_MODE", "personal_note"),
-        "scan_interval": get_setting(db, "SCAN_INTERVAL", "5"),
-    }
+    # Registry snapshot and session-bound reads run side by side
+    ((watcher, stats, recent_activity, failed_files),
+     (api_keys, ingest_files, config)) = await asyncio.gather(
+        asyncio.to_thread(_read_registry_snapshot, 20, True),
+        asyncio.to_thread(_get_session_status, db),
+    )
     
     return templates.TemplateResponse("v2/dashboard.html", {
         "request": request,
@@ -261,18 +549,18 @@ async def v2_dashboard(request: Request, db: Session = Depends(get_db)):
 async def v2_inbox(request: Request, tag: str = None, db: Session = Depends(get_db)):
     """V2 Inbox page - list all notes (V1 recordings + V2 registry)."""
     # V1 recordings
-    recordings = db.query(Recording).order_by(Recording.created_at.desc()).limit(100).all()
-    notes = [_note_to_dict(r) for r in recordings]
+    rows = _recording_list_query(db).order_by(Recording.created_at.desc()).limit(100).all()
+    notes = [_row_to_note_dict(r) for r in rows]
     for n in notes:
         n["source"] = "v1"
         n["link"] = f"/v2/note/{n['id']}"
         if "tags" not in n:
             n["tags"] = []
 
-    # V2 registry (watcher-processed)
-    registry_notes = _read_v2_registry(limit=100)
-    for rn in registry_notes:
-        notes.append({
+    # V2 registry (watcher-processed), already deduplicated by filename
+    registry_notes = []
+    for rn in _read_v2_registry(limit=100, dedup=True):
+        registry_notes.append({
             "id": rn.get("id"),
             "filename": rn.get("filename", ""),
             "title": rn.get("title") or rn.get("filename", "Untitled"),
@@ -283,8 +571,8 @@ async def v2_inbox(request: Request, tag: str = None, db: Session = Depends(get_
             "duration": rn.get("duration"),
             "content": "",
             "transcript": "",
-            "tags": rn.get("tags", []),
-            "projects": rn.get("projects", []),
+            "tags": _parse_json_list(rn.get("tags")),
+            "projects": _parse_json_list(rn.get("projects")),
             "tasks": [],
             "preview": rn.get("title") or rn.get("filename", ""),
             "audio_url": None,
@@ -295,10 +583,11 @@ async def v2_inbox(request: Request, tag: str = None, db: Session = Depends(get_
             "error": rn.get("error"),
         })
 
-    # Sort by date descending, dedup by filename
+    # Both lists come back newest-first: merge them, dropping V1/V2 filename overlaps
     seen = set()
     deduped = []
-    for n in sorted(notes, key=lambda x: x.get("created_at") or "", reverse=True):
+    merged = heapq.merge(notes, registry_notes, key=lambda x: x.get("created_at") or "", reverse=True)
+    for n in merged:
         key = n.get("filename", "")
         if key and key in seen:
             continue
@@ -332,68 +621,109 @@ async def v2_note_detail(request: Request, note_id: int, db: Session = Depends(g
     })
 
 
+# Shared pool for fanning out small blocking file reads
+_file_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="v2-file-io")
+
+# Parsed daily task files: path -> (mtime_ns, tasks)
+_daily_task_cache = {}
+
+
+# Daily task line patterns
+CHECKBOX_RE = re.compile(r"- \[([ x])\] (.+)")
+SOURCE_RE = re.compile(r"\[\[Inbox/([^\]|]+)")
+DUE_RE = re.compile(r"📅\s*([^,)]+)")
+PAREN_LINK_SUFFIX_RE = re.compile(r"\s*\([^)]*\)\s*\[\[.+?\]\]$")
+LINK_SUFFIX_RE = re.compile(r"\s*\[\[.+?\]\]$")
+
+# Priority emoji -> priority, checked in order (default "medium")
+PRIORITY_MAP = (("🔴", "high"), ("🟢", "low"))
+
+
+def _parse_daily_tasks(daily_file: Path, day) -> list:
+    """Parse the checkbox tasks out of one daily task file."""
+    tasks = []
+    try:
+        content = daily_file.read_text(encoding="utf-8")
+    except OSError:
+        return tasks
+    
+    # Parse checkbox lines
+    for match in CHECKBOX_RE.finditer(content):
+        completed = match.group(1).lower() == "x"
+        raw_text = match.group(2)
+        
+        # Extract source backlink if present
+        source_match = SOURCE_RE.search(raw_text)
+        source = source_match.group(1) if source_match else None
+        
+        # Extract priority emoji
+        priority = next((v for k, v in PRIORITY_MAP if k in raw_text), "medium")
+        
+        # Extract due date
+        due_match = DUE_RE.search(raw_text)
+        due_date = due_match.group(1).strip() if due_match else None
+        
+        # Clean the text
+        clean_text = PAREN_LINK_SUFFIX_RE.sub("", raw_text).strip()
+        clean_text = LINK_SUFFIX_RE.sub("", clean_text).strip()
+        
+        tasks.append({
+            "text": clean_text,
+            "completed": completed,
+            "source": source,
+            "priority": priority,
+            "due_date": due_date,
+            "date": day.isoformat(),
+            "file": daily_file.name,
+        })
+    return tasks
+
+
+def _collect_daily_tasks(tasks_dir: Path) -> list:
+    """Collect tasks from the last 30 days of daily task files, newest first."""
+    
+    tasks = []
+    if not tasks_dir.exists():
+        return tasks
+    
+    today = date.today()
+    days = []
+    misses = []
+    for days_ago in range(31):
+        check_date = today - timedelta(days=days_ago)
+        daily_file = tasks_dir / f"{check_date.isoformat()}.md"
+        try:
+            mtime_ns = daily_file.stat().st_mtime_ns
+        except OSError:
+            continue
+        days.append(daily_file)
+        cached = _daily_task_cache.get(str(daily_file))
+        if not cached or cached[0] != mtime_ns:
+            misses.append((check_date, daily_file, mtime_ns))
+    
+    # Only re-parse days that changed since the last request
+    for (check_date, daily_file, mtime_ns), day_tasks in zip(
+        misses, _file_io_pool.map(lambda m: _parse_daily_tasks(m[1], m[0]), misses)
+    ):
+        _daily_task_cache[str(daily_file)] = (mtime_ns, day_tasks)
+    
+    for daily_file in days:
+        for task in _daily_task_cache[str(daily_file)][1]:
+            tasks.append({"id": len(tasks) + 1, **task})
+    return tasks
+
+
 @router.get("/tasks", response_class=HTMLResponse)
 async def v2_tasks(request: Request, db: Session = Depends(get_db)):
     """V2 Tasks page - reads from daily task files."""
-    from .database import get_setting
-    from datetime import date, timedelta
-    import re
     
     vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
     note_subdir = get_setting(db, "OBSIDIAN_NOTE_SUBDIR", "VoiceNotes")
     
     tasks = []
-    tasks_sources = []  # Track which daily files we've read
-    
     if vault_dir:
         tasks_dir = Path(vault_dir) / note_subdir / "Tasks"
-        
-        if tasks_dir.exists():
-            # Read all daily task files from last 30 days
-            today = date.today()
-            for days_ago in range(31):
-                check_date = today - timedelta(days=days_ago)
-                daily_file = tasks_dir / f"{check_date.isoformat()}.md"
-                
-                if daily_file.exists():
-                    tasks_sources.append(check_date.isoformat())
-                    content = daily_file.read_text(encoding="utf-8")
-                    
-                    # Parse checkbox lines
-                    checkbox_pattern = r"- \[([ x])\] (.+)"
-                    for match in re.finditer(checkbox_pattern, content):
-                        completed = match.group(1).lower() == "x"
-                        raw_text = match.group(2)
-                        
-                        # Extract source backlink if present
-                        source_match = re.search(r"\[\[Inbox/([^\]|]+)", raw_text)
-                        source = source_match.group(1) if source_match else None
-                        
-                        # Extract priority emoji
-                        priority = "medium"
-                        if "🔴" in raw_text:
-                            priority = "high"
-                        elif "🟢" in raw_text:
-                            priority = "low"
-                        
-                        # Extract due date
-                        due_match = re.search(r"📅\s*([^,)]+)", raw_text)
-                        due_date = due_match.group(1).strip() if due_match else None
-                        
-                        # Clean the text
-                        clean_text = re.sub(r"\s*\([^)]*\)\s*\[\[.+?\]\]$", "", raw_text).strip()
-                        clean_text = re.sub(r"\s*\[\[.+?\]\]$", "", clean_text).strip()
-                        
-                        tasks.append({
-                            "id": len(tasks) + 1,
-                            "text": clean_text,
-                            "completed": completed,
-                            "source": source,
-                            "priority": priority,
-                            "due_date": due_date,
-                            "date": check_date.isoformat(),
-                            "file": daily_file.name,
-                        })
+        tasks = await asyncio.to_thread(_collect_daily_tasks, tasks_dir)
     
     # Count stats
     pending_count = sum(1 for t in tasks if not t["completed"])
@@ -410,108 +740,130 @@ async def v2_tasks(request: Request, db: Session = Depends(get_db)):
     })
 
 
+# Settings keys and defaults (matching main.py)
+SETTINGS_KEYS = [
+    "LOCAL_SYNC_AUDIO_DIR",
+    "OBSIDIAN_VAULT_DIR",
+    "OBSIDIAN_NOTE_SUBDIR",
+    "PROCESSING_MODE",
+    "GEMINI_MODEL",
+    "TRANSCRIPTION_ENGINE",
+    "OPENAI_API_KEY",
+    "STABILITY_SECONDS",
+    "SCAN_INTERVAL",
+    "AUDIO_BITRATE",
+    "FILENAME_DATE_FORMAT",
+]
+
+SETTINGS_DEFAULTS = {
+    "LOCAL_SYNC_AUDIO_DIR": "",
+    "OBSIDIAN_VAULT_DIR": "",
+    "OBSIDIAN_NOTE_SUBDIR": "VoiceNotes",
+    "PROCESSING_MODE": "personal_note",
+    "GEMINI_MODEL": DEFAULT_MODEL,
+    "TRANSCRIPTION_ENGINE": "gemini",
+    "OPENAI_API_KEY": "",
+    "STABILITY_SECONDS": "10",
+    "SCAN_INTERVAL": "5",
+    "AUDIO_BITRATE": "48k",
+    "FILENAME_DATE_FORMAT": "DD_MM_YY",
+}
+
+PROCESSING_MODES = [
+    ("personal_note", "Personal Note"),
+    ("idea", "Idea"),
+    ("meeting", "Meeting"),
+    ("reflection", "Reflection"),
+    ("task_dump", "Task Dump"),
+]
+
+# Available models - use shared config if available
+MODEL_CHOICES = [(m.id, f"{m.display_name} - {m.description}") for m in AVAILABLE_MODELS] if AVAILABLE_MODELS else [
+    ("gemini-2.0-flash", "Gemini 2.0 Flash - Fast and efficient"),
+    ("gemini-1.5-flash", "Gemini 1.5 Flash - Stable and reliable"),
+    ("gemini-1.5-pro", "Gemini 1.5 Pro - More capable but slower"),
+]
+
+# Available transcription engines
+TRANSCRIPTION_ENGINES = [
+    ("gemini", "Gemini (uses selected model above)"),
+    ("whisper-1", "OpenAI Whisper — Fast & affordable ($0.006/min)"),
+    ("gpt-4o-transcribe", "OpenAI GPT-4o Transcribe — Premium quality ($0.06/min)"),
+]
+
+
 @router.get("/settings", response_class=HTMLResponse)
 async def v2_settings(request: Request, db: Session = Depends(get_db)):
     """V2 Settings page."""
-    from .database import get_setting
-    
-    # Settings keys and defaults (matching main.py)
-    SETTINGS_KEYS = [
-        "LOCAL_SYNC_AUDIO_DIR",
-        "OBSIDIAN_VAULT_DIR",
-        "OBSIDIAN_NOTE_SUBDIR",
-        "PROCESSING_MODE",
-        "GEMINI_MODEL",
-        "TRANSCRIPTION_ENGINE",
-        "OPENAI_API_KEY",
-        "STABILITY_SECONDS",
-        "SCAN_INTERVAL",
-        "AUDIO_BITRATE",
-        "FILENAME_DATE_FORMAT",
-    ]
-    
-    SETTINGS_DEFAULTS = {
-        "LOCAL_SYNC_AUDIO_DIR": "",
-        "OBSIDIAN_VAULT_DIR": "",
-        "OBSIDIAN_NOTE_SUBDIR": "VoiceNotes",
-        "PROCESSING_MODE": "personal_note",
-        "GEMINI_MODEL": DEFAULT_MODEL,
-        "TRANSCRIPTION_ENGINE": "gemini",
-        "OPENAI_API_KEY": "",
-        "STABILITY_SECONDS": "10",
-        "SCAN_INTERVAL": "5",
-        "AUDIO_BITRATE": "48k",
-        "FILENAME_DATE_FORMAT": "DD_MM_YY",
-    }
-    
-    PROCESSING_MODES = [
-        ("personal_note", "Personal Note"),
-        ("idea", "Idea"),
-        ("meeting", "Meeting"),
-        ("reflection", "Reflection"),
-        ("task_dump", "Task Dump"),
-    ]
-    
     # Build config dict
-    config = {}
-    for key in SETTINGS_KEYS:
-        config[key] = get_setting(db, key, SETTINGS_DEFAULTS.get(key, ""))
+    config = get_settings_many(db, SETTINGS_KEYS, SETTINGS_DEFAULTS)
     
-    # Get watcher stats
+    # Watcher stats - same numbers as the dashboard, from the shared stats cache
     watcher_stats = None
-    registry_path = Path("data/engine/registry.db")
-    if registry_path.exists():
-        try:
-            import sqlite3
-            conn = sqlite3.connect(str(registry_path))
-            cursor = conn.execute(
-                "SELECT COUNT(*), "
-                "SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), "
-                "SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END), "
-                "MAX(processed_at) "
-                "FROM processed_files"
-            )
-            row = cursor.fetchone()
-            conn.close()
+    try:
+        stats = await asyncio.to_thread(_cached_stats)
+        if stats["total_notes"]:
             watcher_stats = {
-                "total": row[0] or 0,
-                "success": row[1] or 0,
-                "failed": row[2] or 0,
-                "last_processed": row[3] or "Never",
+                "total": stats["total_notes"],
+                "success": stats["success"],
+                "failed": stats["failed"],
+                "last_processed": stats["last_processed"] or "Never",
             }
-        except Exception:
-            pass
-    
-    # Available models - use shared config if available
-    models = [(m.id, f"{m.display_name} - {m.description}") for m in AVAILABLE_MODELS] if AVAILABLE_MODELS else [
-        ("gemini-2.0-flash", "Gemini 2.0 Flash - Fast and efficient"),
-        ("gemini-1.5-flash", "Gemini 1.5 Flash - Stable and reliable"),
-        ("gemini-1.5-pro", "Gemini 1.5 Pro - More capable but slower"),
-    ]
-    
-    # Available transcription engines
-    transcription_engines = [
-        ("gemini", "Gemini (uses selected model above)"),
-        ("whisper-1", "OpenAI Whisper — Fast & affordable ($0.006/min)"),
-        ("gpt-4o-transcribe", "OpenAI GPT-4o Transcribe — Premium quality ($0.06/min)"),
-    ]
+    except Exception:
+        pass
     
     return templates.TemplateResponse("v2/settings.html", {
         "request": request,
         "active_page": "settings",
         "settings": config,
         "modes": PROCESSING_MODES,
-        "models": models,
-        "transcription_engines": transcription_engines,
+        "models": MODEL_CHOICES,
+        "transcription_engines": TRANSCRIPTION_ENGINES,
         "watcher_stats": watcher_stats,
     })
 
 
+# Most recent notes embedded per group on the projects page
+PROJECT_NOTES_LIMIT = 50
+
+# Note: COALESCE(ingested_at, processed_at) aliased as 'processed_at' for template compatibility.
+# It represents the actual ingestion time, falling back to processing time for old entries.
+_PROJECTS_BY_MODE_SQL = """
+    SELECT * FROM (
+        SELECT COALESCE(NULLIF(mode, ''), 'uncategorized') AS group_name,
+               COUNT(*) OVER w AS group_count,
+               ROW_NUMBER() OVER (w ORDER BY COALESCE(ingested_at, processed_at) DESC) AS rn,
+               id, filename, title, mode, projects,
+               COALESCE(ingested_at, processed_at) AS processed_at,
+               success, error, duration_seconds
+        FROM processed_files
+        WHERE success = 1
+        WINDOW w AS (PARTITION BY COALESCE(NULLIF(mode, ''), 'uncategorized'))
+    ) WHERE rn <= ?
+    ORDER BY group_name, rn
+"""
+
+_PROJECTS_BY_PROJECT_SQL = """
+    SELECT * FROM (
+        SELECT j.value AS group_name,
+               COUNT(*) OVER w AS group_count,
+               ROW_NUMBER() OVER (w ORDER BY COALESCE(pf.ingested_at, pf.processed_at) DESC) AS rn,
+               pf.id, pf.filename, pf.title, pf.mode, pf.projects,
+               COALESCE(pf.ingested_at, pf.processed_at) AS processed_at,
+               pf.success, pf.error, pf.duration_seconds
+        FROM processed_files pf,
+             json_each(CASE WHEN json_valid(pf.projects) AND json_type(pf.projects) = 'array'
+                            THEN pf.projects ELSE '[]' END) j
+        WHERE pf.success = 1 AND j.value IS NOT NULL AND j.value != ''
+        WINDOW w AS (PARTITION BY j.value)
+    ) WHERE rn <= ?
+    ORDER BY group_name, rn
+"""
+
+
 @router.get("/projects", response_class=HTMLResponse)
 async def v2_projects(request: Request, db: Session = Depends(get_db)):
     """V2 Projects page — notes grouped by processing mode AND user-assigned projects."""
-    from .database import get_setting
-    import sqlite3, json
 
     registry_path = _get_registry_path()
     mode_groups = {}
@@ -519,42 +871,21 @@ async def v2_projects(request: Request, db: Session = Depends(get_db)):
     
     if registry_path.exists():
         try:
-            conn = sqlite3.connect(str(registry_path))
-            conn.row_factory = sqlite3.Row
-            # Note: COALESCE(ingested_at, processed_at) aliased as 'processed_at' for template compatibility
-            # This represents the actual ingestion time, falling back to processing time for old entries
-            rows = conn.execute(
-                "SELECT id, filename, title, mode, projects, COALESCE(ingested_at, processed_at) as processed_at, success, error, duration_seconds "
-                "FROM processed_files WHERE success = 1 ORDER BY COALESCE(ingested_at, processed_at) DESC"
-            ).fetchall()
-            conn.close()
-            
-            for row in rows:
-                d = dict(row)
-                
-                # Group by mode
-                mode = d.get("mode") or "uncategorized"
-                if mode not in mode_groups:
-                    mode_groups[mode] = {"name": mode, "kind": "mode", "notes": [], "count": 0, "latest": None}
-                mode_groups[mode]["notes"].append(d)
-                mode_groups[mode]["count"] += 1
-                if not mode_groups[mode]["latest"]:
-                    mode_groups[mode]["latest"] = d.get("processed_at")
-                
-                # Group by user-assigned projects
-                try:
-                    projects_list = json.loads(d.get("projects") or "[]")
-                except (json.JSONDecodeError, TypeError):
-                    projects_list = []
-                
-                for proj in projects_list:
-                    if proj:
-                        if proj not in project_groups:
-                            project_groups[proj] = {"name": proj, "kind": "project", "notes": [], "count": 0, "latest": None}
-                        project_groups[proj]["notes"].append(d)
-                        project_groups[proj]["count"] += 1
-                        if not project_groups[proj]["latest"]:
-                            project_groups[proj]["latest"] = d.get("processed_at")
+            conn = _get_registry_conn()
+            for kind, sql, groups in (
+                ("mode", _PROJECTS_BY_MODE_SQL, mode_groups),
+                ("project", _PROJECTS_BY_PROJECT_SQL, project_groups),
+            ):
+                for row in conn.execute(sql, (PROJECT_NOTES_LIMIT,)):
+                    d = dict(row)
+                    name = d.pop("group_name")
+                    count = d.pop("group_count")
+                    d.pop("rn")
+                    if name not in groups:
+                        # Rows arrive newest-first per group, so the first one is the latest
+                        groups[name] = {"name": name, "kind": kind, "notes": [], "count": count,
+                                        "latest": d.get("processed_at")}
+                    groups[name]["notes"].append(d)
                             
         except Exception as e:
             logger.error(f"Failed to read projects: {e}")
@@ -583,7 +914,6 @@ async def v2_archive(request: Request, db: Session = Depends(get_db)):
 @router.get("/keys", response_class=HTMLResponse)
 async def v2_keys(request: Request, db: Session = Depends(get_db)):
     """V2 API Key management page."""
-    from .database import APIKey
     keys = db.query(APIKey).order_by(APIKey.created_at).all()
     key_list = [
         {
@@ -617,26 +947,36 @@ async def v2_calendar(request: Request, db: Session = Depends(get_db)):
     })
 
 
+def _read_vault_file(path_str: Optional[str], vault_dir: str) -> str:
+    """Read a registry file, trying the absolute path then vault-relative ("" if missing)."""
+    if not path_str:
+        return ""
+    try:
+        return Path(path_str).read_text(encoding="utf-8")
+    except Exception:
+        pass
+    if vault_dir:
+        try:
+            return (Path(vault_dir) / path_str).read_text(encoding="utf-8")
+        except Exception:
+            pass
+    return ""
+
+
+def _file_exists(path_str: Optional[str]) -> bool:
+    """True if path_str names an existing file."""
+    return bool(path_str) and os.path.exists(path_str)
+
+
 @router.get("/registry-note/{note_id}", response_class=HTMLResponse)
 async def v2_registry_note(request: Request, note_id: int, db: Session = Depends(get_db)):
     """V2 Registry note detail page — view a watcher-processed note."""
-    import sqlite3
-    from .database import get_setting
 
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
 
-    conn = sqlite3.connect(str(registry_path))
-    conn.row_factory = sqlite3.Row
-
-    # Ensure tags/projects/audio_path columns exist (migration)
-    for col, default in [("tags", "''"), ("projects", "'[]'"), ("audio_path", "''")]:
-        try:
-            conn.execute(f"ALTER TABLE processed_files ADD COLUMN {col} TEXT DEFAULT {default}")
-            conn.commit()
-        except sqlite3.OperationalError:
-            pass
+    conn = _get_registry_conn()
 
     row = conn.execute(
         "SELECT id, filename, title, mode, processed_at, success, error, "
@@ -645,12 +985,6 @@ async def v2_registry_note(request: Request, note_id: int, db: Session = Depends
         "FROM processed_files WHERE id = ?", (note_id,)
     ).fetchone()
 
-    # Also get list of all distinct projects for the picker
-    all_projects_rows = conn.execute(
-        "SELECT DISTINCT mode FROM processed_files WHERE mode IS NOT NULL AND mode != ''"
-    ).fetchall()
-    conn.close()
-
     if not row:
         raise HTTPException(status_code=404, detail="Note not found")
 
@@ -658,53 +992,27 @@ async def v2_registry_note(request: Request, note_id: int, db: Session = Depends
     note["status"] = "completed" if note["success"] else "failed"
 
     # Parse tags & projects JSON
-    import json
     try:
-        note["tags"] = json.loads(note.get("tags") or "[]")
+        note["tags"] = _json_loads(note.get("tags") or "[]")
     except Exception:
         note["tags"] = []
     try:
-        note["projects"] = json.loads(note.get("projects") or "[]")
+        note["projects"] = _json_loads(note.get("projects") or "[]")
     except Exception:
         note["projects"] = []
 
-    # Collect known project names
-    known_projects = sorted(set(r["mode"] for r in all_projects_rows))
+    # Known project names for the picker
+    known_projects = _cached_known_modes(conn)
 
     vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
 
-    def _try_read(path_str):
-        """Try to read a file, trying absolute path then vault-relative."""
-        if not path_str:
-            return ""
-        try:
-            p = Path(path_str)
-            if p.exists():
-                return p.read_text(encoding="utf-8")
-        except Exception:
-            pass
-        if vault_dir:
-            try:
-                p = Path(vault_dir) / path_str
-                if p.exists():
-                    return p.read_text(encoding="utf-8")
-            except Exception:
-                pass
-        return ""
-
-    note["content"] = _try_read(note.get("note_path"))
-    note["transcript"] = _try_read(note.get("transcript_path"))
-
-    # Build audio URL if audio file exists
-    audio_path_str = note.get("audio_path", "")
-    if audio_path_str:
-        p = Path(audio_path_str)
-        if p.exists():
-            note["audio_url"] = f"/v2/api/registry/{note_id}/audio"
-        else:
-            note["audio_url"] = None
-    else:
-        note["audio_url"] = None
+    # Read note and transcript and check the audio file concurrently
+    note["content"], note["transcript"], has_audio = await asyncio.gather(
+        asyncio.to_thread(_read_vault_file, note.get("note_path"), vault_dir),
+        asyncio.to_thread(_read_vault_file, note.get("transcript_path"), vault_dir),
+        asyncio.to_thread(_file_exists, note.get("audio_path")),
+    )
+    note["audio_url"] = f"/v2/api/registry/{note_id}/audio" if has_audio else None
 
     return templates.TemplateResponse("v2/registry-note.html", {
         "request": request,
@@ -724,13 +1032,13 @@ async def api_get_notes(
     status: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get all notes."""
-    query = db.query(Recording)
+    """Get all notes (without full content - fetch /api/notes/{id} for that)."""
+    query = _recording_list_query(db)
     if status:
         query = query.filter(Recording.status == status)
     
-    recordings = query.order_by(Recording.created_at.desc()).limit(limit).all()
-    return [_note_to_dict(r) for r in recordings]
+    rows = query.order_by(Recording.created_at.desc()).limit(limit).all()
+    return [_row_to_note_dict(r) for r in rows]
 
 
 @router.get("/api/notes/{note_id}")
@@ -771,6 +1079,7 @@ async def api_reprocess_note(note_id: int, db: Session = Depends(get_db)):
     
     recording.status = "pending"
     db.commit()
+    _invalidate_stats()
     
     # Would need to add to processing queue
     return {"success": True}
@@ -793,14 +1102,25 @@ async def api_update_task(task_id: int, update: TaskUpdate):
     return {"success": True}
 
 
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def _save_upload(src, dst: Path) -> int:
+    """Copy an upload stream to disk in 1 MiB chunks, returning the byte count."""
+    written = 0
+    with open(dst, "wb") as f:
+        while chunk := src.read(UPLOAD_CHUNK_BYTES):
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
 @router.post("/api/upload")
 async def api_upload(
     file: UploadFile = File(...),
     db: Session = Depends(get_db)
 ):
     """Upload an audio file."""
-    import shutil
-    from datetime import datetime
     
     # Validate file
     allowed_extensions = {'.m4a', '.mp3', '.wav', '.mp4', '.webm', '.ogg'}
@@ -819,18 +1139,20 @@ async def api_upload(
     filename = f"{timestamp}_{file.filename}"
     file_path = upload_dir / filename
     
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # Write off the event loop in large chunks
+    size_bytes = await asyncio.to_thread(_save_upload, file.file, file_path)
     
     # Create recording entry
     recording = Recording(
         original_filename=file.filename,
         file_format=ext.lstrip('.'),
+        original_size_mb=size_bytes / (1024 * 1024),
         title=Path(file.filename).stem,
         status="pending"
     )
     db.add(recording)
     db.commit()
+    _invalidate_stats()
     
     return {"success": True, "id": recording.id}
 
@@ -838,37 +1160,31 @@ async def api_upload(
 @router.get("/api/tags")
 async def api_get_tags(q: str = "", db: Session = Depends(get_db)):
     """Search for tags (for autocomplete)."""
-    # Get all unique tags from recordings
-    recordings = db.query(Recording).filter(Recording.tags.isnot(None)).all()
-    all_tags = set()
-    for r in recordings:
-        if r.tags:
-            all_tags.update(t.strip() for t in r.tags.split(","))
-    
-    # Filter by query
-    if q:
-        q_lower = q.lower()
-        all_tags = [t for t in all_tags if q_lower in t.lower()]
-    
-    return sorted(all_tags)[:10]
+    # recording_tags mirrors Recording.tags; only the matches come back
+    pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    rows = (
+        db.query(RecordingTag.name)
+        .filter(RecordingTag.name.like(pattern, escape="\\"))
+        .distinct()
+        .order_by(RecordingTag.name)
+        .limit(10)
+        .all()
+    )
+    return [r.name for r in rows]
 
 
 @router.get("/api/settings")
 async def api_get_settings(db: Session = Depends(get_db)):
     """Get all settings."""
-    from .database import get_all_settings
     return get_all_settings(db)
 
 
 @router.put("/api/settings")
 async def api_update_settings(settings: SettingsUpdate, db: Session = Depends(get_db)):
     """Update settings."""
-    from .database import set_setting
     
     updates = settings.dict(exclude_unset=True)
-    for key, value in updates.items():
-        if value is not None:
-            set_setting(db, key, str(value))
+    set_settings_many(db, {key: str(value) for key, value in updates.items() if value is not None})
     
     return {"success": True}
 
@@ -876,7 +1192,7 @@ async def api_update_settings(settings: SettingsUpdate, db: Session = Depends(ge
 @router.get("/api/stats")
 async def api_get_stats(db: Session = Depends(get_db)):
     """Get dashboard statistics."""
-    return _get_v2_stats()
+    return _cached_stats()
 
 
 # ============================================================================
@@ -885,7 +1201,6 @@ async def api_get_stats(db: Session = Depends(get_db)):
 
 def _get_watcher_status() -> dict:
     """Read watcher status from the engine registry."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return {
@@ -898,10 +1213,8 @@ def _get_watcher_status() -> dict:
             "updated_at": None,
         }
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
+        conn = _get_registry_conn()
         row = conn.execute("SELECT * FROM watcher_status WHERE id = 1").fetchone()
-        conn.close()
         if row:
             return dict(row)
         return {"state": "unknown"}
@@ -911,38 +1224,124 @@ def _get_watcher_status() -> dict:
 
 def _get_api_key_status(db: Session) -> dict:
     """Get API key status from the main database."""
-    from .database import APIKey
     try:
-        keys = db.query(APIKey).all()
-        active = [k for k in keys if k.is_active and not k.is_exhausted]
-        exhausted = [k for k in keys if k.is_exhausted]
+        # Only the columns the dashboard shows - never the key itself
+        rows = db.query(
+            APIKey.id, APIKey.name, APIKey.is_active, APIKey.is_exhausted,
+            APIKey.total_requests, APIKey.last_error,
+        ).all()
+        active = exhausted = 0
+        keys = []
+        for k in rows:
+            if k.is_exhausted:
+                exhausted += 1
+            elif k.is_active:
+                active += 1
+            keys.append({
+                "id": k.id,
+                "name": k.name or f"Key {k.id}",
+                "is_active": k.is_active,
+                "is_exhausted": k.is_exhausted,
+                "total_requests": k.total_requests or 0,
+                "last_error": k.last_error,
+            })
         return {
             "total": len(keys),
-            "active": len(active),
-            "exhausted": len(exhausted),
-            "keys": [
-                {
-                    "id": k.id,
-                    "name": k.name or f"Key {k.id}",
-                    "is_active": k.is_active,
-                    "is_exhausted": k.is_exhausted,
-                    "total_requests": k.total_requests or 0,
-                    "last_error": k.last_error,
-                }
-                for k in keys
-            ],
+            "active": active,
+            "exhausted": exhausted,
+            "keys": keys,
         }
     except Exception as e:
         return {"total": 0, "active": 0, "exhausted": 0, "keys": [], "error": str(e)}
 
 
-def _get_ingest_files(db: Session) -> list:
+# Max bound parameters per IN (...) batch - well under SQLITE_MAX_VARIABLE_NUMBER
+REGISTRY_IN_BATCH = 500
+
+INGEST_AUDIO_SUFFIXES = (".mp3", ".m4a", ".wav", ".ogg", ".flac", ".webm", ".aac", ".opus", ".3gp")
+
+# Ingest directory scans: audio_dir -> (monotonic time, entries)
+_ingest_scan_cache = {}
+INGEST_SCAN_TTL_SECONDS = 2.0
+
+# The watcher's published listing is trusted for this long; older means it is
+# stuck or stopped, so the web app walks the folder itself
+INGEST_SNAPSHOT_MAX_AGE_SECONDS = 60
+
+
+def _iter_audio(root: str):
+    """Yield (name, rel_path, size_bytes, mtime) for audio files under root.
+    
+    Uses os.scandir so the stat data readdir already returned is reused.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(INGEST_AUDIO_SUFFIXES) and entry.is_file():
+                        st = entry.stat()
+                        yield entry.name, os.path.relpath(entry.path, root), st.st_size, st.st_mtime
+        except OSError:
+            continue
+
+
+def _read_ingest_snapshot(audio_dir: str) -> Optional[list]:
+    """The watcher's listing of audio_dir from its last scan, or None if unusable.
+    
+    Only used while the watcher is idle (not mid-scan or processing), watching
+    the same folder, and has refreshed the snapshot recently.
+    """
+    if not _get_registry_path().exists():
+        return None
+    try:
+        cur = _plain_cursor(_get_registry_conn())
+        row = cur.execute(
+            "SELECT state, ingest_root, ingest_snapshot_at FROM watcher_status WHERE id = 1"
+        ).fetchone()
+        if not row or row[0] != "idle" or not row[1] or not row[2]:
+            return None
+        if os.path.realpath(row[1]) != os.path.realpath(audio_dir):
+            return None
+        age = datetime.utcnow() - datetime.fromisoformat(row[2])
+        if age.total_seconds() > INGEST_SNAPSHOT_MAX_AGE_SECONDS:
+            return None
+        return cur.execute(
+            "SELECT name, rel_path, size_bytes, modified_at FROM ingest_snapshot ORDER BY rel_path"
+        ).fetchall()
+    except (sqlite3.Error, ValueError):
+        # Older engine without the snapshot table/columns
+        return None
+
+
+def _scan_ingest_dir(audio_dir: str) -> list:
+    """Audio files in the ingest directory, sorted by path, cached for a couple of seconds.
+    
+    Prefers the listing the watcher publishes each scan; walks the folder
+    only when that is missing or stale.
+    """
+    now = time.monotonic()
+    cached = _ingest_scan_cache.get(audio_dir)
+    if cached and now - cached[0] < INGEST_SCAN_TTL_SECONDS:
+        return cached[1]
+    entries = _read_ingest_snapshot(audio_dir)
+    if entries is None:
+        entries = sorted(_iter_audio(audio_dir), key=lambda e: e[1])
+    _ingest_scan_cache[audio_dir] = (now, entries)
+    return entries
+
+
+def _get_ingest_files(db: Session, settings: Optional[dict] = None) -> list:
     """List audio files in the ingest directory with their processing status."""
-    import sqlite3
-    from .database import get_setting
 
-    import os as _os
-    audio_dir = get_setting(db, "LOCAL_SYNC_AUDIO_DIR", "") or _os.environ.get("LOCAL_SYNC_AUDIO_DIR", "")
+    if settings is not None:
+        audio_dir = settings.get("LOCAL_SYNC_AUDIO_DIR", "")
+    else:
+        audio_dir = get_setting(db, "LOCAL_SYNC_AUDIO_DIR", "")
+    audio_dir = audio_dir or os.environ.get("LOCAL_SYNC_AUDIO_DIR", "")
     if not audio_dir:
         return []
 
@@ -950,21 +1349,29 @@ def _get_ingest_files(db: Session) -> list:
     if not audio_path.exists():
         return []
 
-    supported = {".mp3", ".m4a", ".wav", ".ogg", ".flac", ".webm", ".aac", ".opus", ".3gp"}
+    try:
+        entries = _scan_ingest_dir(audio_dir)
+    except Exception as e:
+        logger.error(f"Failed to list ingest files: {e}")
+        entries = []
 
-    # Build a lookup of processed filenames from registry
+    # Build a lookup of processed filenames from registry - only for files on disk
     processed_map = {}  # filename -> {status, error, processed_at, ...}
     registry_path = _get_registry_path()
-    if registry_path.exists():
+    names = list(dict.fromkeys(e[0] for e in entries))
+    if names and registry_path.exists():
         try:
-            conn = sqlite3.connect(str(registry_path))
-            conn.row_factory = sqlite3.Row
-            # Select both ingested_at and processed_at for fallback logic (line 1001)
-            rows = conn.execute(
-                "SELECT filename, file_hash, success, error, retry_count, processed_at, ingested_at, skipped, title "
-                "FROM processed_files ORDER BY COALESCE(ingested_at, processed_at) DESC"
-            ).fetchall()
-            conn.close()
+            conn = _get_registry_conn()
+            rows = []
+            for i in range(0, len(names), REGISTRY_IN_BATCH):
+                batch = names[i:i + REGISTRY_IN_BATCH]
+                # Select both ingested_at and processed_at for fallback logic
+                rows.extend(conn.execute(
+                    "SELECT filename, file_hash, success, error, retry_count, processed_at, ingested_at, skipped, title "
+                    f"FROM processed_files WHERE filename IN ({','.join('?' * len(batch))}) "
+                    "ORDER BY COALESCE(ingested_at, processed_at) DESC",
+                    batch,
+                ).fetchall())
             for row in rows:
                 d = dict(row)
                 fn = d["filename"]
@@ -985,39 +1392,34 @@ def _get_ingest_files(db: Session) -> list:
 
     files = []
     try:
-        for fp in sorted(audio_path.rglob("*")):
-            if fp.is_file() and fp.suffix.lower() in supported:
-                stat = fp.stat()
-                name = fp.name
-                rel_path = str(fp.relative_to(audio_path))
-                
-                info = processed_map.get(name)
-                if current_file and name == current_file:
-                    status = "processing"
-                    error = None
-                    title = None
-                elif info:
-                    status = info["file_status"]
-                    error = info.get("error")
-                    title = info.get("title")
-                else:
-                    status = "new"
-                    error = None
-                    title = None
-
-                files.append({
-                    "name": name,
-                    "rel_path": rel_path,
-                    "size_bytes": stat.st_size,
-                    "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                    "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "ingested_at": info.get("ingested_at") or info.get("processed_at") if info else None,
-                    "status": status,
-                    "error": error,
-                    "title": title,
-                    "retry_count": info.get("retry_count", 0) if info else 0,
-                    "file_hash": info.get("file_hash", "") if info else "",
-                })
+        for name, rel_path, size_bytes, mtime in entries:
+            info = processed_map.get(name)
+            if current_file and name == current_file:
+                status = "processing"
+                error = None
+                title = None
+            elif info:
+                status = info["file_status"]
+                error = info.get("error")
+                title = info.get("title")
+            else:
+                status = "new"
+                error = None
+                title = None
+
+            files.append({
+                "name": name,
+                "rel_path": rel_path,
+                "size_bytes": size_bytes,
+                "size_mb": round(size_bytes / (1024 * 1024), 2),
+                "modified_at": datetime.fromtimestamp(mtime).isoformat(),
+                "ingested_at": info.get("ingested_at") or info.get("processed_at") if info else None,
+                "status": status,
+                "error": error,
+                "title": title,
+                "retry_count": info.get("retry_count", 0) if info else 0,
+                "file_hash": info.get("file_hash", "") if info else "",
+            })
     except Exception as e:
         logger.error(f"Failed to list ingest files: {e}")
 
@@ -1026,25 +1428,31 @@ def _get_ingest_files(db: Session) -> list:
     return files
 
 
-def _get_failed_files() -> list:
-    """Get failed files with retry status from registry."""
-    import sqlite3
+# The dashboard only renders a bounded failed-files list
+FAILED_FILES_LIMIT = 200
+
+# Engine retry policy, mirrored for the dashboard's retry status
+MAX_RETRIES = 5
+RETRY_BACKOFF_MINUTES = [1, 5, 15, 60, 240]
+RETRY_BACKOFFS = [timedelta(minutes=m) for m in RETRY_BACKOFF_MINUTES]
 
-    MAX_RETRIES = 5
-    RETRY_BACKOFF_MINUTES = [1, 5, 15, 60, 240]
+
+def _get_failed_files() -> list:
+    """Get the most recent failed files with retry status from registry."""
 
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return []
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
+        conn = _get_registry_conn()
         rows = conn.execute(
             "SELECT filename, file_hash, error, retry_count, last_retry_at, skipped "
-            "FROM processed_files WHERE success = 0 ORDER BY last_retry_at DESC"
+            "FROM processed_files WHERE success = 0 ORDER BY last_retry_at DESC LIMIT ?",
+            (FAILED_FILES_LIMIT,),
         ).fetchall()
-        conn.close()
 
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
         result = []
         for row in rows:
             d = dict(row)
@@ -1059,15 +1467,12 @@ def _get_failed_files() -> list:
                 d["next_retry"] = None
                 d["file_status"] = "max_retries"
             elif last_retry_at and retry_count > 0:
-                from datetime import timedelta
-                backoff_idx = min(retry_count - 1, len(RETRY_BACKOFF_MINUTES) - 1)
-                backoff_mins = RETRY_BACKOFF_MINUTES[backoff_idx]
-                last = datetime.fromisoformat(last_retry_at)
-                next_retry = last + timedelta(minutes=backoff_mins)
+                backoff_idx = min(retry_count - 1, len(RETRY_BACKOFFS) - 1)
+                next_retry = datetime.fromisoformat(last_retry_at) + RETRY_BACKOFFS[backoff_idx]
                 d["next_retry"] = next_retry.isoformat()
-                d["file_status"] = "waiting" if datetime.utcnow() < next_retry else "ready"
+                d["file_status"] = "waiting" if now < next_retry else "ready"
             else:
-                d["next_retry"] = datetime.utcnow().isoformat()
+                d["next_retry"] = now_iso
                 d["file_status"] = "ready"
             result.append(d)
         return result
@@ -1076,41 +1481,83 @@ def _get_failed_files() -> list:
         return []
 
 
+# Composed /api/system-status payload - absorbs repolls from several tabs
+SYSTEM_STATUS_TTL_SECONDS = 1.0
+_system_status_cache = {"t": 0.0, "v": None}
+_system_status_lock = asyncio.Lock()
+
+
 @router.get("/api/system-status")
 async def api_system_status(db: Session = Depends(get_db)):
     """Comprehensive system status for live dashboard polling.
     
     Returns watcher state, ingest folder contents, processing history,
     failed files, API key health — everything the dashboard needs.
+    Polls that land within SYSTEM_STATUS_TTL_SECONDS share one payload.
     """
-    from .database import get_setting
+    async with _system_status_lock:
+        now = time.monotonic()
+        if _system_status_cache["v"] is None or now - _system_status_cache["t"] >= SYSTEM_STATUS_TTL_SECONDS:
+            ((watcher, stats, recent, failed),
+             (api_keys, ingest, config)) = await asyncio.gather(
+                asyncio.to_thread(_read_registry_snapshot, 30),
+                asyncio.to_thread(_get_session_status, db),
+            )
+            _system_status_cache["v"] = {
+                "watcher": watcher,
+                "stats": stats,
+                "api_keys": api_keys,
+                "recent_activity": recent,
+                "failed_files": failed,
+                "ingest_files": ingest,
+                "config": config,
+            }
+            _system_status_cache["t"] = now
+        payload = _system_status_cache["v"]
+
+    return {**payload, "timestamp": datetime.utcnow().isoformat()}
+
+
+def _read_registry_snapshot(recent_limit: int, cached_stats: bool = False) -> tuple:
+    """Watcher status, stats, recent activity and failed files in one read transaction.
     
-    watcher = _get_watcher_status()
-    stats = _get_v2_stats()
-    api_keys = _get_api_key_status(db)
-    recent = _read_v2_registry(limit=30)
-    failed = _get_failed_files()
-    ingest = _get_ingest_files(db)
-    
-    # Current config 
-    config = {
-        "audio_input": get_setting(db, "LOCAL_SYNC_AUDIO_DIR", "Not configured"),
-        "obsidian_vault": get_setting(db, "OBSIDIAN_VAULT_DIR", "Not configured"),
-        "model": get_setting(db, "GEMINI_MODEL", "gemini-3-flash-preview"),
-        "mode": get_setting(db, "PROCESSING_MODE", "personal_note"),
-        "scan_interval": get_setting(db, "SCAN_INTERVAL", "5"),
-    }
+    All helpers pick up this thread's pooled registry connection, so they share
+    a single connection and see one consistent snapshot of the registry.
+    """
+    registry_path = _get_registry_path()
+    if not registry_path.exists():
+        stats = _cached_stats() if cached_stats else _get_v2_stats()
+        return _get_watcher_status(), stats, [], []
+    
+    conn = _get_registry_conn()
+    conn.execute("BEGIN")
+    try:
+        watcher = _get_watcher_status()
+        stats = _cached_stats() if cached_stats else _get_v2_stats(watcher)
+        recent = _read_v2_registry(recent_limit)
+        failed = _get_failed_files()
+    finally:
+        conn.execute("COMMIT")
+    return watcher, stats, recent, failed
 
-    return {
-        "watcher": watcher,
-        "stats": stats,
-        "api_keys": api_keys,
-        "recent_activity": recent,
-        "failed_files": failed,
-        "ingest_files": ingest,
-        "config": config,
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+
+# Every setting read by _get_session_status (LOCAL_SYNC_AUDIO_DIR is in the config summary)
+SYSTEM_STATUS_SETTINGS = [key for key, _ in CONFIG_SUMMARY_SETTINGS.values()]
+
+
+def _get_session_status(db: Session) -> tuple:
+    """API key health, ingest files and config summary.
+    
+    These all use the request's Session, which must not be shared across
+    threads, so they run sequentially in a single worker. Their settings are
+    read together in one query.
+    """
+    settings = get_settings_many(db, SYSTEM_STATUS_SETTINGS)
+    return (
+        _get_api_key_status(db),
+        _get_ingest_files(db, settings),
+        _get_config_summary(db, settings),
+    )
 
 
 @router.get("/api/ingest-files")
@@ -1122,19 +1569,17 @@ async def api_ingest_files(db: Session = Depends(get_db)):
 @router.post("/api/clear-failed")
 async def api_clear_failed():
     """Reset all failed files for retry."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
-        count = conn.execute("SELECT COUNT(*) FROM processed_files WHERE success = 0").fetchone()[0]
-        conn.execute(
+        conn = _get_registry_conn()
+        cursor = conn.execute(
             "UPDATE processed_files SET retry_count = 0, last_retry_at = NULL, skipped = 0, error = NULL "
             "WHERE success = 0"
         )
-        conn.commit()
-        conn.close()
+        count = cursor.rowcount
+        _invalidate_stats()
         return {"success": True, "reset_count": count}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1143,15 +1588,13 @@ async def api_clear_failed():
 @router.post("/api/skip-file/{file_hash}")
 async def api_skip_file(file_hash: str):
     """Skip a failed file (won't be retried)."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.execute("UPDATE processed_files SET skipped = 1 WHERE file_hash = ?", (file_hash,))
-        conn.commit()
-        conn.close()
+        conn = _get_registry_conn()
+        conn.execute(f"UPDATE processed_files SET {SKIP_FILE_SET_SQL} WHERE file_hash = ?", (file_hash,))
+        _invalidate_stats()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1160,28 +1603,74 @@ async def api_skip_file(file_hash: str):
 @router.post("/api/retry-file/{file_hash}")
 async def api_retry_file(file_hash: str):
     """Reset a failed file for immediate retry."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.execute(
-            "UPDATE processed_files SET skipped = 0, retry_count = 0, last_retry_at = NULL "
-            "WHERE file_hash = ?",
-            (file_hash,),
-        )
-        conn.commit()
-        conn.close()
+        conn = _get_registry_conn()
+        conn.execute(f"UPDATE processed_files SET {RETRY_FILE_SET_SQL} WHERE file_hash = ?", (file_hash,))
+        _invalidate_stats()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Registry updates applied by the skip/retry endpoints
+SKIP_FILE_SET_SQL = "skipped = 1"
+RETRY_FILE_SET_SQL = "skipped = 0, retry_count = 0, last_retry_at = NULL"
+
+
+def _update_files_by_hash(set_sql: str, hashes: List[str]) -> int:
+    """Apply one SET clause to every registry row matching hashes, in a single transaction."""
+    hashes = list(dict.fromkeys(hashes))
+    conn = _get_registry_conn()
+    count = 0
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for i in range(0, len(hashes), REGISTRY_IN_BATCH):
+            batch = hashes[i:i + REGISTRY_IN_BATCH]
+            count += conn.execute(
+                f"UPDATE processed_files SET {set_sql} WHERE file_hash IN ({','.join('?' * len(batch))})",
+                batch,
+            ).rowcount
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return count
+
+
+@router.post("/api/skip-files")
+async def api_skip_files(body: FileHashesRequest):
+    """Skip several failed files at once (one commit for the whole batch)."""
+    registry_path = _get_registry_path()
+    if not registry_path.exists():
+        raise HTTPException(status_code=404, detail="Registry not found")
+    try:
+        count = _update_files_by_hash(SKIP_FILE_SET_SQL, body.hashes)
+        _invalidate_stats()
+        return {"success": True, "skipped_count": count}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/api/retry-files")
+async def api_retry_files(body: FileHashesRequest):
+    """Reset several failed files for immediate retry (one commit for the whole batch)."""
+    registry_path = _get_registry_path()
+    if not registry_path.exists():
+        raise HTTPException(status_code=404, detail="Registry not found")
+    try:
+        count = _update_files_by_hash(RETRY_FILE_SET_SQL, body.hashes)
+        _invalidate_stats()
+        return {"success": True, "reset_count": count}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/api/reset-exhausted-keys")
 async def api_reset_exhausted_keys(db: Session = Depends(get_db)):
     """Reset all exhausted API keys back to active."""
-    from .database import APIKey
     try:
         keys = db.query(APIKey).filter(APIKey.is_exhausted == True).all()
         for k in keys:
@@ -1205,7 +1694,6 @@ class KeyAddRequest(BaseModel):
 @router.post("/api/keys/add")
 async def api_add_key(body: KeyAddRequest, db: Session = Depends(get_db)):
     """Add a new API key."""
-    from .database import APIKey
     
     if len(body.key.strip()) < 20:
         raise HTTPException(status_code=400, detail="Invalid API key format (too short)")
@@ -1227,7 +1715,6 @@ async def api_add_key(body: KeyAddRequest, db: Session = Depends(get_db)):
 @router.post("/api/keys/{key_id}/toggle")
 async def api_toggle_key(key_id: int, db: Session = Depends(get_db)):
     """Toggle an API key's active status."""
-    from .database import APIKey
     k = db.query(APIKey).filter(APIKey.id == key_id).first()
     if not k:
         raise HTTPException(status_code=404, detail="Key not found")
@@ -1239,7 +1726,6 @@ async def api_toggle_key(key_id: int, db: Session = Depends(get_db)):
 @router.post("/api/keys/{key_id}/reset")
 async def api_reset_key(key_id: int, db: Session = Depends(get_db)):
     """Reset a single exhausted API key."""
-    from .database import APIKey
     k = db.query(APIKey).filter(APIKey.id == key_id).first()
     if not k:
         raise HTTPException(status_code=404, detail="Key not found")
@@ -1253,7 +1739,6 @@ async def api_reset_key(key_id: int, db: Session = Depends(get_db)):
 @router.delete("/api/keys/{key_id}")
 async def api_delete_key(key_id: int, db: Session = Depends(get_db)):
     """Delete an API key."""
-    from .database import APIKey
     k = db.query(APIKey).filter(APIKey.id == key_id).first()
     if not k:
         raise HTTPException(status_code=404, detail="Key not found")
@@ -1265,7 +1750,6 @@ async def api_delete_key(key_id: int, db: Session = Depends(get_db)):
 @router.get("/api/keys")
 async def api_list_keys(db: Session = Depends(get_db)):
     """List all API keys with status."""
-    from .database import APIKey
     keys = db.query(APIKey).order_by(APIKey.created_at).all()
     return {"keys": [
         {
@@ -1289,6 +1773,68 @@ async def api_list_keys(db: Session = Depends(get_db)):
 # CALENDAR / ROLLOVER ENDPOINTS
 # ============================================================================
 
+# First markdown heading of a rollup note
+MD_TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+
+
+def _list_rollups(rollup_dir: Path, prefix: str) -> list:
+    """Markdown files in rollup_dir whose name starts with prefix."""
+    try:
+        with os.scandir(rollup_dir) as it:
+            return [
+                Path(entry.path) for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith(".md") and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+# Rollup headings sit at the top of the file, so only this much is read
+ROLLUP_TITLE_READ_BYTES = 512
+
+
+def _rollup_title(path: Path) -> Optional[str]:
+    """Title of a rollup note (file stem if it has no heading), or None if unreadable."""
+    try:
+        with open(path, "rb") as fh:
+            head = fh.read(ROLLUP_TITLE_READ_BYTES)
+    except Exception:
+        return None
+    # Drop the last line: it may be cut mid-heading (or mid-character)
+    if len(head) == ROLLUP_TITLE_READ_BYTES:
+        head = head.rpartition(b"\n")[0]
+    title_match = MD_TITLE_RE.search(head.decode("utf-8", errors="ignore"))
+    return title_match.group(1) if title_match else path.stem
+
+
+def _collect_rollups(notes_dir: Path, year: int, month: int) -> tuple:
+    """The month's daily rollups (by date) and the year's weekly rollups, with titles."""
+    daily_rollups = {}
+    daily_files = _list_rollups(notes_dir / "Daily", f"{year}-{month:02d}-")
+    for f, title in zip(daily_files, _file_io_pool.map(_rollup_title, daily_files)):
+        # e.g., "2026-02-15"
+        if title is None:
+            daily_rollups[f.stem] = {"title": f.stem, "exists": True}
+        else:
+            daily_rollups[f.stem] = {"title": title, "path": str(f), "exists": True}
+
+    weekly_rollups = []
+    weekly_files = sorted(_list_rollups(notes_dir / "Weekly", f"{year}-W"))
+    for f, title in zip(weekly_files, _file_io_pool.map(_rollup_title, weekly_files)):
+        if title is None:
+            weekly_rollups.append({"filename": f.stem, "exists": True})
+        else:
+            weekly_rollups.append({"filename": f.stem, "title": title, "exists": True})
+    return daily_rollups, weekly_rollups
+
+
+def _month_bounds(year: int, month: int) -> tuple:
+    """ISO date strings [first day of month, first day of next month)."""
+    start = date(year, month, 1)
+    end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    return start.isoformat(), end.isoformat()
+
+
 @router.get("/api/calendar-data")
 async def api_calendar_data(
     year: int = 0,
@@ -1296,8 +1842,6 @@ async def api_calendar_data(
     db: Session = Depends(get_db),
 ):
     """Get calendar data: notes per day for heatmap + daily rollup content."""
-    import sqlite3
-    from .database import get_setting
 
     now = datetime.now()
     if year == 0:
@@ -1306,87 +1850,51 @@ async def api_calendar_data(
         month = now.month
 
     # Notes per day from registry
+    # Half-open ISO range on the timestamp, so idx_pf_ingested_processed is used
+    month_range = _month_bounds(year, month)
     daily_counts = {}
     daily_notes = {}
     registry_path = _get_registry_path()
     if registry_path.exists():
         try:
-            conn = sqlite3.connect(str(registry_path))
-            conn.row_factory = sqlite3.Row
-            # Get daily counts for the month
-            rows = conn.execute(
-                "SELECT DATE(COALESCE(ingested_at, processed_at)) as day, COUNT(*) as cnt, "
-                "SUM(CASE WHEN success=1 THEN 1 ELSE 0 END) as ok, "
-                "SUM(CASE WHEN success=0 THEN 1 ELSE 0 END) as fail "
-                "FROM processed_files "
-                "WHERE strftime('%Y', COALESCE(ingested_at, processed_at)) = ? AND strftime('%m', COALESCE(ingested_at, processed_at)) = ? "
-                "GROUP BY DATE(COALESCE(ingested_at, processed_at)) ORDER BY day",
-                (str(year), f"{month:02d}")
-            ).fetchall()
-            for row in rows:
-                daily_counts[row["day"]] = {
-                    "total": row["cnt"], "success": row["ok"], "failed": row["fail"]
-                }
-
-            # Get individual notes for the month
+            conn = _get_registry_conn()
+            # One pass over the month builds both the heatmap counts and the per-day notes
             note_rows = conn.execute(
                 "SELECT id, filename, title, mode, COALESCE(ingested_at, processed_at) as processed_at, success, error, "
                 "duration_seconds, file_hash, has_tasks "
                 "FROM processed_files "
-                "WHERE strftime('%Y', COALESCE(ingested_at, processed_at)) = ? AND strftime('%m', COALESCE(ingested_at, processed_at)) = ? "
+                "WHERE COALESCE(ingested_at, processed_at) >= ? AND COALESCE(ingested_at, processed_at) < ? "
                 "ORDER BY COALESCE(ingested_at, processed_at) DESC",
-                (str(year), f"{month:02d}")
+                month_range
             ).fetchall()
-            conn.close()
             for row in note_rows:
                 d = dict(row)
                 day = d["processed_at"][:10] if d.get("processed_at") else None
-                if day:
-                    if day not in daily_notes:
-                        daily_notes[day] = []
-                    daily_notes[day].append(d)
+                if not day:
+                    continue
+                counts = daily_counts.get(day)
+                if counts is None:
+                    counts = daily_counts[day] = {"total": 0, "success": 0, "failed": 0}
+                    daily_notes[day] = []
+                counts["total"] += 1
+                if d["success"] == 1:
+                    counts["success"] += 1
+                elif d["success"] == 0:
+                    counts["failed"] += 1
+                daily_notes[day].append(d)
+            # Keep the heatmap keyed in day order
+            daily_counts = dict(sorted(daily_counts.items()))
         except Exception as e:
             logger.error(f"Calendar data error: {e}")
 
     # Check for daily rollup files
     vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
     note_subdir = get_setting(db, "OBSIDIAN_NOTE_SUBDIR", "VoiceNotes")
-    daily_rollups = {}
-    if vault_dir:
-        daily_dir = Path(vault_dir) / note_subdir / "Daily"
-        if daily_dir.exists():
-            for f in daily_dir.glob(f"{year}-{month:02d}-*.md"):
-                day = f.stem  # e.g., "2026-02-15"
-                try:
-                    content = f.read_text(encoding="utf-8")
-                    # Extract title
-                    import re
-                    title_match = re.search(r"^# (.+)$", content, re.MULTILINE)
-                    daily_rollups[day] = {
-                        "title": title_match.group(1) if title_match else f.stem,
-                        "path": str(f),
-                        "exists": True,
-                    }
-                except Exception:
-                    daily_rollups[day] = {"title": f.stem, "exists": True}
-
-    # Weekly rollups
-    weekly_rollups = []
+    daily_rollups, weekly_rollups = {}, []
     if vault_dir:
-        weekly_dir = Path(vault_dir) / note_subdir / "Weekly"
-        if weekly_dir.exists():
-            for f in sorted(weekly_dir.glob(f"{year}-W*.md")):
-                try:
-                    content = f.read_text(encoding="utf-8")
-                    import re
-                    title_match = re.search(r"^# (.+)$", content, re.MULTILINE)
-                    weekly_rollups.append({
-                        "filename": f.stem,
-                        "title": title_match.group(1) if title_match else f.stem,
-                        "exists": True,
-                    })
-                except Exception:
-                    weekly_rollups.append({"filename": f.stem, "exists": True})
+        daily_rollups, weekly_rollups = await asyncio.to_thread(
+            _collect_rollups, Path(vault_dir) / note_subdir, year, month
+        )
 
     return {
         "year": year,
@@ -1402,6 +1910,49 @@ async def api_calendar_data(
 # ARCHIVE ENDPOINTS
 # ============================================================================
 
+# Archive status filter -> the _get_v2_stats() counter with its row count
+ARCHIVE_STATUS_TOTALS = {
+    "all": "total_notes",
+    "completed": "success",
+    "failed": "failed",
+}
+
+
+# Columns the archive table renders
+ARCHIVE_LIST_COLUMNS = (
+    "id, filename, title, mode, COALESCE(ingested_at, processed_at) as processed_at, "
+    "success, duration_seconds, CASE WHEN success = 1 THEN 'completed' ELSE 'failed' END as status"
+)
+# Extra per-row fields returned with full=true
+ARCHIVE_DETAIL_COLUMNS = ", error, file_hash, retry_count, skipped, has_tasks"
+
+
+@functools.lru_cache(maxsize=32)
+def _archive_sql(status: str, has_from: bool, has_to: bool, full: bool) -> tuple:
+    """(count SQL, page SQL) for one archive filter shape.
+    
+    Reusing identical SQL strings keeps hits in sqlite3's per-connection
+    statement cache instead of re-preparing every page request.
+    """
+    where_clauses = []
+    if status == "completed":
+        where_clauses.append("success = 1")
+    elif status == "failed":
+        where_clauses.append("success = 0")
+    if has_from:
+        where_clauses.append("DATE(processed_at) >= ?")
+    if has_to:
+        where_clauses.append("DATE(processed_at) <= ?")
+
+    where_sql = (" WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+    columns = ARCHIVE_LIST_COLUMNS + (ARCHIVE_DETAIL_COLUMNS if full else "")
+    return (
+        f"SELECT COUNT(*) FROM processed_files{where_sql}",
+        f"SELECT {columns} FROM processed_files{where_sql} "
+        f"ORDER BY COALESCE(ingested_at, processed_at) DESC LIMIT ? OFFSET ?",
+    )
+
+
 @router.get("/api/archive")
 async def api_archive(
     page: int = 1,
@@ -1409,54 +1960,33 @@ async def api_archive(
     status: str = "all",
     from_date: str = "",
     to_date: str = "",
+    full: bool = False,
 ):
-    """Get paginated archive of all processed files."""
-    import sqlite3
+    """Get paginated archive of all processed files.
+    
+    Items carry the columns the archive table shows; pass full=true for
+    error, hash and retry fields too.
+    """
     registry_path = _get_registry_path()
     if not registry_path.exists():
         return {"items": [], "total": 0, "page": page, "per_page": per_page}
 
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
+        conn = _get_registry_conn()
+        count_sql, page_sql = _archive_sql(status, bool(from_date), bool(to_date), full)
+        params = [d for d in (from_date, to_date) if d]
 
-        where_clauses = []
-        params = []
-
-        if status == "completed":
-            where_clauses.append("success = 1")
-        elif status == "failed":
-            where_clauses.append("success = 0")
-
-        if from_date:
-            where_clauses.append("DATE(processed_at) >= ?")
-            params.append(from_date)
-        if to_date:
-            where_clauses.append("DATE(processed_at) <= ?")
-            params.append(to_date)
-
-        where_sql = (" WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
-
-        total = conn.execute(f"SELECT COUNT(*) FROM processed_files{where_sql}", params).fetchone()[0]
+        if from_date or to_date:
+            total = _plain_cursor(conn).execute(count_sql, params).fetchone()[0]
+        else:
+            # Unfiltered by date: the counters are already in the cached registry stats
+            total = _cached_stats()[ARCHIVE_STATUS_TOTALS.get(status, "total_notes")]
 
         offset = (page - 1) * per_page
-        rows = conn.execute(
-            f"SELECT id, filename, title, mode, COALESCE(ingested_at, processed_at) as processed_at, success, error, "
-            f"duration_seconds, file_hash, retry_count, skipped, has_tasks "
-            f"FROM processed_files{where_sql} "
-            f"ORDER BY COALESCE(ingested_at, processed_at) DESC LIMIT ? OFFSET ?",
-            params + [per_page, offset]
-        ).fetchall()
-        conn.close()
-
-        items = []
-        for row in rows:
-            d = dict(row)
-            d["status"] = "completed" if d["success"] else "failed"
-            items.append(d)
+        rows = conn.execute(page_sql, params + [per_page, offset]).fetchall()
 
         return {
-            "items": items,
+            "items": [dict(row) for row in rows],
             "total": total,
             "page": page,
             "per_page": per_page,
@@ -1473,16 +2003,14 @@ async def api_archive(
 @router.delete("/api/registry/{note_id}")
 async def api_delete_registry_note(note_id: int):
     """Delete a processed file entry from the registry."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
+        conn = _get_registry_conn()
         cursor = conn.execute("DELETE FROM processed_files WHERE id = ?", (note_id,))
-        conn.commit()
         deleted = cursor.rowcount
-        conn.close()
+        _invalidate_stats()
         if deleted == 0:
             raise HTTPException(status_code=404, detail="Note not found")
         return {"success": True}
@@ -1495,16 +2023,14 @@ async def api_delete_registry_note(note_id: int):
 @router.post("/api/registry/{note_id}/reprocess")
 async def api_reprocess_registry_note(note_id: int):
     """Reprocess a registry note by deleting it so the watcher picks it up again."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
+        conn = _get_registry_conn()
         cursor = conn.execute("DELETE FROM processed_files WHERE id = ?", (note_id,))
-        conn.commit()
         deleted = cursor.rowcount
-        conn.close()
+        _invalidate_stats()
         if deleted == 0:
             raise HTTPException(status_code=404, detail="Note not found")
         return {"success": True, "message": "Entry removed from registry. Watcher will reprocess on next scan."}
@@ -1517,19 +2043,15 @@ async def api_reprocess_registry_note(note_id: int):
 @router.get("/api/registry/{note_id}/preview")
 async def api_registry_preview(note_id: int, db: Session = Depends(get_db)):
     """Fetch content & transcript for a registry note (used by inbox preview)."""
-    import sqlite3
-    from .database import get_setting
 
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
 
-    conn = sqlite3.connect(str(registry_path))
-    conn.row_factory = sqlite3.Row
+    conn = _get_registry_conn()
     row = conn.execute(
         "SELECT note_path, transcript_path, audio_path FROM processed_files WHERE id = ?", (note_id,)
     ).fetchone()
-    conn.close()
 
     if not row:
         raise HTTPException(status_code=404, detail="Note not found")
@@ -1537,39 +2059,17 @@ async def api_registry_preview(note_id: int, db: Session = Depends(get_db)):
     d = dict(row)
     vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
 
-    def _try_read(path_str):
-        if not path_str:
-            return ""
-        try:
-            p = Path(path_str)
-            if p.exists():
-                return p.read_text(encoding="utf-8")
-        except Exception:
-            pass
-        if vault_dir:
-            try:
-                p = Path(vault_dir) / path_str
-                if p.exists():
-                    return p.read_text(encoding="utf-8")
-            except Exception:
-                pass
-        return ""
-
-    # Build audio URL if audio file exists
-    audio_url = None
-    audio_path_str = d.get("audio_path", "")
-    if audio_path_str:
-        try:
-            audio_path = Path(audio_path_str)
-            if audio_path.exists():
-                audio_url = f"/v2/api/registry/{note_id}/audio"
-        except Exception:
-            pass
+    # Independent file probes - run them concurrently
+    content, transcript, has_audio = await asyncio.gather(
+        asyncio.to_thread(_read_vault_file, d.get("note_path"), vault_dir),
+        asyncio.to_thread(_read_vault_file, d.get("transcript_path"), vault_dir),
+        asyncio.to_thread(_file_exists, d.get("audio_path")),
+    )
 
     return {
-        "content": _try_read(d.get("note_path")),
-        "transcript": _try_read(d.get("transcript_path")),
-        "audio_url": audio_url,
+        "content": content,
+        "transcript": transcript,
+        "audio_url": f"/v2/api/registry/{note_id}/audio" if has_audio else None,
     }
 
 
@@ -1577,76 +2077,136 @@ async def api_registry_preview(note_id: int, db: Session = Depends(get_db)):
 # TAGS & PROJECTS ENDPOINTS
 # ============================================================================
 
+# Notes per raw tag/project string, from the inverted index tables (the join
+# skips rows orphaned by INSERT OR REPLACE since the last cleanup)
+_LIST_COUNTS_SQL = """
+    SELECT t.{field}, COUNT(*)
+    FROM {table} t JOIN processed_files pf ON pf.id = t.note_id
+    GROUP BY t.{field}
+"""
+_TAG_COUNTS_SQL = _LIST_COUNTS_SQL.format(table="note_tags", field="tag")
+_PROJECT_COUNTS_SQL = _LIST_COUNTS_SQL.format(table="note_projects", field="project")
+
+
+# Sidebar tag/project lists - reused while the registry (and projects folder) is unchanged
+TAG_LIST_TTL_SECONDS = 5.0
+_tags_cache = {"t": 0.0, "key": None, "v": None}
+_projects_cache = {"t": 0.0, "key": None, "v": None}
+
+
+def _mtime_ns(path) -> int:
+    """A path's mtime in ns, or 0 if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _registry_signature(registry_path: Path) -> tuple:
+    """Changes whenever the registry is written (commits land in the WAL file first)."""
+    wal_path = f"{registry_path}-wal"
+    try:
+        wal_size = os.stat(wal_path).st_size
+    except OSError:
+        wal_size = 0
+    return (_mtime_ns(registry_path), _mtime_ns(wal_path), wal_size)
+
+
+def _invalidate_tag_lists():
+    """Force the next all-tags/all-projects calls to recompute (call after tag/project edits)."""
+    _tags_cache["v"] = None
+    _projects_cache["v"] = None
+
+
 @router.get("/api/all-tags")
 async def api_all_tags():
     """Get all unique tags from the registry with counts."""
-    import sqlite3, json
+    return {"tags": await asyncio.to_thread(_cached_tag_counts)}
+
+
+def _cached_tag_counts() -> list:
+    """_collect_tag_counts(), reused for TAG_LIST_TTL_SECONDS while the registry is unchanged."""
+    key = _registry_signature(_get_registry_path())
+    now = time.monotonic()
+    if _tags_cache["v"] is None or _tags_cache["key"] != key or now - _tags_cache["t"] >= TAG_LIST_TTL_SECONDS:
+        _tags_cache["v"] = _collect_tag_counts()
+        _tags_cache["key"] = key
+        _tags_cache["t"] = now
+    return _tags_cache["v"]
+
+
+def _collect_tag_counts() -> list:
+    """Registry tags with counts, most used first."""
     registry_path = _get_registry_path()
     if not registry_path.exists():
-        return {"tags": []}
+        return []
     
-    conn = sqlite3.connect(str(registry_path))
-    conn.row_factory = sqlite3.Row
-    rows = conn.execute("SELECT tags FROM processed_files WHERE tags IS NOT NULL AND tags != '[]'").fetchall()
-    conn.close()
+    conn = _get_registry_conn()
+    rows = _plain_cursor(conn).execute(_TAG_COUNTS_SQL).fetchall()
     
-    # Aggregate tags with counts
-    tag_counts = {}
-    for row in rows:
-        try:
-            tags = json.loads(row["tags"] or "[]")
-            for tag in tags:
-                tag = tag.strip().lower() if tag else ""
-                if tag:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        except (json.JSONDecodeError, TypeError):
-            pass
+    # Fold the (few) distinct raw tags case-insensitively
+    tag_counts = Counter()
+    for tag, count in rows:
+        tag = tag.strip().lower()
+        if tag:
+            tag_counts[tag] += count
     
     # Sort by count desc, then alphabetically
     sorted_tags = sorted(tag_counts.items(), key=lambda x: (-x[1], x[0]))
-    return {"tags": [{"name": t[0], "count": t[1]} for t in sorted_tags]}
+    return [{"name": t[0], "count": t[1]} for t in sorted_tags]
 
 
 @router.get("/api/all-projects")
 async def api_all_projects(db: Session = Depends(get_db)):
     """Get all unique projects from the registry with counts, plus user-created project folders."""
-    import sqlite3, json
-    from .database import get_setting
-    
+    vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
+    note_subdir = get_setting(db, "OBSIDIAN_NOTE_SUBDIR", "VoiceNotes")
+    return await asyncio.to_thread(_cached_projects, vault_dir, note_subdir)
+
+
+def _cached_projects(vault_dir: str, note_subdir: str) -> dict:
+    """_collect_projects(), reused for TAG_LIST_TTL_SECONDS while the registry and projects folder are unchanged."""
+    projects_mtime = _mtime_ns(Path(vault_dir) / note_subdir / "Projects") if vault_dir else 0
+    key = (_registry_signature(_get_registry_path()), vault_dir, note_subdir, projects_mtime)
+    now = time.monotonic()
+    if _projects_cache["v"] is None or _projects_cache["key"] != key or now - _projects_cache["t"] >= TAG_LIST_TTL_SECONDS:
+        _projects_cache["v"] = _collect_projects(vault_dir, note_subdir)
+        _projects_cache["key"] = key
+        _projects_cache["t"] = now
+    return _projects_cache["v"]
+
+
+def _collect_projects(vault_dir: str, note_subdir: str) -> dict:
+    """Registry project counts merged with the vault's project folders."""
     registry_path = _get_registry_path()
-    project_counts = {}
+    project_counts = Counter()
     
     # Get projects from registry
     if registry_path.exists():
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute("SELECT projects FROM processed_files WHERE projects IS NOT NULL AND projects != '[]'").fetchall()
-        conn.close()
+        conn = _get_registry_conn()
+        rows = _plain_cursor(conn).execute(_PROJECT_COUNTS_SQL).fetchall()
         
-        for row in rows:
-            try:
-                projects = json.loads(row["projects"] or "[]")
-                for proj in projects:
-                    proj = proj.strip() if proj else ""
-                    if proj:
-                        project_counts[proj] = project_counts.get(proj, 0) + 1
-            except (json.JSONDecodeError, TypeError):
-                pass
+        for proj, count in rows:
+            proj = proj.strip()
+            if proj:
+                project_counts[proj] += count
     
     # Also check for project folders in Obsidian
-    vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
-    note_subdir = get_setting(db, "OBSIDIAN_NOTE_SUBDIR", "VoiceNotes")
-    project_folders = []
+    project_folders = set()
     
     if vault_dir:
         projects_dir = Path(vault_dir) / note_subdir / "Projects"
-        if projects_dir.exists():
-            for folder in projects_dir.iterdir():
-                if folder.is_dir():
-                    folder_name = folder.name
-                    if folder_name not in project_counts:
-                        project_counts[folder_name] = 0
-                    project_folders.append(folder_name)
+        try:
+            # DirEntry.is_dir() uses the d_type from the directory read - no stat per folder
+            with os.scandir(projects_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        folder_name = entry.name
+                        if folder_name not in project_counts:
+                            project_counts[folder_name] = 0
+                        project_folders.add(folder_name)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
     
     # Sort by count desc, then alphabetically
     sorted_projects = sorted(project_counts.items(), key=lambda x: (-x[1], x[0]))
@@ -1659,7 +2219,6 @@ async def api_all_projects(db: Session = Depends(get_db)):
 @router.post("/api/projects")
 async def api_create_project(request: Request, db: Session = Depends(get_db)):
     """Create a new project folder in Obsidian. Body: { "name": "Project Name" }"""
-    from .database import get_setting
     
     body = await request.json()
     name = body.get("name", "").strip()
@@ -1680,6 +2239,7 @@ async def api_create_project(request: Request, db: Session = Depends(get_db)):
     
     try:
         project_folder.mkdir(parents=True, exist_ok=True)
+        _invalidate_tag_lists()
         return {"success": True, "name": name, "path": str(project_folder)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1688,8 +2248,6 @@ async def api_create_project(request: Request, db: Session = Depends(get_db)):
 @router.delete("/api/projects/{project_name}")
 async def api_delete_project(project_name: str, db: Session = Depends(get_db)):
     """Delete a project folder (must be empty). URL encoded project name."""
-    from .database import get_setting
-    import urllib.parse
     
     name = urllib.parse.unquote(project_name)
     
@@ -1703,23 +2261,81 @@ async def api_delete_project(project_name: str, db: Session = Depends(get_db)):
     if not project_folder.exists():
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Check if folder is empty
-    contents = list(project_folder.iterdir())
-    if contents:
-        raise HTTPException(status_code=400, detail=f"Project folder is not empty ({len(contents)} items)")
+    # Check if folder is empty - stop at the first entry
+    with os.scandir(project_folder) as it:
+        if next(it, None) is not None:
+            raise HTTPException(status_code=400, detail="Project folder is not empty")
     
     try:
         project_folder.rmdir()
+        _invalidate_tag_lists()
         return {"success": True, "name": name}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Frontmatter longer than this is treated as "no frontmatter"
+FRONTMATTER_MAX_BYTES = 64 * 1024
+COPY_CHUNK_BYTES = 1024 * 1024
+
+
+def _patch_frontmatter(path: Path, key: str, yaml_line: str, insert_after: Optional[str] = None) -> bool:
+    """Set one `key: ...` line in a note's YAML frontmatter.
+    
+    Only the frontmatter is read and rewritten; the body is streamed to a
+    temp file in the same directory, which then atomically replaces the note.
+    If `key` is missing it is inserted after the `insert_after` line. Returns
+    False (file untouched) if there is no frontmatter or nowhere to put the line.
+    """
+    prefix = key.encode() + b":"
+    with open(path, "rb") as src:
+        first = src.readline()
+        if first.rstrip(b"\r\n") != b"---":
+            return False
+        header = []
+        size = len(first)
+        while True:
+            line = src.readline()
+            size += len(line)
+            if not line or size > FRONTMATTER_MAX_BYTES:
+                return False
+            if line.rstrip(b"\r\n") == b"---":
+                closing = line
+                break
+            header.append(line)
+        
+        newline = b"\r\n" if first.endswith(b"\r\n") else b"\n"
+        new_line = yaml_line.encode("utf-8") + newline
+        idx = next((i for i, line in enumerate(header) if line.startswith(prefix)), None)
+        if idx is not None:
+            header[idx] = new_line
+        elif insert_after:
+            anchor = insert_after.encode() + b":"
+            idx = next((i for i, line in enumerate(header) if line.startswith(anchor)), None)
+            if idx is None:
+                return False
+            header.insert(idx + 1, new_line)
+        else:
+            return False
+        
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst:
+                dst.write(first)
+                dst.writelines(header)
+                dst.write(closing)
+                shutil.copyfileobj(src, dst, COPY_CHUNK_BYTES)
+            shutil.copymode(path, tmp_name)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    return True
+
+
 @router.put("/api/registry/{note_id}/tags")
 async def api_update_tags(note_id: int, request: Request, db: Session = Depends(get_db)):
     """Update tags for a registry note and sync to Obsidian file. Body: { "tags": ["tag1", "tag2"] }"""
-    import sqlite3, json, re
-    from .database import get_setting
     
     body = await request.json()
     tags = body.get("tags", [])
@@ -1727,37 +2343,8 @@ async def api_update_tags(note_id: int, request: Request, db: Session = Depends(
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
-        
-        # Get the note path first
-        row = conn.execute("SELECT note_path FROM processed_files WHERE id = ?", (note_id,)).fetchone()
-        if not row:
-            conn.close()
-            raise HTTPException(status_code=404, detail="Note not found")
-        
-        note_path = row["note_path"]
-        
-        # Update registry
-        conn.execute("UPDATE processed_files SET tags = ? WHERE id = ?", (json.dumps(tags), note_id))
-        conn.commit()
-        conn.close()
-        
-        # Update Obsidian file if it exists
-        obsidian_updated = False
-        if note_path:
-            file_path = Path(note_path)
-            if file_path.exists():
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    # Update tags in frontmatter
-                    tags_yaml = f"tags: [{', '.join(repr(t) for t in tags)}]" if tags else "tags: []"
-                    content = re.sub(r'^tags:.*$', tags_yaml, content, count=1, flags=re.MULTILINE)
-                    file_path.write_text(content, encoding="utf-8")
-                    obsidian_updated = True
-                except Exception as e:
-                    logger.warning(f"Failed to update Obsidian file: {e}")
-        
+        obsidian_updated = await asyncio.to_thread(_set_note_tags, note_id, tags)
+        _invalidate_tag_lists()
         return {"success": True, "tags": tags, "obsidian_updated": obsidian_updated}
     except HTTPException:
         raise
@@ -1765,11 +2352,107 @@ async def api_update_tags(note_id: int, request: Request, db: Session = Depends(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# UPDATE ... RETURNING needs SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def _set_note_column(note_id: int, column: str, value: str) -> Optional[str]:
+    """Set one registry column for a note and return its note_path (404 if no such note)."""
+    conn = _get_registry_conn()
+    if SQLITE_HAS_RETURNING:
+        row = conn.execute(
+            f"UPDATE processed_files SET {column} = ? WHERE id = ? RETURNING note_path", (value, note_id)
+        ).fetchone()
+    else:
+        row = conn.execute("SELECT note_path FROM processed_files WHERE id = ?", (note_id,)).fetchone()
+        if row:
+            conn.execute(f"UPDATE processed_files SET {column} = ? WHERE id = ?", (value, note_id))
+    if not row:
+        raise HTTPException(status_code=404, detail="Note not found")
+    return row["note_path"]
+
+
+def _set_note_tags(note_id: int, tags: list) -> bool:
+    """Store a note's tags in the registry and its Obsidian frontmatter.
+    
+    Returns whether the Obsidian file was updated.
+    """
+    # Update registry
+    note_path = _set_note_column(note_id, "tags", _json_dumps(tags))
+    return _sync_note_tags_file(note_path, tags)
+
+
+def _sync_note_tags_file(note_path: Optional[str], tags: list) -> bool:
+    """Update tags in the Obsidian file's frontmatter if it exists. Returns whether it was updated."""
+    if not note_path:
+        return False
+    # A JSON array is valid YAML flow syntax (and quotes correctly, unlike repr)
+    tags_yaml = f"tags: {json.dumps(tags, ensure_ascii=False)}"
+    try:
+        return _patch_frontmatter(Path(note_path), "tags", tags_yaml)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to update Obsidian file: {e}")
+    return False
+
+
+@router.post("/api/registry/tags/bulk")
+async def api_update_tags_bulk(body: BulkTagsRequest):
+    """Update tags for several registry notes (one commit for the whole batch) and sync their Obsidian files.
+    
+    Body: { "updates": [{"id": 1, "tags": ["tag1"]}, ...] }
+    """
+    registry_path = _get_registry_path()
+    if not registry_path.exists():
+        raise HTTPException(status_code=404, detail="Registry not found")
+    try:
+        # Last update wins if a note is listed twice
+        updates = {u.id: u.tags for u in body.updates}
+        note_paths = await asyncio.to_thread(_set_tags_bulk, updates)
+        _invalidate_tag_lists()
+        results = await asyncio.gather(*[
+            asyncio.to_thread(_sync_note_tags_file, note_path, updates[note_id])
+            for note_id, note_path in note_paths.items()
+        ])
+        return {
+            "success": True,
+            "updated": len(note_paths),
+            "obsidian_updated": sum(results),
+            "not_found": [note_id for note_id in updates if note_id not in note_paths],
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _set_tags_bulk(updates: dict) -> dict:
+    """Store tags for several notes in one transaction. Returns {note_id: note_path} for notes that exist."""
+    conn = _get_registry_conn()
+    ids = list(updates)
+    note_paths = {}
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(
+            "UPDATE processed_files SET tags = ? WHERE id = ?",
+            [(_json_dumps(tags), note_id) for note_id, tags in updates.items()],
+        )
+        for i in range(0, len(ids), REGISTRY_IN_BATCH):
+            batch = ids[i:i + REGISTRY_IN_BATCH]
+            rows = _plain_cursor(conn).execute(
+                f"SELECT id, note_path FROM processed_files WHERE id IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            note_paths.update(rows)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return note_paths
+
+
 @router.put("/api/registry/{note_id}/projects")
 async def api_update_projects(note_id: int, request: Request, db: Session = Depends(get_db)):
     """Update project assignments for a registry note and sync to Obsidian file. Body: { "projects": ["proj1"] }"""
-    import sqlite3, json, re
-    from .database import get_setting
     
     body = await request.json()
     projects = body.get("projects", [])
@@ -1777,60 +2460,17 @@ async def api_update_projects(note_id: int, request: Request, db: Session = Depe
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
     try:
-        conn = sqlite3.connect(str(registry_path))
-        conn.row_factory = sqlite3.Row
-        
-        # Get the note path first
-        row = conn.execute("SELECT note_path FROM processed_files WHERE id = ?", (note_id,)).fetchone()
-        if not row:
-            conn.close()
-            raise HTTPException(status_code=404, detail="Note not found")
-        
-        note_path = row["note_path"]
-        
-        # Update registry
-        conn.execute("UPDATE processed_files SET projects = ? WHERE id = ?", (json.dumps(projects), note_id))
-        conn.commit()
-        conn.close()
-        
-        # Update Obsidian file if it exists
-        obsidian_updated = False
-        vault_dir = get_setting(db, "OBSIDIAN_VAULT_DIR", "")
-        
-        if note_path:
-            file_path = Path(note_path)
-            if file_path.exists():
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    
-                    # Check if projects field exists in frontmatter
-                    projects_yaml = f"projects: [{', '.join(repr(p) for p in projects)}]" if projects else "projects: []"
-                    
-                    if re.search(r'^projects:', content, flags=re.MULTILINE):
-                        # Update existing projects field
-                        content = re.sub(r'^projects:.*$', projects_yaml, content, count=1, flags=re.MULTILINE)
-                    else:
-                        # Add projects field after tags
-                        content = re.sub(r'^(tags:.*?)$', r'\1\n' + projects_yaml, content, count=1, flags=re.MULTILINE)
-                    
-                    file_path.write_text(content, encoding="utf-8")
-                    obsidian_updated = True
-                except Exception as e:
-                    logger.warning(f"Failed to update Obsidian file: {e}")
-        
-        # Create project folders if they don't exist
-        folders_created = []
-        if vault_dir and projects:
-            note_subdir = get_setting(db, "OBSIDIAN_NOTE_SUBDIR", "VoiceNotes")
-            projects_dir = Path(vault_dir) / note_subdir / "Projects"
-            projects_dir.mkdir(parents=True, exist_ok=True)
-            
-            for proj in projects:
-                proj_folder = projects_dir / proj
-                if not proj_folder.exists():
-                    proj_folder.mkdir(parents=True, exist_ok=True)
-                    folders_created.append(proj)
+        settings = get_settings_many(
+            db, ["OBSIDIAN_VAULT_DIR", "OBSIDIAN_NOTE_SUBDIR"], {"OBSIDIAN_NOTE_SUBDIR": "VoiceNotes"}
+        )
+        projects_dir = None
+        if settings["OBSIDIAN_VAULT_DIR"]:
+            projects_dir = Path(settings["OBSIDIAN_VAULT_DIR"]) / settings["OBSIDIAN_NOTE_SUBDIR"] / "Projects"
         
+        obsidian_updated, folders_created = await asyncio.to_thread(
+            _set_note_projects, note_id, projects, projects_dir
+        )
+        _invalidate_tag_lists()
         return {"success": True, "projects": projects, "obsidian_updated": obsidian_updated, "folders_created": folders_created}
     except HTTPException:
         raise
@@ -1838,22 +2478,68 @@ async def api_update_projects(note_id: int, request: Request, db: Session = Depe
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _set_note_projects(note_id: int, projects: list, projects_dir: Optional[Path]) -> tuple:
+    """Store a note's projects in the registry and its Obsidian frontmatter.
+    
+    Creates any missing project folders under projects_dir (if the vault is
+    configured). Returns (obsidian_updated, folders_created).
+    """
+    # Update registry
+    note_path = _set_note_column(note_id, "projects", _json_dumps(projects))
+    
+    # Update projects in the Obsidian file's frontmatter (added after tags if missing)
+    obsidian_updated = False
+    if note_path:
+        projects_yaml = f"projects: {json.dumps(projects, ensure_ascii=False)}"
+        try:
+            obsidian_updated = _patch_frontmatter(Path(note_path), "projects", projects_yaml, insert_after="tags")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to update Obsidian file: {e}")
+    
+    # Create project folders if they don't exist
+    folders_created = []
+    if projects_dir and projects:
+        projects_dir.mkdir(parents=True, exist_ok=True)
+        
+        for proj in projects:
+            proj_folder = projects_dir / proj
+            try:
+                os.mkdir(proj_folder)
+            except FileExistsError:
+                continue
+            except FileNotFoundError:
+                # Nested project path (e.g. "Work/Client") - create parents too
+                os.makedirs(proj_folder, exist_ok=True)
+            folders_created.append(proj)
+    
+    return obsidian_updated, folders_created
+
+
 @router.get("/api/registry/{note_id}/download/{file_type}")
 async def api_download_file(note_id: int, file_type: str):
     """Download note content or transcript as a file. file_type: 'note' or 'transcript'."""
-    import sqlite3
-    from .database import get_db as _get_db_raw
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
 
-    conn = sqlite3.connect(str(registry_path))
-    conn.row_factory = sqlite3.Row
+    file_path, download_name = await asyncio.to_thread(_resolve_download, note_id, file_type)
+    # Streamed from disk rather than loaded into memory
+    return FileResponse(
+        path=str(file_path),
+        media_type="text/markdown; charset=utf-8",
+        filename=download_name,
+    )
+
+
+def _resolve_download(note_id: int, file_type: str) -> tuple:
+    """(path on disk, download filename) of a registry note's note or transcript file."""
+    conn = _get_registry_conn()
     row = conn.execute(
         "SELECT filename, note_path, transcript_path FROM processed_files WHERE id = ?",
         (note_id,)
     ).fetchone()
-    conn.close()
 
     if not row:
         raise HTTPException(status_code=404, detail="Note not found")
@@ -1865,51 +2551,74 @@ async def api_download_file(note_id: int, file_type: str):
     if not file_path_str:
         raise HTTPException(status_code=404, detail=f"No {file_type} file path stored")
 
-    # Try absolute path, then vault-relative
-    from pathlib import Path as PPath
-    content = ""
-    for try_path in [PPath(file_path_str)]:
-        if try_path.exists():
-            content = try_path.read_text(encoding="utf-8")
-            break
-
-    if not content:
-        # Try vault-relative
-        vault_dir = os.environ.get("OBSIDIAN_VAULT_DIR", "")
-        if vault_dir:
-            try_path = PPath(vault_dir) / file_path_str
-            if try_path.exists():
-                content = try_path.read_text(encoding="utf-8")
-
-    if not content:
+    # Try absolute path, then vault-relative (empty files count as missing)
+    candidates = [Path(file_path_str)]
+    vault_dir = os.environ.get("OBSIDIAN_VAULT_DIR", "")
+    if vault_dir:
+        candidates.append(Path(vault_dir) / file_path_str)
+    file_path = next((p for p in candidates if _nonempty_file(p)), None)
+
+    if file_path is None:
         raise HTTPException(status_code=404, detail=f"{file_type.title()} file not found on disk")
 
-    stem = PPath(d["filename"]).stem
+    stem = Path(d["filename"]).stem
     suffix = "note" if file_type == "note" else "transcript"
     download_name = f"{stem}_{suffix}.md"
+    return file_path, download_name
 
-    from fastapi.responses import Response
-    return Response(
-        content=content,
-        media_type="text/markdown; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{download_name}"'}
-    )
+
+def _nonempty_file(path: Path) -> bool:
+    """True if path is a regular file with content (one stat)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and st.st_size > 0
+
+
+# Stored audio extension -> MIME type for the audio player
+AUDIO_MIME_TYPES = {
+    ".opus": "audio/ogg",
+    ".ogg": "audio/ogg",
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/mp4",
+    ".wav": "audio/wav",
+    ".webm": "audio/webm",
+    ".aac": "audio/aac",
+    ".flac": "audio/flac",
+}
 
 
 @router.get("/api/registry/{note_id}/audio")
 async def api_registry_audio(note_id: int):
     """Serve stored compressed audio for a registry note."""
-    import sqlite3
     registry_path = _get_registry_path()
     if not registry_path.exists():
         raise HTTPException(status_code=404, detail="Registry not found")
 
-    conn = sqlite3.connect(str(registry_path))
-    conn.row_factory = sqlite3.Row
+    audio_path, filename, audio_stat = await asyncio.to_thread(_resolve_registry_audio, note_id)
+
+    # Determine MIME type from extension
+    mime = AUDIO_MIME_TYPES.get(audio_path.suffix.lower(), "audio/ogg")
+
+    return FileResponse(
+        path=str(audio_path),
+        media_type=mime,
+        filename=filename,
+        stat_result=audio_stat,
+    )
+
+
+def _resolve_registry_audio(note_id: int) -> tuple:
+    """(audio path, original filename, stat result) for a registry note, or 404.
+    
+    The stat result is handed to FileResponse so each (range) request stats
+    the file once.
+    """
+    conn = _get_registry_conn()
     row = conn.execute(
         "SELECT audio_path, filename FROM processed_files WHERE id = ?", (note_id,)
     ).fetchone()
-    conn.close()
 
     if not row:
         raise HTTPException(status_code=404, detail="Note not found")
@@ -1919,26 +2628,10 @@ async def api_registry_audio(note_id: int):
         raise HTTPException(status_code=404, detail="No audio stored for this note")
 
     audio_path = Path(audio_path_str)
-    if not audio_path.exists():
+    try:
+        audio_stat = os.stat(audio_path)
+    except OSError:
+        audio_stat = None
+    if audio_stat is None or not stat.S_ISREG(audio_stat.st_mode):
         raise HTTPException(status_code=404, detail="Audio file not found on disk")
-
-    # Determine MIME type from extension
-    ext = audio_path.suffix.lower()
-    mime_map = {
-        ".opus": "audio/ogg",
-        ".ogg": "audio/ogg",
-        ".mp3": "audio/mpeg",
-        ".m4a": "audio/mp4",
-        ".wav": "audio/wav",
-        ".webm": "audio/webm",
-        ".aac": "audio/aac",
-        ".flac": "audio/flac",
-    }
-    mime = mime_map.get(ext, "audio/ogg")
-
-    from fastapi.responses import FileResponse
-    return FileResponse(
-        path=str(audio_path),
-        media_type=mime,
-        filename=row["filename"],
-    )
+    return audio_path, row["filename"], audio_stat
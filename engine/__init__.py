@@ -13,7 +13,7 @@ Pure function interface: process_audio(file_path, mode) -> ProcessingResult
 
 __version__ = "2.1.0"
 
-from .core import process_audio
+from .core import process_audio, process_audio_async, process_audio_batch
 from .models import (
     ProcessingMode, 
     ProcessingResult, 
@@ -9,8 +9,13 @@ Rate limit handling:
 - Only marks key as "exhausted" after multiple consecutive 429s (truly exhausted quota)
 """
 
+import io
+import re
 import time
+import heapq
 import logging
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
@@ -23,7 +28,12 @@ logger = logging.getLogger(__name__)
 # Error message markers for classification
 _QUOTA_MARKERS = ["429", "quota", "rate limit", "resource exhausted", "too many requests"]
 _NETWORK_MARKERS = ["broken pipe", "errno 32", "connection", "reset", "timeout"]
-_DAILY_QUOTA_MARKERS = ["per_day", "perday", "daily", "quotaexceeded", "limit: 0"]  # Daily quota exhausted
+
+# Compiled once: one case-insensitive pass over the error text, no lowercased copy
+_QUOTA_RE = re.compile("|".join(map(re.escape, _QUOTA_MARKERS)), re.I)
+_NETWORK_RE = re.compile("|".join(map(re.escape, _NETWORK_MARKERS)), re.I)
+# Daily quota exhausted: per_day / perday, daily, quota exceeded, limit: 0
+_DAILY_QUOTA_RE = re.compile(r"per[ _]*day|daily|quota[ _]*exceeded|limit:[ _]*0(?!\d)", re.I)
 
 # Rate limit configuration
 RATE_LIMIT_WAIT_SECONDS = 15  # Wait time after hitting 429 before retrying same key
@@ -36,6 +46,9 @@ class GeminiClient:
     Supports multiple API keys with round-robin selection.
     On quota errors (429), waits for rate limit window to clear before retrying.
     On network errors, retries with exponential backoff.
+
+    Thread-safe: one client can be shared by concurrent workers, so key
+    rotation and cooldowns apply across all of them.
     """
 
     def __init__(self, api_keys: list[str], model_name: str = "gemini-3-flash-preview"):
@@ -43,12 +56,19 @@ class GeminiClient:
             raise ValueError("At least one API key is required")
         self._keys = api_keys
         self._model_name = model_name
-        self._key_index = 0
         self._exhausted: set[int] = set()
         self._key_cooldowns: dict[int, datetime] = {}  # key_idx -> cooldown_until
+        self._cooldown_heap: list[tuple[datetime, int]] = []  # (cooldown_until, key_idx), soonest first
+        self._ready: deque[int] = deque(range(len(api_keys)))  # Not exhausted, not in cooldown; next key first
         self._key_429_counts: dict[int, int] = {}  # key_idx -> consecutive 429 count
-        self._current_client: Optional[genai.Client] = None
-        self._current_key_idx: Optional[int] = None
+        self._clients: dict[int, genai.Client] = {}  # key_idx -> client, reused across rotations
+        self._lock = threading.RLock()  # Guards all of the key state above
+
+    @property
+    def has_exhausted_keys(self) -> bool:
+        """Whether any key has been taken out of rotation for the day."""
+        with self._lock:
+            return bool(self._exhausted)
 
     def _get_available_key(self) -> tuple[int, str]:
         """Get the next available API key via round-robin.
@@ -56,49 +76,66 @@ class GeminiClient:
         Respects cooldown periods for rate-limited keys.
         Waits if all keys are in cooldown but not exhausted.
         """
-        now = datetime.utcnow()
-        
-        # Clear expired cooldowns
-        expired = [idx for idx, until in self._key_cooldowns.items() if until <= now]
-        for idx in expired:
-            del self._key_cooldowns[idx]
-            self._key_429_counts.pop(idx, None)  # Reset 429 count after cooldown
-        
-        # Get keys that are not exhausted AND not in cooldown
-        available = [
-            (i, k) for i, k in enumerate(self._keys) 
-            if i not in self._exhausted and i not in self._key_cooldowns
-        ]
-        
-        if available:
-            idx = self._key_index % len(available)
-            self._key_index += 1
-            return available[idx]
-        
-        # All keys in cooldown but not exhausted - wait for the soonest one
-        in_cooldown = [
-            (i, k) for i, k in enumerate(self._keys) 
-            if i not in self._exhausted and i in self._key_cooldowns
-        ]
-        
-        if in_cooldown:
-            # Find the key with the soonest cooldown expiry
-            soonest_idx = min(in_cooldown, key=lambda x: self._key_cooldowns[x[0]])[0]
-            wait_time = (self._key_cooldowns[soonest_idx] - now).total_seconds()
-            if wait_time > 0:
-                logger.info(f"⏳ All keys rate-limited. Waiting {wait_time:.0f}s for key {soonest_idx + 1} to become available...")
-                time.sleep(wait_time + 1)  # +1 for safety margin
-            
-            # Remove from cooldown and return
-            del self._key_cooldowns[soonest_idx]
-            self._key_429_counts.pop(soonest_idx, None)
-            return soonest_idx, self._keys[soonest_idx]
-        
-        # All keys truly exhausted (daily quota exceeded)
-        raise Exception(
-            "All API keys exhausted. Wait for quota reset or add more keys."
-        )
+        while True:
+            with self._lock:
+                now = datetime.utcnow()
+
+                # Clear expired cooldowns (soonest first - stop at the first one still running)
+                while (soonest := self._next_cooldown()) is not None and soonest[0] <= now:
+                    self._end_cooldown(soonest[1])
+
+                # Rotate through keys that are not exhausted AND not in cooldown
+                if self._ready:
+                    idx = self._ready[0]
+                    self._ready.rotate(-1)
+                    return idx, self._keys[idx]
+
+                # All keys truly exhausted (daily quota exceeded)
+                if soonest is None:
+                    raise Exception(
+                        "All API keys exhausted. Wait for quota reset or add more keys."
+                    )
+
+                cooldown_until, soonest_idx = soonest
+                wait_time = (cooldown_until - now).total_seconds()
+
+            # All keys in cooldown but not exhausted - wait (without the lock)
+            # for the soonest one, then pick again
+            logger.info(f"⏳ All keys rate-limited. Waiting {wait_time:.0f}s for key {soonest_idx + 1} to become available...")
+            time.sleep(wait_time + 1)  # +1 for safety margin
     
+    def _next_cooldown(self) -> Optional[tuple[datetime, int]]:
+        """(cooldown_until, key_idx) of the soonest active cooldown, dropping stale heap entries."""
+        heap = self._cooldown_heap
+        while heap:
+            until, idx = heap[0]
+            if self._key_cooldowns.get(idx) == until:
+                return heap[0]
+            heapq.heappop(heap)  # Cooldown already ended or key exhausted
+        return None
+
+    def _end_cooldown(self, key_idx: int):
+        """Take a key out of cooldown and put it back in the rotation."""
+        heap = self._cooldown_heap
+        if heap and heap[0][1] == key_idx:
+            heapq.heappop(heap)  # Any other entry for this key goes stale below
+        if self._key_cooldowns.pop(key_idx, None) is None:
+            return  # Not in cooldown (already ended, or exhausted)
+        self._key_429_counts.pop(key_idx, None)  # Reset 429 count after cooldown
+        self._ready.append(key_idx)
+
+    def _remove_from_rotation(self, key_idx: int):
+        with self._lock:
+            try:
+                self._ready.remove(key_idx)
+            except ValueError:
+                pass
+
+    def _clear_429_count(self, key_idx: int):
+        """Reset a key's consecutive 429 count after a successful call."""
+        with self._lock:
+            self._key_429_counts.pop(key_idx, None)
+
     def _handle_rate_limit(self, key_idx: int, error: Exception = None):
         """Handle a 429 rate limit error for a key.
         
@@ -107,70 +144,84 @@ class GeminiClient:
         Otherwise, puts key in cooldown. After MAX_429_BEFORE_EXHAUST consecutive 429s,
         marks the key as truly exhausted.
         """
-        # Daily quota errors: immediately exhaust the key
-        if error and self._is_daily_quota_error(error):
-            logger.warning(f"🚫 Key {key_idx + 1} hit DAILY quota limit — marking exhausted immediately. Error: {str(error)[:120]}")
-            self._exhausted.add(key_idx)
-            self._key_cooldowns.pop(key_idx, None)
-            self._key_429_counts.pop(key_idx, None)
-            return
+        with self._lock:
+            if key_idx in self._exhausted:
+                return  # Another worker already took it out of rotation
+
+            # Daily quota errors: immediately exhaust the key
+            if error and self._is_daily_quota_error(error):
+                logger.warning(f"🚫 Key {key_idx + 1} hit DAILY quota limit — marking exhausted immediately. Error: {str(error)[:120]}")
+                self._exhausted.add(key_idx)
+                self._key_cooldowns.pop(key_idx, None)
+                self._key_429_counts.pop(key_idx, None)
+                self._remove_from_rotation(key_idx)
+                return
         
-        self._key_429_counts[key_idx] = self._key_429_counts.get(key_idx, 0) + 1
-        consecutive_429s = self._key_429_counts[key_idx]
+            self._key_429_counts[key_idx] = self._key_429_counts.get(key_idx, 0) + 1
+            consecutive_429s = self._key_429_counts[key_idx]
         
-        if consecutive_429s >= MAX_429_BEFORE_EXHAUST:
-            logger.warning(f"🚫 Key {key_idx + 1} hit {consecutive_429s} consecutive 429s - marking as exhausted")
-            self._exhausted.add(key_idx)
-            self._key_cooldowns.pop(key_idx, None)
-        else:
-            cooldown_until = datetime.utcnow() + timedelta(seconds=RATE_LIMIT_WAIT_SECONDS)
-            self._key_cooldowns[key_idx] = cooldown_until
-            logger.warning(f"⏸️ Key {key_idx + 1} rate-limited ({consecutive_429s}/{MAX_429_BEFORE_EXHAUST}), cooldown until {cooldown_until.strftime('%H:%M:%S')}")
+            if consecutive_429s >= MAX_429_BEFORE_EXHAUST:
+                logger.warning(f"🚫 Key {key_idx + 1} hit {consecutive_429s} consecutive 429s - marking as exhausted")
+                self._exhausted.add(key_idx)
+                self._key_cooldowns.pop(key_idx, None)
+                self._remove_from_rotation(key_idx)
+            else:
+                cooldown_until = datetime.utcnow() + timedelta(seconds=RATE_LIMIT_WAIT_SECONDS)
+                self._key_cooldowns[key_idx] = cooldown_until
+                heapq.heappush(self._cooldown_heap, (cooldown_until, key_idx))
+                self._remove_from_rotation(key_idx)
+                logger.warning(f"⏸️ Key {key_idx + 1} rate-limited ({consecutive_429s}/{MAX_429_BEFORE_EXHAUST}), cooldown until {cooldown_until.strftime('%H:%M:%S')}")
 
     def _get_client(self, key_idx: int, key: str) -> genai.Client:
         """Get or create a genai.Client for the given key."""
-        if self._current_key_idx != key_idx:
-            self._current_client = genai.Client(api_key=key)
-            self._current_key_idx = key_idx
-        return self._current_client
+        with self._lock:
+            client = self._clients.get(key_idx)
+            if client is None:
+                client = self._clients[key_idx] = genai.Client(api_key=key)
+            return client
 
     @staticmethod
     def _is_quota_error(e: Exception) -> bool:
-        s = str(e).lower()
-        return any(m in s for m in _QUOTA_MARKERS)
+        return _QUOTA_RE.search(str(e)) is not None
     
     @staticmethod
     def _is_daily_quota_error(e: Exception) -> bool:
         """Check if error is specifically a daily quota exhaustion (not per-minute)."""
-        s = str(e).lower().replace(" ", "").replace("_", "")
-        return any(m in s for m in _DAILY_QUOTA_MARKERS)
+        return _DAILY_QUOTA_RE.search(str(e)) is not None
 
     @staticmethod
     def _is_network_error(e: Exception) -> bool:
-        s = str(e).lower()
-        return any(m in s for m in _NETWORK_MARKERS)
+        return _NETWORK_RE.search(str(e)) is not None
 
-    def transcribe(self, audio_path: Path, prompt: str, max_retries: int = 5) -> str:
-        """Transcribe an audio file using Gemini.
+    def transcribe(self, audio: Path | bytes, prompt: str, max_retries: int = 5) -> str:
+        """Transcribe audio using Gemini.
 
-        Uploads the file, sends with the prompt, and returns the transcription text.
-        Handles key rotation and retries automatically.
+        `audio` is a file path or in-memory Ogg/Opus bytes (from
+        probe_and_compress). Uploads it, sends with the prompt, and returns the
+        transcription text. Handles key rotation and retries automatically.
         """
+        if isinstance(audio, bytes):
+            audio_name = f"compressed audio ({len(audio) / (1024 * 1024):.1f} MB)"
+        else:
+            audio_name = audio.name
         last_error = None
+        uploads = {}  # key_idx -> uploaded file; retries on the same key reuse it
 
-        for attempt in range(max_retries):
-            key_idx, key = self._get_available_key()
-            client = self._get_client(key_idx, key)
-
-            try:
-                logger.info(
-                    f"Transcribing {audio_path.name} "
-                    f"(attempt {attempt + 1}/{max_retries}, key {key_idx + 1}/{len(self._keys)})"
-                )
+        try:
+            for attempt in range(max_retries):
+                key_idx, key = self._get_available_key()
+                client = self._get_client(key_idx, key)
 
-                # Upload audio file
-                audio_file = client.files.upload(file=str(audio_path))
                 try:
+                    logger.info(
+                        f"Transcribing {audio_name} "
+                        f"(attempt {attempt + 1}/{max_retries}, key {key_idx + 1}/{len(self._keys)})"
+                    )
+
+                    # Upload audio file (once per key - files belong to the key's project)
+                    audio_file = uploads.get(key_idx)
+                    if audio_file is None:
+                        audio_file = uploads[key_idx] = self._upload(client, audio)
                     response = client.models.generate_content(
                         model=self._model_name,
                         contents=[prompt, audio_file],
@@ -181,29 +232,30 @@ class GeminiClient:
                             max_output_tokens=65536,
                         ),
                     )
-                finally:
-                    # Always clean up the uploaded file
-                    try:
-                        client.files.delete(name=audio_file.name)
-                    except Exception:
-                        pass
 
-                self._validate_response(response)
-                self._key_429_counts.pop(key_idx, None)  # Clear 429 count on success
-                logger.info(f"Transcription complete: {len(response.text)} chars")
-                return response.text
-
-            except Exception as e:
-                last_error = e
-                if self._is_quota_error(e):
-                    self._handle_rate_limit(key_idx, error=e)
-                    continue
-                if self._is_network_error(e):
-                    wait = min(5 * (2 ** attempt), 30)
-                    logger.warning(f"Network error, retrying in {wait}s: {e}")
-                    time.sleep(wait)
-                    continue
-                raise
+                    self._validate_response(response)
+                    self._clear_429_count(key_idx)
+                    logger.info(f"Transcription complete: {len(response.text)} chars")
+                    return response.text
+
+                except Exception as e:
+                    last_error = e
+                    if self._is_quota_error(e):
+                        self._handle_rate_limit(key_idx, error=e)
+                        continue
+                    if self._is_network_error(e):
+                        wait = min(5 * (2 ** attempt), 30)
+                        logger.warning(f"Network error, retrying in {wait}s: {e}")
+                        time.sleep(wait)
+                        continue
+                    raise
+        finally:
+            # Always clean up the uploaded files
+            for key_idx, audio_file in uploads.items():
+                try:
+                    self._clients[key_idx].files.delete(name=audio_file.name)
+                except Exception:
+                    pass
 
         raise Exception(f"Transcription failed after {max_retries} attempts: {last_error}")
 
@@ -238,7 +290,7 @@ class GeminiClient:
                 )
 
                 self._validate_response(response)
-                self._key_429_counts.pop(key_idx, None)  # Clear 429 count on success
+                self._clear_429_count(key_idx)
                 logger.info(f"Structuring complete: {len(response.text)} chars")
                 return response.text
 
@@ -256,6 +308,15 @@ class GeminiClient:
 
         raise Exception(f"Structuring failed after {max_retries} attempts: {last_error}")
 
+    @staticmethod
+    def _upload(client: genai.Client, audio: Path | bytes):
+        """Upload a file path or in-memory Ogg/Opus bytes to the Files API."""
+        if isinstance(audio, bytes):
+            return client.files.upload(
+                file=io.BytesIO(audio), config=types.UploadFileConfig(mime_type="audio/ogg")
+            )
+        return client.files.upload(file=str(audio))
+
     @staticmethod
     def _validate_response(response):
         """Validate a Gemini API response before accessing .text."""
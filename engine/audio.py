@@ -3,8 +3,11 @@ Audio compression and metadata extraction using FFmpeg/ffprobe.
 No database or web framework dependency — pure utility module.
 """
 
+import functools
 import json
 import logging
+import re
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
@@ -12,39 +15,81 @@ from typing import Optional, Tuple
 
 from .models import AudioMetadata
 
+# Optional: read metadata from file headers without spawning ffprobe
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
+# Faster ffprobe JSON decoding (optional - stdlib json also accepts bytes)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Container tags that may carry the recording timestamp, in order of preference
+RECORDED_AT_TAGS = ("creation_time", "date", "IDIT", "DateTimeOriginal")
+
+# ffmpeg's input description on stderr (used by probe_and_compress)
+FFMPEG_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)(?:.*?bitrate: (\d+) kb/s)?")
+FFMPEG_AUDIO_STREAM_RE = re.compile(r"Stream #\d+:\d+.*?: Audio: (\w+)[^,]*, (\d+) Hz, ([^,\n]+)")
+FFMPEG_FORMAT_TAG_RE = re.compile(r"^    (\w+)\s*: (.*)$", re.M)  # Container-level metadata (4-space indent)
+FFMPEG_CHANNEL_LAYOUTS = {"mono": 1, "stereo": 2, "2.1": 3, "quad": 4, "5.0": 5, "5.1": 6, "7.1": 8}
+
+# Inputs at or below this are already speech-grade Opus and aren't re-encoded
+SPEECH_OPUS_SUFFIXES = (".opus", ".ogg")
+SPEECH_OPUS_MAX_KBPS = 64
 
+# mutagen file type -> ffprobe-style codec name (MP4 is resolved from info.codec)
+MUTAGEN_CODECS = {
+    "MP3": "mp3", "OggOpus": "opus", "OggVorbis": "vorbis", "OggFLAC": "flac",
+    "FLAC": "flac", "AAC": "aac", "WavPack": "wavpack",
+}
+# Recording date tags as mutagen names them (MP4, ID3, Vorbis comments)
+MUTAGEN_DATE_TAGS = ("©day", "TDRC", "creation_time", "date", "DATE")
+
+# Resolved once at import so each run doesn't walk PATH again
+FFMPEG_BIN = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE_BIN = shutil.which("ffprobe") or "ffprobe"
+
+
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg() -> bool:
-    """Check if FFmpeg is installed and accessible."""
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if FFmpeg is installed and accessible (looked up once per process)."""
+    return shutil.which("ffmpeg") is not None
 
 
 def get_audio_metadata(file_path: Path) -> AudioMetadata:
-    """Extract comprehensive audio metadata using ffprobe.
+    """Extract comprehensive audio metadata, via mutagen if installed, else ffprobe.
 
     Returns an AudioMetadata dataclass. Fields that can't be extracted
     are left as None.
     """
+    metadata = _get_metadata_mutagen(file_path)
+    if metadata is not None:
+        return metadata
     metadata = AudioMetadata()
 
     try:
         result = subprocess.run(
             [
-                "ffprobe", "-v", "quiet",
+                FFPROBE_BIN, "-v", "quiet",
                 "-print_format", "json",
                 "-show_format", "-show_streams",
                 str(file_path),
             ],
             capture_output=True,
-            text=True,
             check=True,
         )
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)  # Raw bytes - no separate decode pass
 
         # Format-level info
         if "format" in data:
@@ -55,15 +100,7 @@ def get_audio_metadata(file_path: Path) -> AudioMetadata:
                 metadata.bit_rate = int(float(fmt["bit_rate"]) / 1000)
 
             # Try to extract recording timestamp from tags
-            tags = fmt.get("tags", {})
-            for key in ("creation_time", "date", "IDIT", "DateTimeOriginal"):
-                if key in tags:
-                    try:
-                        from dateutil import parser as dateutil_parser
-                        metadata.recorded_at = dateutil_parser.parse(tags[key])
-                        break
-                    except Exception:
-                        pass
+            metadata.recorded_at = _parse_recorded_at(fmt.get("tags", {}))
 
         # Audio stream info
         if "streams" in data:
@@ -83,12 +120,77 @@ def get_audio_metadata(file_path: Path) -> AudioMetadata:
     return metadata
 
 
+def _get_metadata_mutagen(file_path: Path) -> Optional[AudioMetadata]:
+    """Read metadata from the file headers with mutagen.
+
+    Returns None (caller falls back to ffprobe) if mutagen is missing, the
+    format is unknown, or an MP4 has no date tag - its recording time lives
+    in the movie header, which ffprobe reports but mutagen doesn't.
+    """
+    if mutagen is None:
+        return None
+    try:
+        audio = mutagen.File(file_path)
+    except Exception as e:
+        logger.debug(f"mutagen could not read {file_path.name}: {e}")
+        return None
+    if audio is None or audio.info is None:
+        return None
+
+    info = audio.info
+    metadata = AudioMetadata(
+        duration=getattr(info, "length", None) or None,
+        sample_rate=getattr(info, "sample_rate", None) or None,
+        channels=getattr(info, "channels", None) or None,
+    )
+    bitrate = getattr(info, "bitrate", None)
+    if bitrate:
+        metadata.bit_rate = int(bitrate / 1000)
+
+    kind = type(audio).__name__
+    if kind == "MP4":
+        codec = getattr(info, "codec", "") or ""
+        metadata.codec = "aac" if codec.startswith("mp4a") else (codec or None)
+    else:
+        metadata.codec = MUTAGEN_CODECS.get(kind)
+
+    tags = audio.tags or {}
+    for key in MUTAGEN_DATE_TAGS:
+        try:
+            value = tags.get(key)
+        except Exception:
+            value = None
+        if value:
+            if isinstance(value, list):
+                value = value[0]
+            metadata.recorded_at = _parse_recorded_at({"date": str(value)})
+            if metadata.recorded_at:
+                break
+
+    if kind == "MP4" and metadata.recorded_at is None:
+        return None
+    return metadata
+
+
+def _parse_recorded_at(tags: dict):
+    """Recording timestamp from container tags, or None."""
+    if dateutil_parser is None:
+        return None
+    for key in RECORDED_AT_TAGS:
+        if key in tags:
+            try:
+                return dateutil_parser.parse(tags[key])
+            except Exception:
+                pass
+    return None
+
+
 def _get_duration_fallback(file_path: Path) -> Optional[float]:
     """Get just the audio duration as a fallback."""
     try:
         result = subprocess.run(
             [
-                "ffprobe", "-v", "quiet",
+                FFPROBE_BIN, "-v", "quiet",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 str(file_path),
@@ -125,7 +227,7 @@ def compress_audio(
     try:
         subprocess.run(
             [
-                "ffmpeg", "-y", "-i", str(file_path),
+                FFMPEG_BIN, "-y", "-loglevel", "error", "-nostats", "-i", str(file_path),
                 "-vn",             # No video
                 "-c:a", "libopus", # Opus codec
                 "-b:a", bitrate,   # Target bitrate
@@ -133,7 +235,8 @@ def compress_audio(
                 "-ac", "1",        # Mono
                 str(output_path),
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,  # Errors only - read if ffmpeg fails
             check=True,
         )
 
@@ -146,6 +249,101 @@ def compress_audio(
         return output_path, original_size, compressed_size
 
     except subprocess.CalledProcessError as e:
-        logger.warning(f"Compression failed, using original: {e}")
+        detail = (e.stderr or b"").decode("utf-8", errors="replace").strip()[-500:]
+        logger.warning(f"Compression failed, using original: {e} {detail}".rstrip())
         output_path.unlink(missing_ok=True)
         return file_path, original_size, original_size
+
+
+def is_speech_opus(file_path: Path, metadata: AudioMetadata) -> bool:
+    """True if the file is already mono Opus at a speech bitrate (re-encoding gains nothing).
+
+    Sample rate isn't checked: Opus always decodes at 48 kHz, whatever it was
+    recorded at. The bitrate is derived from size/duration if not reported.
+    """
+    if metadata.codec != "opus" or (metadata.channels or 1) > 1:
+        return False
+    bit_rate = metadata.bit_rate
+    if not bit_rate and metadata.duration:
+        bit_rate = file_path.stat().st_size * 8 / 1000 / metadata.duration
+    return bool(bit_rate) and bit_rate <= SPEECH_OPUS_MAX_KBPS
+
+
+def _parse_ffmpeg_input_info(stderr: str) -> AudioMetadata:
+    """Build AudioMetadata from the "Input #0" section ffmpeg prints to stderr."""
+    metadata = AudioMetadata()
+    # Only the input description - the output section has its own streams/tags
+    info = stderr.split("Output #0", 1)[0]
+
+    m = FFMPEG_DURATION_RE.search(info)
+    if m:
+        hours, minutes, seconds, bit_rate = m.groups()
+        metadata.duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        if bit_rate:
+            metadata.bit_rate = int(bit_rate)
+
+    m = FFMPEG_AUDIO_STREAM_RE.search(info)
+    if m:
+        codec, sample_rate, layout = m.groups()
+        metadata.codec = codec
+        metadata.sample_rate = int(sample_rate)
+        layout = layout.split("(", 1)[0].strip()  # "5.1(side)" -> "5.1"
+        if layout in FFMPEG_CHANNEL_LAYOUTS:
+            metadata.channels = FFMPEG_CHANNEL_LAYOUTS[layout]
+        elif layout.split(" ", 1)[0].isdigit():  # e.g. "3 channels"
+            metadata.channels = int(layout.split(" ", 1)[0])
+
+    # Container tags come before the first stream
+    header = info.split("Stream #", 1)[0]
+    tags = dict(FFMPEG_FORMAT_TAG_RE.findall(header))
+    metadata.recorded_at = _parse_recorded_at(tags)
+    return metadata
+
+
+def probe_and_compress(
+    file_path: Path,
+    bitrate: str = "48k",
+) -> Tuple[AudioMetadata, Optional[bytes], float, float]:
+    """Extract metadata and compress to Opus with a single ffmpeg run.
+
+    Metadata is parsed from the input description ffmpeg prints to stderr,
+    so no separate ffprobe process is needed. The Ogg/Opus output is piped
+    back in memory rather than written to a temp file. If compression fails,
+    falls back to ffprobe for metadata and returns None for the audio.
+
+    Returns:
+        Tuple of (metadata, opus_bytes, original_size_mb, compressed_size_mb).
+    """
+    original_size = file_path.stat().st_size / (1024 * 1024)
+
+    try:
+        result = subprocess.run(
+            [
+                # -nostats: stderr keeps the input description we parse, minus progress lines
+                FFMPEG_BIN, "-hide_banner", "-nostats", "-i", str(file_path),
+                "-vn",             # No video
+                "-c:a", "libopus", # Opus codec
+                "-b:a", bitrate,   # Target bitrate
+                "-ar", "16000",    # 16kHz — sufficient for speech
+                "-ac", "1",        # Mono
+                "-f", "ogg", "pipe:1",
+            ],
+            capture_output=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"Compression failed, using original: {e}")
+        return get_audio_metadata(file_path), None, original_size, original_size
+
+    metadata = _parse_ffmpeg_input_info(result.stderr.decode("utf-8", errors="replace"))
+    if metadata.duration is None:
+        metadata.duration = _get_duration_fallback(file_path)
+
+    audio = result.stdout
+    compressed_size = len(audio) / (1024 * 1024)
+    reduction = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
+    logger.info(
+        f"Compressed: {original_size:.2f} MB → {compressed_size:.2f} MB "
+        f"({reduction:.0f}% reduction)"
+    )
+    return metadata, audio, original_size, compressed_size
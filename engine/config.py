@@ -10,6 +10,7 @@ import os
 import sys
 import logging
 import sqlite3
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
 
@@ -27,14 +28,14 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EngineConfig:
-    """Fully environment-driven engine configuration."""
+    """Fully environment-driven engine configuration (immutable once loaded)."""
 
     # Required — directories
     audio_input_dir: Path = field(default_factory=lambda: Path("."))
     obsidian_vault_dir: Path = field(default_factory=lambda: Path("."))
-    gemini_api_keys: list[str] = field(default_factory=list)
+    gemini_api_keys: tuple[str, ...] = ()
 
     # Optional — base subdirectory under vault
     obsidian_note_subdir: str = "VoiceNotes"
@@ -118,20 +119,26 @@ class EngineConfig:
 
     def ensure_directories(self):
         """Create all required directories if they don't exist."""
-        for d in [
-            self.processing_temp_dir, 
-            self.failed_dir, 
-            self.notes_output_dir,
-            self.inbox_dir,
-            self.transcripts_dir,
-            self.tasks_dir,
-            self.daily_dir,
-            self.weekly_dir,
-            self.projects_dir,
-            self.audio_dir,
-        ]:
-            d.mkdir(parents=True, exist_ok=True)
-        self.registry_db_path.parent.mkdir(parents=True, exist_ok=True)
+        # The V2 folders all live directly under notes_output_dir: list it
+        # once and only mkdir the ones that are missing
+        notes_dir = self.notes_output_dir
+        os.makedirs(notes_dir, exist_ok=True)
+        with os.scandir(notes_dir) as it:
+            existing = frozenset(entry.name for entry in it if entry.is_dir())
+        for name in (
+            self.inbox_subdir,
+            self.transcripts_subdir,
+            self.tasks_subdir,
+            self.daily_subdir,
+            self.weekly_subdir,
+            self.projects_subdir,
+            self.audio_subdir,
+        ):
+            if name not in existing:
+                os.makedirs(notes_dir / name, exist_ok=True)
+
+        for d in {self.processing_temp_dir, self.failed_dir, self.registry_db_path.parent}:
+            os.makedirs(d, exist_ok=True)
 
     def validate(self):
         """Validate the configuration at startup."""
@@ -201,7 +208,7 @@ def load_config(env_file: str = ".env") -> EngineConfig:
     config = EngineConfig(
         audio_input_dir=Path(audio_input),
         obsidian_vault_dir=Path(obsidian_vault),
-        gemini_api_keys=keys,
+        gemini_api_keys=tuple(keys),
         obsidian_note_subdir=os.environ.get("OBSIDIAN_NOTE_SUBDIR", "VoiceNotes"),
         processing_temp_dir=Path(
             os.environ.get("PROCESSING_TEMP_DIR", "./data/engine/processing")
@@ -229,9 +236,11 @@ def load_config(env_file: str = ".env") -> EngineConfig:
 # DB-driven settings key → EngineConfig field mapping
 # ============================================================================
 
+# Settings are stored in the DB under their env var names. Unset or empty
+# values fall back to the EngineConfig defaults.
 _SETTINGS_MAP = {
-    "audio_input_dir":      ("LOCAL_SYNC_AUDIO_DIR",   str),
-    "obsidian_vault_dir":   ("OBSIDIAN_VAULT_DIR",     str),
+    "audio_input_dir":      ("LOCAL_SYNC_AUDIO_DIR",   Path),
+    "obsidian_vault_dir":   ("OBSIDIAN_VAULT_DIR",     Path),
     "obsidian_note_subdir": ("OBSIDIAN_NOTE_SUBDIR",   str),
     "default_mode":         ("PROCESSING_MODE",        str),
     "gemini_model":         ("GEMINI_MODEL",           str),
@@ -244,34 +253,66 @@ _SETTINGS_MAP = {
 }
 
 
-def _read_db_settings(db_path: str) -> dict[str, str]:
-    """Read all settings from the V1 app's Settings table (raw SQLite, no ORM)."""
+# One long-lived connection per app DB path - the watcher re-reads settings every scan cycle
+_conn_cache: dict[str, sqlite3.Connection] = {}
+_conn_lock = threading.Lock()
+
+
+def _get_db_conn(db_path: str) -> sqlite3.Connection:
+    """Get the cached autocommit connection to the V1 app database."""
+    with _conn_lock:
+        conn = _conn_cache.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _conn_cache[db_path] = conn
+        return conn
+
+
+def _drop_db_conn(db_path: str):
+    """Close and forget a cached connection (reopened on the next read)."""
+    with _conn_lock:
+        conn = _conn_cache.pop(db_path, None)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _read_db_state(db_path: str) -> tuple[dict[str, str], list[str]]:
+    """Read settings and active API keys from the V1 app's DB (raw SQLite, no ORM).
+
+    Returns (settings, keys); either is empty if it can't be read.
+    """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.execute("SELECT key, value FROM settings")
-        settings = {row[0]: row[1] for row in cursor.fetchall()}
-        conn.close()
-        return settings
+        conn = _get_db_conn(db_path)
     except Exception as e:
-        logger.debug(f"Could not read DB settings: {e}")
-        return {}
+        logger.debug(f"Could not open settings DB: {e}")
+        return {}, []
 
+    settings = {}
+    try:
+        settings = dict(conn.execute("SELECT key, value FROM settings").fetchall())
+    except sqlite3.DatabaseError as e:
+        logger.debug(f"Could not read DB settings: {e}")
+        if not isinstance(e, sqlite3.OperationalError):
+            _drop_db_conn(db_path)
+            return {}, []
 
-def _read_api_keys_from_db(db_path: str) -> list[str]:
-    """Read active API keys from the V1 app's api_keys table."""
+    keys = []
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.execute(
+        rows = conn.execute(
             "SELECT key FROM api_keys WHERE is_active = 1 AND (is_exhausted = 0 OR is_exhausted IS NULL)"
-        )
-        keys = [row[0] for row in cursor.fetchall() if row[0]]
-        conn.close()
+        ).fetchall()
+        keys = [row[0] for row in rows if row[0]]
         if keys:
             logger.info(f"Loaded {len(keys)} API key(s) from database")
-        return keys
-    except Exception as e:
+    except sqlite3.DatabaseError as e:
         logger.debug(f"Could not read API keys from DB: {e}")
-        return []
+
+    return settings, keys
 
 
 def load_config_from_db(db_path: str | None = None) -> EngineConfig:
@@ -295,21 +336,19 @@ def load_config_from_db(db_path: str | None = None) -> EngineConfig:
         else:
             db_path = "./data/voice_notes.db"
 
-    db_settings = _read_db_settings(db_path)
+    db_settings, db_keys = _read_db_state(db_path)
 
-    def _get(env_key: str, db_key: str = None, default: str = "") -> str:
-        """Get value with priority: DB > env > default."""
-        db_val = db_settings.get(db_key or env_key, "")
-        if db_val:
-            return db_val
-        return os.environ.get(env_key, default)
+    # Priority: DB > env, one lookup per field
+    merged = {
+        name: db_settings.get(env_key) or os.environ.get(env_key, "")
+        for name, (env_key, _) in _SETTINGS_MAP.items()
+    }
 
     # --- Required: audio input directory ---
     # CRITICAL: We MUST NOT fall back to a broad directory like /data/gdrive.
     # That would recursively ingest ALL of Google Drive.
     # User MUST configure this explicitly via Settings UI or env var.
-    audio_input = _get("LOCAL_SYNC_AUDIO_DIR")
-    if not audio_input:
+    if not merged["audio_input_dir"]:
         logger.error(
             "❌ FATAL: LOCAL_SYNC_AUDIO_DIR is not configured! "
             "The watcher REFUSES to start without an explicit audio input directory. "
@@ -321,8 +360,7 @@ def load_config_from_db(db_path: str | None = None) -> EngineConfig:
         )
 
     # --- Required: Obsidian vault directory ---
-    obsidian_vault = _get("OBSIDIAN_VAULT_DIR")
-    if not obsidian_vault:
+    if not merged["obsidian_vault_dir"]:
         logger.error(
             "❌ FATAL: OBSIDIAN_VAULT_DIR is not configured! "
             "The watcher REFUSES to start without an explicit Obsidian vault directory. "
@@ -334,7 +372,7 @@ def load_config_from_db(db_path: str | None = None) -> EngineConfig:
         )
 
     # --- API keys: from V1 database (api_keys table) first, then env vars ---
-    keys = _read_api_keys_from_db(db_path)
+    keys = db_keys
     if not keys:
         # Fallback to env vars
         keys_str = os.environ.get("GEMINI_API_KEYS", "")
@@ -347,10 +385,7 @@ def load_config_from_db(db_path: str | None = None) -> EngineConfig:
         logger.warning("No Gemini API keys configured")
 
     config = EngineConfig(
-        audio_input_dir=Path(audio_input),
-        obsidian_vault_dir=Path(obsidian_vault),
-        gemini_api_keys=keys,
-        obsidian_note_subdir=_get("OBSIDIAN_NOTE_SUBDIR", default="VoiceNotes"),
+        gemini_api_keys=tuple(keys),
         processing_temp_dir=Path(
             os.environ.get("PROCESSING_TEMP_DIR", "./data/engine/processing")
         ),
@@ -359,13 +394,11 @@ def load_config_from_db(db_path: str | None = None) -> EngineConfig:
             os.environ.get("REGISTRY_DB_PATH", "./data/engine/registry.db")
         ),
         engine_version=os.environ.get("ENGINE_VERSION", "2.0.0"),
-        default_mode=_get("PROCESSING_MODE", default="personal_note"),
-        gemini_model=_get("GEMINI_MODEL", default=DEFAULT_MODEL),
-        transcription_engine=_get("TRANSCRIPTION_ENGINE", default="gemini"),
-        openai_api_key=_get("OPENAI_API_KEY", default=""),
-        stability_seconds=int(_get("STABILITY_SECONDS", default="10")),
-        scan_interval_seconds=int(_get("SCAN_INTERVAL", default="5")),
-        audio_bitrate=_get("AUDIO_BITRATE", default="48k"),
+        **{
+            name: cast(merged[name])
+            for name, (_, cast) in _SETTINGS_MAP.items()
+            if merged[name]
+        },
     )
 
     config.ensure_directories()
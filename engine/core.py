@@ -14,14 +14,22 @@ Usage:
     print(result.title, result.inbox_path, result.transcript_path)
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from .config import EngineConfig, load_config
 from .models import ProcessingMode, ProcessingResult, NoteStatus
-from .audio import check_ffmpeg, get_audio_metadata, compress_audio
+from .audio import (
+    check_ffmpeg, get_audio_metadata, probe_and_compress,
+    is_speech_opus, SPEECH_OPUS_SUFFIXES,
+)
 from .ai import GeminiClient
 from .prompts import get_transcription_prompt, get_structuring_prompt, get_task_extraction_prompt
 from .titlegen import parse_title_and_content, fallback_title
@@ -29,6 +37,30 @@ from .markdown import save_dual_output, save_note
 
 logger = logging.getLogger(__name__)
 
+# GeminiClients reused across files so their HTTP connections stay warm
+# (GeminiClient is thread-safe). A client with an exhausted key is not reused,
+# so a refreshed key gets retried on the next file, as with a fresh client.
+GEMINI_CLIENT_MAX_AGE_SECONDS = 3600
+_client_cache: dict[tuple, tuple[GeminiClient, float]] = {}  # (keys, model) -> (client, created)
+_client_cache_lock = threading.Lock()
+
+
+def _get_gemini_client(config: EngineConfig) -> GeminiClient:
+    """Get the shared GeminiClient for this config's keys and model."""
+    cache_key = (config.gemini_api_keys, config.gemini_model)
+    now = time.monotonic()
+    with _client_cache_lock:
+        cached = _client_cache.get(cache_key)
+        if (
+            cached is None
+            or now - cached[1] >= GEMINI_CLIENT_MAX_AGE_SECONDS
+            or cached[0].has_exhausted_keys
+        ):
+            cached = _client_cache[cache_key] = (
+                GeminiClient(config.gemini_api_keys, config.gemini_model), now
+            )
+        return cached[0]
+
 
 def process_audio(
     file_path: str | Path,
@@ -36,12 +68,13 @@ def process_audio(
     config: Optional[EngineConfig] = None,
     extract_tasks: bool = True,
     on_step: Optional[callable] = None,
+    gemini_client: Optional[GeminiClient] = None,
 ) -> ProcessingResult:
     """Process an audio file through the complete pipeline.
 
     Pipeline:
-        1. Extract audio metadata (ffprobe)
-        2. Compress to Opus (ffmpeg)
+        1. Extract audio metadata  \
+        2. Compress to Opus        / one ffmpeg run (ffprobe if FFmpeg is missing)
         3. Transcribe with Gemini AI
         4. Generate structured breakdown with Gemini AI
         5. Extract tasks (optional)
@@ -54,6 +87,8 @@ def process_audio(
         config: Engine configuration. If None, loads from environment.
         extract_tasks: Whether to run task extraction (default: True).
         on_step: Optional callback(step_num, step_name) for progress updates.
+        gemini_client: Client to use. If None, the shared client for the
+              config's keys and model is used.
 
     Returns:
         ProcessingResult with all outputs, metadata, and saved note paths.
@@ -72,10 +107,12 @@ def process_audio(
             except Exception:
                 pass
 
+    # One timestamp for the whole run: note filenames and created_at agree
     result = ProcessingResult(
         source_file=file_path.name,
         mode=proc_mode,
         status=NoteStatus.INBOX,
+        created_at=datetime.now(timezone.utc),
     )
 
     try:
@@ -84,10 +121,40 @@ def process_audio(
         logger.info(f"Mode: {proc_mode.value}")
         logger.info(f"{'=' * 60}")
 
-        # ── Step 1: Audio metadata ──────────────────────────────────
+        # ── Steps 1+2: Audio metadata and compression ───────────────
+        # A single ffmpeg run reports the input's metadata while transcoding
+        has_ffmpeg = check_ffmpeg()
         _report_step(1, "Extracting metadata")
         logger.info("Step 1/6 — Extracting audio metadata")
-        result.metadata = get_audio_metadata(file_path)
+        already_compressed = False
+        if has_ffmpeg and file_path.suffix.lower() in SPEECH_OPUS_SUFFIXES:
+            # Probe Opus/Ogg inputs first - speech-grade Opus is used as-is
+            result.metadata = get_audio_metadata(file_path)
+            already_compressed = is_speech_opus(file_path, result.metadata)
+        if already_compressed:
+            _report_step(2, "Compressing audio")
+            logger.info("Step 2/6 — Skipping compression (already speech-optimized Opus)")
+            result.original_size_mb = file_path.stat().st_size / (1024 * 1024)
+            result.compressed_size_mb = result.original_size_mb
+            result.compressed_path = file_path
+            audio_for_ai = file_path
+        elif has_ffmpeg:
+            _report_step(2, "Compressing audio")
+            logger.info("Step 2/6 — Compressing audio (FFmpeg → Opus)")
+            result.metadata, compressed_audio, orig_mb, comp_mb = probe_and_compress(
+                file_path, config.audio_bitrate
+            )
+            result.original_size_mb = orig_mb
+            result.compressed_size_mb = comp_mb
+            if compressed_audio is not None:
+                # Kept in memory: uploaded as-is, written once to the vault
+                result.compressed_audio = compressed_audio
+                audio_for_ai = compressed_audio
+            else:
+                result.compressed_path = file_path
+                audio_for_ai = file_path
+        else:
+            result.metadata = get_audio_metadata(file_path)
         if result.metadata.duration:
             mins = int(result.metadata.duration // 60)
             secs = int(result.metadata.duration % 60)
@@ -97,18 +164,9 @@ def process_audio(
         if result.metadata.recorded_at:
             logger.info(f"  Recorded: {result.metadata.recorded_at}")
 
-        # ── Step 2: Compress ────────────────────────────────────────
-        _report_step(2, "Compressing audio")
-        logger.info("Step 2/6 — Compressing audio (FFmpeg → Opus)")
-        if check_ffmpeg():
-            compressed_path, orig_mb, comp_mb = compress_audio(
-                file_path, config.audio_bitrate
-            )
-            result.original_size_mb = orig_mb
-            result.compressed_size_mb = comp_mb
-            result.compressed_path = compressed_path
-            audio_for_ai = compressed_path
-        else:
+        if not has_ffmpeg:
+            _report_step(2, "Compressing audio")
+            logger.info("Step 2/6 — Compressing audio (FFmpeg → Opus)")
             logger.warning("  FFmpeg not found — using original file")
             result.original_size_mb = file_path.stat().st_size / (1024 * 1024)
             result.compressed_size_mb = result.original_size_mb
@@ -116,7 +174,7 @@ def process_audio(
 
         # ── Step 3: Transcribe ──────────────────────────────────────
         transcription_prompt = get_transcription_prompt()
-        gemini_client = GeminiClient(config.gemini_api_keys, config.gemini_model)
+        gemini_client = gemini_client or _get_gemini_client(config)
 
         if config.transcription_engine in ("whisper-1", "gpt-4o-transcribe"):
             _report_step(3, f"Transcribing (OpenAI {config.transcription_engine})")
@@ -184,32 +242,29 @@ def process_audio(
 
         # ── Save compressed audio to vault Audio folder ─────────────
         audio_stored_path = None
-        if result.compressed_path and result.compressed_path.exists():
+        if result.compressed_audio is not None or (result.compressed_path and result.compressed_path.exists()):
             try:
                 audio_dest_dir = config.audio_dir
                 audio_dest_dir.mkdir(parents=True, exist_ok=True)
-                audio_filename = result.compressed_path.name
+                source = result.compressed_path or file_path.with_suffix(".opus")
+                audio_filename = source.name
                 # Use the same stem as the inbox note for consistency
                 if result.inbox_path:
-                    audio_filename = result.inbox_path.stem + result.compressed_path.suffix
+                    audio_filename = result.inbox_path.stem + source.suffix
                 audio_dest = audio_dest_dir / audio_filename
-                import shutil
-                shutil.copy2(str(result.compressed_path), str(audio_dest))
+                if result.compressed_audio is not None:
+                    audio_dest.write_bytes(result.compressed_audio)
+                else:
+                    import shutil
+                    shutil.copy2(str(result.compressed_path), str(audio_dest))
                 audio_stored_path = audio_dest
                 result.audio_path = audio_dest
                 logger.info(f"  Audio saved: {audio_dest}")
             except Exception as e:
                 logger.warning(f"  Failed to save audio: {e}")
 
-        # Cleanup compressed temp file
-        if result.compressed_path and result.compressed_path != file_path:
-            try:
-                result.compressed_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-
         result.success = True
-        result.processed_at = datetime.utcnow()
+        result.processed_at = datetime.now(timezone.utc)
 
         logger.info(f"{'=' * 60}")
         logger.info(f"✅ Done: {file_path.name}")
@@ -224,12 +279,66 @@ def process_audio(
     except Exception as e:
         result.error = str(e)
         logger.error(f"❌ Pipeline failed: {file_path.name} — {e}", exc_info=True)
+        raise
 
-        # Cleanup compressed temp
-        if result.compressed_path and result.compressed_path != file_path:
-            try:
-                result.compressed_path.unlink(missing_ok=True)
-            except Exception:
-                pass
 
-        raise
+async def process_audio_async(
+    file_path: str | Path,
+    mode: str = "personal_note",
+    config: Optional[EngineConfig] = None,
+    extract_tasks: bool = True,
+    on_step: Optional[callable] = None,
+    gemini_client: Optional[GeminiClient] = None,
+) -> ProcessingResult:
+    """Async version of process_audio for use inside an event loop.
+
+    The pipeline runs in a worker thread so ffmpeg and the AI calls never
+    block the loop; several files can be awaited together with asyncio.gather.
+    """
+    return await asyncio.to_thread(
+        process_audio, file_path, mode, config, extract_tasks,
+        on_step=on_step, gemini_client=gemini_client,
+    )
+
+
+def process_audio_batch(
+    file_paths: Iterable[str | Path],
+    mode: str = "personal_note",
+    config: Optional[EngineConfig] = None,
+    extract_tasks: bool = True,
+    max_workers: Optional[int] = None,
+) -> Iterator[ProcessingResult]:
+    """Process several audio files concurrently, yielding results as they finish.
+
+    Each file spends most of its time waiting on ffmpeg or the AI APIs, so
+    files run in a thread pool (default: half the CPUs). All workers share
+    one GeminiClient, so key rotation and rate-limit cooldowns apply across
+    the whole batch.
+
+    A file that fails yields a ProcessingResult with success=False and error
+    set instead of stopping the batch.
+    """
+    file_paths = [Path(p) for p in file_paths]
+    if not file_paths:
+        return
+    config = config or load_config()
+    gemini_client = _get_gemini_client(config)
+    max_workers = max_workers or min(len(file_paths), max(1, (os.cpu_count() or 2) // 2))
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="process-audio") as executor:
+        futures = {
+            executor.submit(
+                process_audio, path, mode, config, extract_tasks, gemini_client=gemini_client
+            ): path
+            for path in file_paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield ProcessingResult(
+                    source_file=futures[future].name,
+                    mode=ProcessingMode(mode),
+                    status=NoteStatus.INBOX,
+                    error=str(e),
+                )
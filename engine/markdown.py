@@ -18,6 +18,15 @@ from .titlegen import slugify
 
 logger = logging.getLogger(__name__)
 
+# Filename date format names -> strftime patterns
+FILENAME_DATE_FORMATS: dict[str, str] = {
+    "DD_MM_YY": "%d_%m_%y",
+    "YYYY-MM-DD": "%Y-%m-%d",
+    "MM-DD-YYYY": "%m-%d-%Y",
+    "YYMMDD": "%y%m%d",
+    "YYYY_MM_DD_HH_MM": "%Y_%m_%d_%H_%M",
+}
+
 
 def get_filename_base(result: ProcessingResult, date_format: str = "DD_MM_YY") -> tuple[str, datetime]:
     """Generate the base filename (without extension) in date_slug format.
@@ -36,20 +45,10 @@ def get_filename_base(result: ProcessingResult, date_format: str = "DD_MM_YY") -
     """
     # Prefer the original recording timestamp
     ts = result.metadata.recorded_at or result.created_at
-    if ts is None:
-        ts = datetime.utcnow()
     
     slug = slugify(result.title)
     
-    # Map format names to strftime patterns
-    format_map = {
-        "DD_MM_YY": "%d_%m_%y",
-        "YYYY-MM-DD": "%Y-%m-%d",
-        "MM-DD-YYYY": "%m-%d-%Y",
-        "YYMMDD": "%y%m%d",
-        "YYYY_MM_DD_HH_MM": "%Y_%m_%d_%H_%M",
-    }
-    strftime_fmt = format_map.get(date_format, "%d_%m_%y")
+    strftime_fmt = FILENAME_DATE_FORMATS.get(date_format, "%d_%m_%y")
     
     filename_base = f"{ts.strftime(strftime_fmt)}_{slug}"
     
@@ -74,7 +73,12 @@ def _resolve_path_collision(path: Path) -> Path:
 # TRANSCRIPT OUTPUT (Raw verbatim transcript)
 # =============================================================================
 
-def build_transcript_note(result: ProcessingResult, engine_version: str = "2.0.0", date_format: str = "DD_MM_YY") -> str:
+def build_transcript_note(
+    result: ProcessingResult,
+    engine_version: str = "2.0.0",
+    date_format: str = "DD_MM_YY",
+    filename_info: Optional[tuple[str, datetime]] = None,
+) -> str:
     """Build a minimal transcript-only markdown file.
     
     Format:
@@ -92,7 +96,7 @@ def build_transcript_note(result: ProcessingResult, engine_version: str = "2.0.0
         
         <full verbatim transcript>
     """
-    filename_base, _ = get_filename_base(result, date_format)
+    filename_base, _ = filename_info or get_filename_base(result, date_format)
     
     lines = ["---"]
     lines.append(f"id: {result.id}")
@@ -121,17 +125,19 @@ def save_transcript(
     transcripts_dir: Path,
     engine_version: str = "2.0.0",
     date_format: str = "DD_MM_YY",
+    filename_info: Optional[tuple[str, datetime]] = None,
 ) -> Path:
     """Save the raw transcript to the Transcripts folder.
     
     Returns the path where the transcript was saved.
     """
-    filename_base, _ = get_filename_base(result, date_format)
+    filename_info = filename_info or get_filename_base(result, date_format)
+    filename_base, _ = filename_info
     transcript_path = transcripts_dir / f"{filename_base}.md"
     transcript_path = _resolve_path_collision(transcript_path)
     
     transcripts_dir.mkdir(parents=True, exist_ok=True)
-    content = build_transcript_note(result, engine_version, date_format)
+    content = build_transcript_note(result, engine_version, date_format, filename_info)
     transcript_path.write_text(content, encoding="utf-8")
     
     logger.info(f"Transcript saved: {transcript_path}")
@@ -147,6 +153,7 @@ def build_inbox_note(
     engine_version: str = "2.0.0",
     transcript_path: Optional[Path] = None,
     date_format: str = "DD_MM_YY",
+    filename_info: Optional[tuple[str, datetime]] = None,
 ) -> str:
     """Build a complete Obsidian-compatible structured note for Inbox.
 
@@ -177,7 +184,7 @@ def build_inbox_note(
         
         > **Source**: [[Transcripts/DD_MM_YY_slug|View full transcript]]
     """
-    filename_base, ts = get_filename_base(result, date_format)
+    filename_base, ts = filename_info or get_filename_base(result, date_format)
     
     # Build frontmatter
     lines = ["---"]
@@ -234,17 +241,19 @@ def save_inbox_note(
     engine_version: str = "2.0.0",
     transcript_path: Optional[Path] = None,
     date_format: str = "DD_MM_YY",
+    filename_info: Optional[tuple[str, datetime]] = None,
 ) -> Path:
     """Save the structured note to the Inbox folder.
     
     Returns the path where the note was saved.
     """
-    filename_base, _ = get_filename_base(result, date_format)
+    filename_info = filename_info or get_filename_base(result, date_format)
+    filename_base, _ = filename_info
     inbox_path = inbox_dir / f"{filename_base}.md"
     inbox_path = _resolve_path_collision(inbox_path)
     
     inbox_dir.mkdir(parents=True, exist_ok=True)
-    content = build_inbox_note(result, engine_version, transcript_path, date_format)
+    content = build_inbox_note(result, engine_version, transcript_path, date_format, filename_info)
     inbox_path.write_text(content, encoding="utf-8")
     
     logger.info(f"Note saved: {inbox_path}")
@@ -274,12 +283,19 @@ def save_dual_output(
     Returns:
         Tuple of (transcript_path, inbox_path)
     """
+    # Both files share one name: compute it once for all four writers
+    filename_info = get_filename_base(result, date_format)
+
     # Save transcript first
-    transcript_path = save_transcript(result, transcripts_dir, engine_version, date_format)
+    transcript_path = save_transcript(
+        result, transcripts_dir, engine_version, date_format, filename_info
+    )
     result.transcript_path = transcript_path
     
     # Save inbox note with cross-link
-    inbox_path = save_inbox_note(result, inbox_dir, engine_version, transcript_path, date_format)
+    inbox_path = save_inbox_note(
+        result, inbox_dir, engine_version, transcript_path, date_format, filename_info
+    )
     result.inbox_path = inbox_path
     result.note_path = inbox_path  # For legacy compatibility
     
@@ -5,7 +5,7 @@ No external dependencies — pure Python dataclasses.
 
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Optional
@@ -58,6 +58,7 @@ class ProcessingResult:
     original_size_mb: float = 0.0
     compressed_size_mb: float = 0.0
     compressed_path: Optional[Path] = None
+    compressed_audio: Optional[bytes] = None  # In-memory Ogg/Opus from probe_and_compress
 
     # AI output
     transcript: str = ""
@@ -77,7 +78,7 @@ class ProcessingResult:
     status: NoteStatus = NoteStatus.INBOX
 
     # Timing
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     processed_at: Optional[datetime] = None
 
     # Status
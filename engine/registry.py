@@ -106,17 +106,39 @@ class ProcessingRegistry:
                     updated_at TEXT
                 )
             """)
+            try:
+                conn.execute("ALTER TABLE watcher_status ADD COLUMN ingest_root TEXT")
+            except sqlite3.OperationalError:
+                pass
+            try:
+                conn.execute("ALTER TABLE watcher_status ADD COLUMN ingest_snapshot_at TEXT")
+            except sqlite3.OperationalError:
+                pass
             # Initialize single status row if not exists
             conn.execute("""
                 INSERT OR IGNORE INTO watcher_status (id, state, updated_at)
                 VALUES (1, 'starting', ?)
             """, (datetime.utcnow().isoformat(),))
 
+            # Audio files seen in the input dir on the last scan - lets the
+            # web UI list the ingest folder without walking it itself
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ingest_snapshot (
+                    rel_path TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    size_bytes INTEGER,
+                    modified_at REAL
+                )
+            """)
+
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self.db_path))
         # Enable WAL mode for crash safety and better concurrent access
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
+        # INSERT OR REPLACE must fire delete triggers, so the web app's
+        # note_tags / note_projects indexes drop the replaced row's entries
+        conn.execute("PRAGMA recursive_triggers=ON")
         return conn
 
     @staticmethod
@@ -428,6 +450,25 @@ class ProcessingRegistry:
                     (state, current_file, current_step, files_in_queue, now),
                 )
 
+    def save_ingest_snapshot(self, root: str, entries: Optional[list] = None):
+        """Record the input dir listing from the latest scan.
+
+        entries is a list of (name, rel_path, size_bytes, mtime) tuples, or
+        None when the listing is unchanged and only its timestamp needs a bump.
+        """
+        now = datetime.utcnow().isoformat()
+        with self._connect() as conn:
+            if entries is not None:
+                conn.execute("DELETE FROM ingest_snapshot")
+                conn.executemany(
+                    "INSERT INTO ingest_snapshot (name, rel_path, size_bytes, modified_at) VALUES (?, ?, ?, ?)",
+                    entries,
+                )
+            conn.execute(
+                "UPDATE watcher_status SET ingest_root = ?, ingest_snapshot_at = ? WHERE id = 1",
+                (root, now),
+            )
+
     def get_watcher_status(self) -> dict:
         """Get the current watcher status."""
         with self._connect() as conn:
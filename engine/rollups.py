@@ -13,6 +13,14 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Note frontmatter / heading / checkbox patterns
+TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+MODE_RE = re.compile(r"^mode:\s*(.+)$", re.MULTILINE)
+HAS_TASKS_RE = re.compile(r"^has_tasks:\s*(.+)$", re.MULTILINE)
+DURATION_RE = re.compile(r"^duration_min:\s*(\d+)$", re.MULTILINE)
+CHECKBOX_RE = re.compile(r"- \[[ x]\]")
+CHECKED_RE = re.compile(r"- \[x\]", re.IGNORECASE)
+
 
 # =============================================================================
 # DAILY ROLLUP
@@ -76,19 +84,19 @@ def _find_notes_for_date(inbox_dir: Path, target_date: date) -> list[dict]:
             content = note_path.read_text(encoding="utf-8")
             
             # Extract title (first # heading)
-            title_match = re.search(r"^# (.+)$", content, re.MULTILINE)
+            title_match = TITLE_RE.search(content)
             title = title_match.group(1) if title_match else note_path.stem
             
             # Extract mode from frontmatter
-            mode_match = re.search(r"^mode:\s*(.+)$", content, re.MULTILINE)
+            mode_match = MODE_RE.search(content)
             mode = mode_match.group(1) if mode_match else "unknown"
             
             # Check for tasks
-            has_tasks_match = re.search(r"^has_tasks:\s*(.+)$", content, re.MULTILINE)
+            has_tasks_match = HAS_TASKS_RE.search(content)
             has_tasks = has_tasks_match and has_tasks_match.group(1).lower() == "true"
             
             # Extract duration
-            duration_match = re.search(r"^duration_min:\s*(\d+)$", content, re.MULTILINE)
+            duration_match = DURATION_RE.search(content)
             duration_min = int(duration_match.group(1)) if duration_match else 0
             
             notes.append({
@@ -115,8 +123,8 @@ def _get_task_stats_for_date(tasks_dir: Path, target_date: date) -> dict:
     content = task_file.read_text(encoding="utf-8")
     
     # Count checkboxes
-    total = len(re.findall(r"- \[[ x]\]", content))
-    completed = len(re.findall(r"- \[x\]", content, re.IGNORECASE))
+    total = len(CHECKBOX_RE.findall(content))
+    completed = len(CHECKED_RE.findall(content))
     pending = total - completed
     
     return {"total": total, "completed": completed, "pending": pending}
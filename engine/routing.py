@@ -14,6 +14,15 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Note frontmatter / heading patterns
+TAGS_LINE_RE = re.compile(r"^tags:\s*\[([^\]]*)\]$", re.MULTILINE)
+QUOTED_TAG_RE = re.compile(r'"([^"]+)"')
+TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+STATUS_RE = re.compile(r"^status:\s*(\w+)$", re.MULTILINE)
+HAS_TASKS_RE = re.compile(r"^has_tasks:\s*(.+)$", re.MULTILINE)
+MODE_RE = re.compile(r"^mode:\s*(.+)$", re.MULTILINE)
+RECORDED_RE = re.compile(r"^recorded:\s*(.+)$", re.MULTILINE)
+
 
 # =============================================================================
 # TAG ROUTES CONFIGURATION
@@ -242,10 +251,12 @@ def get_note_tags(note_path: Path) -> list[str]:
     if not note_path.exists():
         return []
     
-    content = note_path.read_text(encoding="utf-8")
-    
-    # Parse tags from frontmatter
-    tags_match = re.search(r"^tags:\s*\[([^\]]*)\]$", content, re.MULTILINE)
+    return _parse_tags(note_path.read_text(encoding="utf-8"))
+
+
+def _parse_tags(content: str) -> list[str]:
+    """Parse the tags list out of a note's frontmatter."""
+    tags_match = TAGS_LINE_RE.search(content)
     if not tags_match:
         return []
     
@@ -254,8 +265,7 @@ def get_note_tags(note_path: Path) -> list[str]:
         return []
     
     # Parse individual tags (quoted strings)
-    tags = re.findall(r'"([^"]+)"', tags_str)
-    return tags
+    return QUOTED_TAG_RE.findall(tags_str)
 
 
 def get_inbox_notes(inbox_dir: Path, status: Optional[str] = None) -> list[dict]:
@@ -278,25 +288,25 @@ def get_inbox_notes(inbox_dir: Path, status: Optional[str] = None) -> list[dict]
             content = note_path.read_text(encoding="utf-8")
             
             # Extract metadata
-            title_match = re.search(r"^# (.+)$", content, re.MULTILINE)
+            title_match = TITLE_RE.search(content)
             title = title_match.group(1) if title_match else note_path.stem
             
-            status_match = re.search(r"^status:\s*(\w+)$", content, re.MULTILINE)
+            status_match = STATUS_RE.search(content)
             note_status = status_match.group(1) if status_match else "inbox"
             
             # Filter by status if specified
             if status and note_status != status:
                 continue
             
-            tags = get_note_tags(note_path)
+            tags = _parse_tags(content)
             
-            has_tasks_match = re.search(r"^has_tasks:\s*(.+)$", content, re.MULTILINE)
+            has_tasks_match = HAS_TASKS_RE.search(content)
             has_tasks = has_tasks_match and has_tasks_match.group(1).lower() == "true"
             
-            mode_match = re.search(r"^mode:\s*(.+)$", content, re.MULTILINE)
+            mode_match = MODE_RE.search(content)
             mode = mode_match.group(1) if mode_match else "unknown"
             
-            recorded_match = re.search(r"^recorded:\s*(.+)$", content, re.MULTILINE)
+            recorded_match = RECORDED_RE.search(content)
             recorded = recorded_match.group(1) if recorded_match else None
             
             notes.append({
@@ -8,6 +8,9 @@ import re
 import unicodedata
 from typing import Tuple
 
+# Runs of anything that isn't allowed in a slug
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
 
 def parse_title_and_content(ai_output: str) -> Tuple[str, str]:
     """Parse the TITLE: line from AI output.
@@ -76,7 +79,7 @@ def slugify(text: str, max_length: int = 60) -> str:
     # Lowercase
     text = text.lower()
     # Replace any non-alphanumeric character with hyphens
-    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = _SLUG_SEPARATOR_RE.sub("-", text)
     # Remove leading/trailing hyphens
     text = text.strip("-")
     # Truncate at word boundary
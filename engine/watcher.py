@@ -9,6 +9,7 @@ Does NOT use filesystem events (unreliable with cloud sync).
 Uses simple polling + size stability for robustness.
 """
 
+import os
 import shutil
 import time
 import logging
@@ -55,6 +56,8 @@ class FolderWatcher:
         self.running = False
         self._file_sizes: dict[Path, int] = {}
         self._file_stable_since: dict[Path, float] = {}
+        self._ingest_entries: list[tuple] = []  # filled by _find_audio_files
+        self._saved_ingest_entries: list[tuple] | None = None
         self._db_path: str | None = None  # set externally for hot-reload
 
     def _reload_config(self):
@@ -148,6 +151,8 @@ class FolderWatcher:
             except Exception as e:
                 logger.error(f"Error checking {file_path.name}: {e}", exc_info=True)
 
+        self._save_ingest_snapshot()
+
         # Update queue count
         queue_size = len(files_to_process)
         if queue_size > 0:
@@ -171,10 +176,47 @@ class FolderWatcher:
         self.registry.update_watcher_status("idle", files_in_queue=0)
 
     def _find_audio_files(self):
-        """Recursively find audio files in the input directory."""
-        for path in self.config.audio_input_dir.rglob("*"):
-            if path.is_file() and path.suffix.lower() in self.config.supported_formats:
-                yield path
+        """Recursively find audio files in the input directory.
+
+        Walks with os.scandir and matches the lowercased name against the
+        suffix tuple, so directories and non-audio files cost no extra stat.
+        Each audio file's size and mtime are kept in self._ingest_entries.
+        """
+        suffixes = tuple(self.config.supported_formats)
+        root = str(self.config.audio_input_dir)
+        self._ingest_entries = []
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                            st = entry.stat()
+                            self._ingest_entries.append(
+                                (entry.name, os.path.relpath(entry.path, root), st.st_size, st.st_mtime)
+                            )
+                            yield Path(entry.path)
+            except OSError:
+                continue
+
+    def _save_ingest_snapshot(self):
+        """Publish this scan's input dir listing to the registry for the web UI.
+
+        Rows are only rewritten when the listing changed; otherwise just the
+        snapshot timestamp is refreshed.
+        """
+        entries = sorted(self._ingest_entries, key=lambda e: e[1])
+        changed = entries != self._saved_ingest_entries
+        try:
+            self.registry.save_ingest_snapshot(
+                str(self.config.audio_input_dir), entries if changed else None
+            )
+            self._saved_ingest_entries = entries
+        except Exception as e:
+            logger.debug(f"Could not save ingest snapshot: {e}")
 
     def _is_stable(self, path: Path) -> bool:
         """Check if file size has been unchanged for stability_seconds.
@@ -12,6 +12,7 @@ Models:
 
 import time
 import logging
+import contextlib
 from pathlib import Path
 
 from openai import OpenAI, APIError, RateLimitError, APIConnectionError
@@ -44,11 +45,12 @@ class OpenAITranscriber:
         self._model = model
         logger.info(f"OpenAI transcriber initialized | model={model}")
 
-    def transcribe(self, audio_path: Path, prompt: str = "", max_retries: int = MAX_RETRIES) -> str:
+    def transcribe(self, audio_path: Path | bytes, prompt: str = "", max_retries: int = MAX_RETRIES) -> str:
         """Transcribe an audio file using OpenAI's audio API.
 
         Args:
-            audio_path: Path to the audio file (mp3, m4a, wav, opus, etc.)
+            audio_path: Path to the audio file (mp3, m4a, wav, opus, etc.),
+                or in-memory Ogg/Opus bytes from probe_and_compress.
             prompt: Optional prompt to guide transcription style/vocabulary.
             max_retries: Maximum number of retry attempts on transient errors.
 
@@ -59,10 +61,16 @@ class OpenAITranscriber:
             ValueError: If the file exceeds the 25MB size limit.
             Exception: If all retries are exhausted.
         """
-        audio_path = Path(audio_path)
+        if isinstance(audio_path, bytes):
+            audio_bytes = audio_path
+            audio_path = Path("audio.ogg")  # Name tells the API the format
+            file_size = len(audio_bytes)
+        else:
+            audio_bytes = None
+            audio_path = Path(audio_path)
+            file_size = audio_path.stat().st_size
 
         # Check file size
-        file_size = audio_path.stat().st_size
         if file_size > MAX_FILE_SIZE_BYTES:
             size_mb = file_size / (1024 * 1024)
             raise ValueError(
@@ -76,7 +84,11 @@ class OpenAITranscriber:
         last_error = None
         for attempt in range(1, max_retries + 1):
             try:
-                with open(audio_path, "rb") as audio_file:
+                if audio_bytes is not None:
+                    audio_source = contextlib.nullcontext((audio_path.name, audio_bytes))
+                else:
+                    audio_source = open(audio_path, "rb")
+                with audio_source as audio_file:
                     response = self._client.audio.transcriptions.create(
                         file=audio_file,
                         model=self._model,
@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# The app modules read these at import: keep them off the real data directory
+_tmp = tempfile.mkdtemp(prefix="voice-to-notes-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_tmp}/voice_notes.db")
+os.environ.setdefault("REGISTRY_DB_PATH", f"{_tmp}/registry.db")
@@ -0,0 +1,180 @@
+"""Tests for GeminiClient's key rotation and cooldown scheduling."""
+
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from engine import ai
+from engine.ai import GeminiClient
+
+
+class FakeClock:
+    """Stands in for ai.datetime (utcnow) and ai.time (sleep advances the clock)."""
+
+    def __init__(self):
+        self.now = datetime(2026, 1, 1, 12, 0, 0)
+        self.sleeps = []
+
+    def utcnow(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ai, "datetime", clock)
+    monkeypatch.setattr(ai, "time", SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def _next_keys(client, n):
+    return [client._get_available_key()[0] for _ in range(n)]
+
+
+def test_round_robin_order(clock):
+    client = GeminiClient(["a", "b", "c"])
+    assert _next_keys(client, 7) == [0, 1, 2, 0, 1, 2, 0]
+    assert client._get_available_key() == (1, "b")
+
+
+def test_rate_limited_key_skipped_until_cooldown_expires(clock):
+    client = GeminiClient(["a", "b", "c"])
+    client._handle_rate_limit(1)
+    assert _next_keys(client, 4) == [0, 2, 0, 2]
+
+    clock.now += timedelta(seconds=ai.RATE_LIMIT_WAIT_SECONDS)
+    assert sorted(_next_keys(client, 3)) == [0, 1, 2]
+    assert client._key_cooldowns == {}
+    assert client._key_429_counts == {}
+    assert clock.sleeps == []
+
+
+def test_all_keys_in_cooldown_waits_for_soonest(clock):
+    client = GeminiClient(["a", "b"])
+    client._handle_rate_limit(1)
+    clock.now += timedelta(seconds=5)
+    client._handle_rate_limit(0)
+
+    idx, key = client._get_available_key()
+    assert (idx, key) == (1, "b")
+    assert len(clock.sleeps) == 1
+    assert clock.sleeps[0] == pytest.approx(ai.RATE_LIMIT_WAIT_SECONDS - 5 + 1)
+    assert 1 not in client._key_cooldowns
+    assert 0 in client._key_cooldowns
+
+
+def test_daily_quota_error_drops_key(clock):
+    client = GeminiClient(["a", "b"])
+    client._handle_rate_limit(0, error=Exception("429 quota exceeded: requests per day"))
+    assert _next_keys(client, 3) == [1, 1, 1]
+    assert client._exhausted == {0}
+
+    client._handle_rate_limit(1, error=Exception("limit: 0 daily"))
+    with pytest.raises(Exception, match="All API keys exhausted"):
+        client._get_available_key()
+
+
+def test_repeated_429s_exhaust_key(clock):
+    client = GeminiClient(["a", "b"])
+    for _ in range(ai.MAX_429_BEFORE_EXHAUST):
+        client._handle_rate_limit(0)
+    clock.now += timedelta(seconds=ai.RATE_LIMIT_WAIT_SECONDS)
+    assert _next_keys(client, 3) == [1, 1, 1]
+    assert client._exhausted == {0}
+
+
+def test_end_cooldown_only_pops_its_own_heap_entry(clock):
+    client = GeminiClient(["a", "b", "c"])
+    client._handle_rate_limit(0)
+    clock.now += timedelta(seconds=1)
+    client._handle_rate_limit(1)
+
+    # Key 1's cooldown is not at the top of the heap
+    client._end_cooldown(1)
+    assert client._next_cooldown() == (client._key_cooldowns[0], 0)
+    assert list(client._ready).count(1) == 1
+
+    # Ending it again is a no-op
+    client._end_cooldown(1)
+    assert list(client._ready).count(1) == 1
+
+
+def _run_threads(target, n):
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Force frequent thread switches
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+class _YieldingDeque(deque):
+    """deque that gives up the GIL mid-update, to widen race windows."""
+
+    def rotate(self, n=1):
+        time.sleep(0)
+        super().rotate(n)
+
+    def append(self, x):
+        time.sleep(0)
+        super().append(x)
+
+
+def test_concurrent_picks_stay_round_robin():
+    client = GeminiClient(["a", "b", "c", "d"])
+    client._ready = _YieldingDeque(client._ready)
+    picks = Counter()
+    picks_lock = threading.Lock()
+
+    def worker(n):
+        local = Counter(client._get_available_key()[0] for _ in range(1000))
+        with picks_lock:
+            picks.update(local)
+
+    _run_threads(worker, 8)
+    # No two workers got the same slot in the rotation
+    assert picks == {0: 2000, 1: 2000, 2: 2000, 3: 2000}
+
+
+def test_concurrent_workers_keep_key_state_consistent(monkeypatch):
+    monkeypatch.setattr(ai, "RATE_LIMIT_WAIT_SECONDS", 0)  # Cooldowns expire on the next pick
+    monkeypatch.setattr(ai, "MAX_429_BEFORE_EXHAUST", 10**9)
+    monkeypatch.setattr(ai, "time", SimpleNamespace(sleep=lambda s: None))
+    client = GeminiClient(["a", "b", "c", "d"])
+    client._ready = _YieldingDeque(client._ready)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(1000):
+                idx, _ = client._get_available_key()
+                if (i + n) % 3 == 0:
+                    client._handle_rate_limit(idx)
+                elif (i + n) % 7 == 0:
+                    client._remove_from_rotation(idx)
+                    client._handle_rate_limit(idx)
+                else:
+                    client._clear_429_count(idx)
+        except Exception as e:
+            errors.append(e)
+
+    _run_threads(worker, 8)
+
+    assert errors == []
+    # Every key is back in the rotation exactly once once the cooldowns expire
+    _next_keys(client, 1)
+    assert sorted(client._ready) == [0, 1, 2, 3]
+    assert client._key_cooldowns == {}
@@ -0,0 +1,37 @@
+"""Tests for the shared GeminiClient cache in engine.core."""
+
+import pytest
+
+from engine import core
+from engine.config import EngineConfig
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(core, "_client_cache", {})
+
+
+def test_client_reused_for_same_keys_and_model():
+    config = EngineConfig(gemini_api_keys=("a", "b"))
+    assert core._get_gemini_client(config) is core._get_gemini_client(config)
+    other = EngineConfig(gemini_api_keys=("a",))
+    assert core._get_gemini_client(other) is not core._get_gemini_client(config)
+
+
+def test_client_with_exhausted_key_is_replaced():
+    config = EngineConfig(gemini_api_keys=("a", "b"))
+    client = core._get_gemini_client(config)
+    client._handle_rate_limit(0, error=Exception("429 quota exceeded per day"))
+
+    fresh = core._get_gemini_client(config)
+    assert fresh is not client
+    assert not fresh.has_exhausted_keys
+    assert core._get_gemini_client(config) is fresh
+
+
+def test_client_rebuilt_after_max_age(monkeypatch):
+    config = EngineConfig(gemini_api_keys=("a",))
+    client = core._get_gemini_client(config)
+    later = core.time.monotonic() + core.GEMINI_CLIENT_MAX_AGE_SECONDS
+    monkeypatch.setattr(core.time, "monotonic", lambda: later)
+    assert core._get_gemini_client(config) is not client
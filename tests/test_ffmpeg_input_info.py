@@ -0,0 +1,138 @@
+"""Tests for parsing the input description ffmpeg prints to stderr."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from engine.audio import _parse_ffmpeg_input_info
+
+# Output of `ffmpeg -hide_banner -nostats -i <file> ... -f ogg pipe:1` (ffmpeg 6.x)
+M4A_VOICE_MEMO = """\
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'New Recording 12.m4a':
+  Metadata:
+    major_brand     : M4A 
+    minor_version   : 0
+    compatible_brands: M4A isommp42
+    creation_time   : 2025-01-25T14:30:12.000000Z
+    title           : New Recording 12
+    encoder         : com.apple.VoiceMemos (iPhone Version 17.2 (Build 21C62))
+  Duration: 00:02:05.34, start: 0.000000, bitrate: 68 kb/s
+  Stream #0:0[0x1](und): Audio: aac (LC) (mp4a / 0x6134706D), 48000 Hz, mono, fltp, 64 kb/s (default)
+      Metadata:
+        creation_time   : 2025-01-26T09:00:00.000000Z
+        handler_name    : Core Media Audio
+        vendor_id       : [0][0][0][0]
+Stream mapping:
+  Stream #0:0 -> #0:0 (aac (native) -> opus (libopus))
+Output #0, ogg, to 'pipe:1':
+  Metadata:
+    major_brand     : M4A 
+    creation_time   : 2020-01-01T00:00:00.000000Z
+    encoder         : Lavf60.16.100
+  Stream #0:0(und): Audio: opus, 16000 Hz, mono, flt, 48 kb/s (default)
+      Metadata:
+        encoder         : Lavc60.31.102 libopus
+"""
+
+OPUS_MONO = """\
+Input #0, ogg, from 'memo.opus':
+  Duration: 00:00:42.50, start: 0.007500, bitrate: 33 kb/s
+  Stream #0:0: Audio: opus, 48000 Hz, mono, fltp
+    Metadata:
+      ENCODER         : Recorder 1.4
+Stream mapping:
+  Stream #0:0 -> #0:0 (opus (native) -> opus (libopus))
+Output #0, ogg, to 'pipe:1':
+  Stream #0:0: Audio: opus, 16000 Hz, mono, flt, 48 kb/s
+"""
+
+OPUS_STEREO = """\
+Input #0, ogg, from 'music.opus':
+  Duration: 00:00:10.01, start: 0.007500, bitrate: 97 kb/s
+  Stream #0:0: Audio: opus, 48000 Hz, stereo, fltp
+    Metadata:
+      ENCODER         : opusenc from opus-tools 0.2
+Stream mapping:
+  Stream #0:0 -> #0:0 (opus (native) -> opus (libopus))
+Output #0, ogg, to 'pipe:1':
+  Stream #0:0: Audio: opus, 16000 Hz, mono, flt, 48 kb/s
+"""
+
+MP3 = """\
+Input #0, mp3, from 'interview.mp3':
+  Metadata:
+    title           : Interview
+    date            : 2024-06-01 10:15
+    encoder         : Lavf58.76.100
+  Duration: 01:03:00.05, start: 0.025057, bitrate: 128 kb/s
+  Stream #0:0: Audio: mp3, 44100 Hz, stereo, fltp, 128 kb/s
+  Stream #0:1: Video: mjpeg (Baseline), yuvj420p(pc, bt470bg/unknown/unknown), 500x500, 90k tbr, 90k tbn (attached pic)
+Stream mapping:
+  Stream #0:0 -> #0:0 (mp3 (mp3float) -> opus (libopus))
+Output #0, ogg, to 'pipe:1':
+  Stream #0:0: Audio: opus, 16000 Hz, mono, flt, 48 kb/s
+"""
+
+# Duration and bitrate unknown: streamed WebM from a browser recorder
+WEBM_NO_BITRATE = """\
+Input #0, matroska,webm, from 'recording.webm':
+  Metadata:
+    encoder         : Chrome
+  Duration: N/A, start: 0.000000, bitrate: N/A
+  Stream #0:0(eng): Audio: opus, 48000 Hz, mono, fltp (default)
+Stream mapping:
+  Stream #0:0 -> #0:0 (opus (native) -> opus (libopus))
+Output #0, ogg, to 'pipe:1':
+  Stream #0:0(eng): Audio: opus, 16000 Hz, mono, flt, 48 kb/s (default)
+"""
+
+WAV_KNOWN_DURATION_NO_BITRATE = """\
+Input #0, wav, from 'take.wav':
+  Duration: 00:00:03.00, bitrate: N/A
+  Stream #0:0: Audio: pcm_s24le ([1][0][0][0] / 0x0001), 96000 Hz, 5.1(side), s32 (24 bit), 13824 kb/s
+Output #0, ogg, to 'pipe:1':
+  Stream #0:0: Audio: opus, 16000 Hz, mono, flt, 48 kb/s
+"""
+
+
+@pytest.mark.parametrize("stderr, expected", [
+    (M4A_VOICE_MEMO, dict(
+        duration=125.34, bit_rate=68, codec="aac", sample_rate=48000, channels=1,
+        recorded_at=datetime(2025, 1, 25, 14, 30, 12, tzinfo=timezone.utc),
+    )),
+    (OPUS_MONO, dict(
+        duration=42.5, bit_rate=33, codec="opus", sample_rate=48000, channels=1, recorded_at=None,
+    )),
+    (OPUS_STEREO, dict(
+        duration=10.01, bit_rate=97, codec="opus", sample_rate=48000, channels=2, recorded_at=None,
+    )),
+    (MP3, dict(
+        duration=3780.05, bit_rate=128, codec="mp3", sample_rate=44100, channels=2,
+        recorded_at=datetime(2024, 6, 1, 10, 15),
+    )),
+    (WEBM_NO_BITRATE, dict(
+        duration=None, bit_rate=None, codec="opus", sample_rate=48000, channels=1, recorded_at=None,
+    )),
+    (WAV_KNOWN_DURATION_NO_BITRATE, dict(
+        duration=3.0, bit_rate=None, codec="pcm_s24le", sample_rate=96000, channels=6, recorded_at=None,
+    )),
+], ids=["m4a", "opus-mono", "opus-stereo", "mp3", "webm-no-bitrate", "wav-no-bitrate"])
+def test_parse_input_info(stderr, expected):
+    metadata = _parse_ffmpeg_input_info(stderr)
+    actual = {field: getattr(metadata, field) for field in expected}
+    if expected["duration"] is not None:
+        assert actual.pop("duration") == pytest.approx(expected.pop("duration"))
+    assert actual == expected
+
+
+def test_output_section_is_ignored():
+    # Only the output has a stream and a creation_time: nothing comes from it
+    stderr = M4A_VOICE_MEMO.split("  Duration:", 1)[0].replace("creation_time", "other_time") + (
+        "Output #0, ogg, to 'pipe:1':\n"
+        "  Metadata:\n"
+        "    creation_time   : 2020-01-01T00:00:00.000000Z\n"
+        "  Stream #0:0: Audio: opus, 16000 Hz, mono, flt, 48 kb/s\n"
+    )
+    metadata = _parse_ffmpeg_input_info(stderr)
+    assert metadata.codec is None
+    assert metadata.recorded_at is None
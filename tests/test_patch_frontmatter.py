@@ -0,0 +1,112 @@
+"""Tests for _patch_frontmatter, which rewrites note frontmatter in the vault."""
+
+import os
+
+import pytest
+
+from app import v2_routes
+from app.v2_routes import _patch_frontmatter
+
+NOTE = (
+    "---\n"
+    "id: 1\n"
+    'tags: ["old"]\n'
+    "status: inbox\n"
+    "---\n"
+    "\n"
+    "# Title\n"
+    "\n"
+    "Body text with tags: in it\n"
+)
+
+
+def _write(tmp_path, text, name="note.md"):
+    path = tmp_path / name
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def _leftovers(tmp_path):
+    return sorted(p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp"))
+
+
+def test_replaces_existing_key(tmp_path):
+    path = _write(tmp_path, NOTE)
+    assert _patch_frontmatter(path, "tags", 'tags: ["a", "b"]') is True
+    assert path.read_text() == NOTE.replace('tags: ["old"]', 'tags: ["a", "b"]')
+    assert _leftovers(tmp_path) == []
+
+
+def test_inserts_missing_key_after_anchor(tmp_path):
+    path = _write(tmp_path, NOTE)
+    assert _patch_frontmatter(path, "projects", 'projects: ["P"]', insert_after="tags") is True
+    assert path.read_text() == NOTE.replace('tags: ["old"]\n', 'tags: ["old"]\nprojects: ["P"]\n')
+
+
+def test_missing_key_without_anchor_leaves_file_alone(tmp_path):
+    path = _write(tmp_path, NOTE)
+    assert _patch_frontmatter(path, "projects", 'projects: ["P"]') is False
+    assert _patch_frontmatter(path, "projects", 'projects: ["P"]', insert_after="nope") is False
+    assert path.read_text() == NOTE
+
+
+def test_keeps_crlf_line_endings_and_file_mode(tmp_path):
+    path = _write(tmp_path, NOTE.replace("\n", "\r\n"))
+    os.chmod(path, 0o640)
+    assert _patch_frontmatter(path, "tags", "tags: []") is True
+    assert path.read_bytes() == NOTE.replace('tags: ["old"]', "tags: []").replace("\n", "\r\n").encode()
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.parametrize("text", [
+    "# No frontmatter\n\ntags: here\n",
+    "---\ntags: []\nno closing fence\n",
+    "",
+])
+def test_note_without_frontmatter_is_untouched(tmp_path, text):
+    path = _write(tmp_path, text)
+    assert _patch_frontmatter(path, "tags", "tags: [\"a\"]") is False
+    assert path.read_text() == text
+
+
+def test_frontmatter_over_cap_is_untouched(tmp_path):
+    filler = "x" * 100 + "\n"
+    count = v2_routes.FRONTMATTER_MAX_BYTES // len(filler) + 1
+    text = "---\ntags: []\n" + "notes: " + filler * count + "---\nbody\n"
+    path = _write(tmp_path, text)
+    assert _patch_frontmatter(path, "tags", 'tags: ["a"]') is False
+    assert path.read_text() == text
+
+
+def test_large_body_is_copied_intact(tmp_path):
+    body = "".join(f"line {i}\n" for i in range(200_000))
+    path = _write(tmp_path, NOTE + body)
+    assert _patch_frontmatter(path, "status", "status: archived") is True
+    assert path.read_text() == NOTE.replace("status: inbox", "status: archived") + body
+
+
+@pytest.mark.parametrize("target", ["copyfileobj", "copymode"])
+def test_failed_write_keeps_original_and_cleans_up(tmp_path, monkeypatch, target):
+    path = _write(tmp_path, NOTE)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(v2_routes.shutil, target, fail)
+    with pytest.raises(OSError, match="disk full"):
+        _patch_frontmatter(path, "tags", 'tags: ["a"]')
+    assert path.read_text() == NOTE
+    assert _leftovers(tmp_path) == []
+
+
+def test_failed_replace_keeps_original_and_cleans_up(tmp_path, monkeypatch):
+    path = _write(tmp_path, NOTE)
+
+    def fail(src, dst):
+        raise PermissionError("read-only vault")
+
+    monkeypatch.setattr(v2_routes.os, "replace", fail)
+    with pytest.raises(PermissionError):
+        _patch_frontmatter(path, "tags", 'tags: ["a"]')
+    assert path.read_text() == NOTE
+    assert _leftovers(tmp_path) == []
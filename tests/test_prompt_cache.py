@@ -0,0 +1,76 @@
+"""Tests for APIKeyManager.get_prompt_cache error handling."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from google.genai import errors as genai_errors
+
+from app.api_keys import APIKeyManager
+
+
+class FakeCaches:
+    def __init__(self, error=None):
+        self.error = error
+        self.creates = 0
+
+    def create(self, model, config):
+        self.creates += 1
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(name=f"cachedContents/{self.creates}")
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(APIKeyManager, "_prompt_caches", {})
+    monkeypatch.setattr(APIKeyManager, "_uncacheable_prompts", set())
+    return APIKeyManager(db=None)
+
+
+def _get(manager, caches):
+    client = SimpleNamespace(caches=caches)
+    key = SimpleNamespace(id=1, name="k")
+    return manager.get_prompt_cache(client, key, "model", "breakdown", "prompt")
+
+
+def _api_error(cls, code, message):
+    return cls(code, {"error": {"code": code, "message": message, "status": "X"}})
+
+
+@pytest.mark.parametrize("error", [
+    ConnectionResetError("Connection reset by peer"),
+    TimeoutError("timed out"),
+    httpx.ReadTimeout("read timed out"),
+    _api_error(genai_errors.ServerError, 503, "The service is currently unavailable"),
+    _api_error(genai_errors.ClientError, 429, "Resource has been exhausted"),
+    _api_error(genai_errors.ClientError, 403, "Permission denied"),
+])
+def test_transient_errors_do_not_disable_caching(manager, error):
+    caches = FakeCaches(error)
+    assert _get(manager, caches) is None
+    assert manager._uncacheable_prompts == set()
+
+    caches.error = None
+    assert _get(manager, caches) == "cachedContents/2"
+
+
+@pytest.mark.parametrize("error", [
+    _api_error(genai_errors.ClientError, 400, "Cached content is too small"),
+    _api_error(genai_errors.ClientError, 404, "Model does not support caching"),
+])
+def test_definitive_client_errors_mark_prompt_uncacheable(manager, error):
+    caches = FakeCaches(error)
+    assert _get(manager, caches) is None
+    assert manager._uncacheable_prompts == {("model", "breakdown")}
+
+    caches.error = None
+    assert _get(manager, caches) is None
+    assert caches.creates == 1
+
+
+def test_created_cache_is_reused(manager):
+    caches = FakeCaches()
+    assert _get(manager, caches) == "cachedContents/1"
+    assert _get(manager, caches) == "cachedContents/1"
+    assert caches.creates == 1
@@ -0,0 +1,87 @@
+"""Tests for the recording_tags index of the V1 Recording.tags column."""
+
+import asyncio
+
+import pytest
+
+from app import v2_routes
+from app.database import Base, Recording, RecordingTag, SessionLocal, engine, split_tags
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+    with engine.begin() as conn:
+        conn.execute(Recording.__table__.delete())
+        conn.execute(RecordingTag.__table__.delete())
+
+
+def _tag_rows(db):
+    return sorted(
+        (r.recording_id, r.name)
+        for r in db.query(RecordingTag.recording_id, RecordingTag.name).all()
+    )
+
+
+def _search(db, q):
+    return asyncio.run(v2_routes.api_get_tags(q=q, db=db))
+
+
+@pytest.mark.parametrize("tags, expected", [
+    (None, []),
+    ("", []),
+    (" , ,", []),
+    ("work", ["work"]),
+    ("work, home ,work,,ideas", ["work", "home", "ideas"]),
+])
+def test_split_tags(tags, expected):
+    assert split_tags(tags) == expected
+
+
+def test_listeners_sync_on_insert_update_delete(db):
+    rec = Recording(original_filename="a.m4a", tags="work, home")
+    other = Recording(original_filename="b.m4a", tags="work")
+    db.add_all([rec, other])
+    db.commit()
+    assert _tag_rows(db) == sorted([(rec.id, "work"), (rec.id, "home"), (other.id, "work")])
+
+    rec.tags = "home, ideas"
+    db.commit()
+    assert _tag_rows(db) == sorted([(rec.id, "home"), (rec.id, "ideas"), (other.id, "work")])
+
+    # Writes that don't touch tags leave the index alone
+    rec.title = "Renamed"
+    db.commit()
+    assert _tag_rows(db) == sorted([(rec.id, "home"), (rec.id, "ideas"), (other.id, "work")])
+
+    rec.tags = None
+    db.commit()
+    assert _tag_rows(db) == [(other.id, "work")]
+
+    db.delete(other)
+    db.commit()
+    assert _tag_rows(db) == []
+
+
+def test_tag_search_is_distinct_sorted_and_limited(db):
+    db.add_all([
+        Recording(original_filename="a.m4a", tags="work, homework"),
+        Recording(original_filename="b.m4a", tags="work, ideas"),
+        Recording(original_filename="c.m4a", tags=",".join(f"t{i:02d}" for i in range(15))),
+    ])
+    db.commit()
+    assert _search(db, "work") == ["homework", "work"]
+    assert _search(db, "WORK") == ["homework", "work"]  # LIKE is case-insensitive
+    assert _search(db, "t") == [f"t{i:02d}" for i in range(10)]
+    assert _search(db, "nothing") == []
+
+
+def test_tag_search_escapes_like_wildcards(db):
+    db.add(Recording(original_filename="a.m4a", tags="100%, a_b, axb, c\\d, cxd"))
+    db.commit()
+    assert _search(db, "%") == ["100%"]
+    assert _search(db, "_") == ["a_b"]
+    assert _search(db, "\\") == ["c\\d"]
@@ -0,0 +1,99 @@
+"""Tests for the note_tags / note_projects inverted indexes on the registry."""
+
+import sqlite3
+
+import pytest
+
+from app import v2_routes
+from engine.registry import ProcessingRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    path = tmp_path / "registry.db"
+    reg = ProcessingRegistry(path)
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    v2_routes._ensure_registry_schema(conn, path)
+    yield reg, conn
+    conn.close()
+
+
+def _record(reg, file_hash):
+    reg.record_success(
+        filename=f"{file_hash}.m4a", file_hash=file_hash, file_size=1,
+        mode="idea", title="t", note_path="n.md",
+    )
+
+
+def _counts(conn, table, field):
+    sql = v2_routes._LIST_COUNTS_SQL.format(table=table, field=field)
+    return dict(conn.execute(sql).fetchall())
+
+
+def _rows(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_update_and_delete_keep_index_in_sync(registry):
+    reg, conn = registry
+    _record(reg, "h1")
+    _record(reg, "h2")
+    conn.execute("""UPDATE processed_files SET tags = '["a", "b"]' WHERE file_hash = 'h1'""")
+    conn.execute("""UPDATE processed_files SET tags = '["a"]', projects = '["P"]' WHERE file_hash = 'h2'""")
+    assert _counts(conn, "note_tags", "tag") == {"a": 2, "b": 1}
+    assert _counts(conn, "note_projects", "project") == {"P": 1}
+
+    conn.execute("""UPDATE processed_files SET tags = 'not json' WHERE file_hash = 'h1'""")
+    assert _counts(conn, "note_tags", "tag") == {"a": 1}
+
+    conn.execute("DELETE FROM processed_files WHERE file_hash = 'h2'")
+    assert _rows(conn, "note_tags") == 0
+    assert _rows(conn, "note_projects") == 0
+
+
+def test_replace_by_engine_leaves_no_orphans(registry):
+    reg, conn = registry
+    _record(reg, "h1")
+    conn.execute("""UPDATE processed_files SET tags = '["a"]', projects = '["P"]' WHERE file_hash = 'h1'""")
+    assert _rows(conn, "note_tags") == 1
+
+    # Reprocessing the same file REPLACEs its row under a new id
+    _record(reg, "h1")
+    assert _rows(conn, "note_tags") == 0
+    assert _rows(conn, "note_projects") == 0
+    assert _counts(conn, "note_tags", "tag") == {}
+
+
+def test_replace_with_tags_reindexes_new_row(registry):
+    reg, conn = registry
+    _record(reg, "h1")
+    conn.execute("""UPDATE processed_files SET tags = '["a"]' WHERE file_hash = 'h1'""")
+    conn.execute("PRAGMA recursive_triggers=ON")
+    conn.execute(
+        "INSERT OR REPLACE INTO processed_files (filename, file_hash, processed_at, tags) "
+        """VALUES ('h1.m4a', 'h1', '2026-01-01', '["b"]')"""
+    )
+    new_id = conn.execute("SELECT id FROM processed_files WHERE file_hash = 'h1'").fetchone()[0]
+    assert conn.execute("SELECT note_id, tag FROM note_tags").fetchall() == [(new_id, "b")]
+
+
+def test_migration_drops_orphans_left_by_old_writers(tmp_path):
+    path = tmp_path / "registry.db"
+    reg = ProcessingRegistry(path)
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    v2_routes._ensure_registry_schema(conn, path)
+    _record(reg, "h1")
+    conn.execute("""UPDATE processed_files SET tags = '["a"]' WHERE file_hash = 'h1'""")
+
+    # A writer without recursive_triggers: REPLACE skips the delete trigger
+    conn.execute(
+        "INSERT OR REPLACE INTO processed_files (filename, file_hash, processed_at) "
+        "VALUES ('h1.m4a', 'h1', '2026-01-01')"
+    )
+    assert _rows(conn, "note_tags") == 1
+    assert _counts(conn, "note_tags", "tag") == {}
+
+    v2_routes._registry_ready.discard(str(path))
+    v2_routes._ensure_registry_schema(conn, path)
+    assert _rows(conn, "note_tags") == 0
+    conn.close()